@@ -0,0 +1,35 @@
+from esmerald import CORSConfig, Esmerald, Gateway, Include, get
+
+
+@get()
+async def products() -> str:
+    return "products"
+
+
+@get()
+async def orders() -> str:
+    return "orders"
+
+
+@get()
+async def status() -> str:
+    return "ok"
+
+
+app = Esmerald(
+    routes=[
+        Gateway("/status", handler=status, cors_config=CORSConfig(allow_origins=["*"])),
+        Include(
+            "/partners",
+            routes=[
+                Gateway("/products", handler=products),
+                Gateway("/orders", handler=orders),
+            ],
+            cors_config=CORSConfig(
+                allow_origins=["https://*.partner.com"],
+                allow_methods=["GET", "POST"],
+            ),
+        ),
+    ],
+    cors_config=CORSConfig(allow_origins=["https://www.example.com"]),
+)
@@ -0,0 +1,16 @@
+from pathlib import Path
+
+from esmerald import Esmerald, StaticFilesConfig
+from esmerald.staticfiles import HASHED_FILENAME_PATTERN, StaticManifest
+
+static_files_config = StaticFilesConfig(
+    path="/static",
+    directory=Path("static"),
+    precompressed=True,
+    cache_maxsize=256,
+    immutable_pattern=HASHED_FILENAME_PATTERN,
+)
+
+manifest = StaticManifest(path="/static", directory=Path("static"))
+
+app = Esmerald(static_files_config=static_files_config)
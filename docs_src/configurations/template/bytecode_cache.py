@@ -0,0 +1,11 @@
+from pathlib import Path
+
+from esmerald import Esmerald
+from esmerald.config.template import TemplateConfig
+
+template_config = TemplateConfig(
+    directory=Path("templates"),
+    bytecode_cache=Path(".template_cache"),
+)
+
+app = Esmerald(template_config=template_config)
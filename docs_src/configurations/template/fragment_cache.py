@@ -0,0 +1,12 @@
+from pathlib import Path
+
+from esmerald import Esmerald
+from esmerald.config.template import TemplateConfig
+from esmerald.template.cache import FragmentCache
+
+template_config = TemplateConfig(
+    directory=Path("templates"),
+    fragment_cache=FragmentCache(maxsize=512, ttl=600),
+)
+
+app = Esmerald(template_config=template_config)
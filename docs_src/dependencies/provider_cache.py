@@ -0,0 +1,31 @@
+from esmerald import Esmerald, Factory, Gateway, Inject, Injects, get
+
+
+async def get_tenant_client(tenant: str) -> dict:
+    # Expensive call, cached per tenant for 5 minutes.
+    ...
+
+
+class FeatureFlags:
+    ...
+
+
+tenant_client = Inject(get_tenant_client, cache_ttl=300, cache_maxsize=128)
+
+
+@get(
+    "/tenants/{tenant}",
+    dependencies={
+        "client": tenant_client,
+        "flags": Inject(Factory(FeatureFlags, cache_ttl=60)),
+    },
+)
+async def tenant(client: dict = Injects(), flags: FeatureFlags = Injects()) -> dict:
+    return client
+
+
+app = Esmerald(routes=[Gateway(handler=tenant)])
+
+# Drop the cached client of a tenant or every cached client.
+tenant_client.invalidate(tenant="esmerald")
+tenant_client.clear_cache()
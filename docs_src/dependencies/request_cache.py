@@ -0,0 +1,37 @@
+from esmerald import Esmerald, Gateway, Inject, Injects, get
+
+
+async def get_session() -> str:
+    # Runs once per request, even if required by multiple dependencies.
+    return "session"
+
+
+def get_users(session: str) -> str:
+    return f"users with {session}"
+
+
+def get_items(session: str) -> str:
+    return f"items with {session}"
+
+
+def get_request_id() -> str:
+    # Runs every time it is required.
+    ...
+
+
+@get(
+    "/dashboard",
+    dependencies={
+        "users": Inject(get_users),
+        "items": Inject(get_items),
+        "request_id": Inject(get_request_id, use_request_cache=False),
+    },
+)
+async def dashboard(users: str = Injects(), items: str = Injects()) -> dict:
+    return {"users": users, "items": items}
+
+
+app = Esmerald(
+    routes=[Gateway(handler=dashboard)],
+    dependencies={"session": Inject(get_session)},
+)
@@ -0,0 +1,25 @@
+from starlette.middleware import Middleware as StarletteMiddleware
+
+from esmerald import Esmerald, Gateway, get
+from esmerald.config import CompressionConfig
+from esmerald.middleware import CompressionMiddleware
+
+
+@get("/products")
+async def products() -> list:
+    return []
+
+
+@get("/archive", compression=False)
+async def archive() -> bytes:
+    return b""
+
+
+routes = [
+    Gateway(handler=products, compression=CompressionConfig(levels={"br": 9, "gzip": 9})),
+    Gateway(handler=archive),
+]
+
+middleware = [StarletteMiddleware(CompressionMiddleware, minimum_size=1000, levels={"br": 5})]
+
+app = Esmerald(routes=routes, middleware=middleware)
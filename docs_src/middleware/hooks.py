@@ -0,0 +1,31 @@
+import time
+
+from esmerald import Esmerald, Gateway, Request, get
+from esmerald.middleware.basic import HookMiddleware
+from esmerald.responses import JSONResponse
+
+
+class MaintenanceMiddleware(HookMiddleware):
+    async def before_request(self, request: Request):
+        if request.url.path.startswith("/admin"):
+            return JSONResponse({"detail": "Under maintenance"}, status_code=503)
+
+
+class TimingMiddleware(HookMiddleware):
+    async def before_request(self, request: Request):
+        request.state.started_at = time.perf_counter()
+
+    async def after_response(self, request: Request, status_code, headers):
+        elapsed = time.perf_counter() - request.state.started_at
+        headers["server-timing"] = f"app;dur={elapsed * 1000:.1f}"
+
+
+@get("/")
+async def home() -> str:
+    return "home"
+
+
+app = Esmerald(
+    routes=[Gateway(handler=home)],
+    middleware=[TimingMiddleware, MaintenanceMiddleware],
+)
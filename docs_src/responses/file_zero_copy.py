@@ -0,0 +1,14 @@
+from esmerald import Esmerald, Gateway, get
+from esmerald.datastructures import File
+
+
+@get(path="/download")
+def download() -> File:
+    return File(
+        path="/path/to/large/file.iso",
+        filename="file.iso",
+        zero_copy=True,
+    )
+
+
+app = Esmerald(routes=[Gateway(handler=download)])
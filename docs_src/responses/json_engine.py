@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from esmerald import Esmerald, Gateway, get
+from esmerald.encoders import register_encoder
+
+
+class Money:
+    def __init__(self, amount: int, currency: str) -> None:
+        self.amount = amount
+        self.currency = currency
+
+
+register_encoder(Money, lambda value: f"{value.amount} {value.currency}")
+
+
+@get("/invoice")
+async def invoice() -> dict:
+    return {"total": Money(10, "EUR"), "issued_at": datetime.now()}
+
+
+app = Esmerald(routes=[Gateway(handler=invoice)], json_engine="msgspec")
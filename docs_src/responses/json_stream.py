@@ -0,0 +1,25 @@
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+
+from esmerald import Esmerald, Gateway, get
+from esmerald.datastructures import JSONStream
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+async def all_users() -> AsyncIterator[User]:
+    # A database cursor, for instance.
+    for index in range(100_000):
+        yield User(id=index, name=f"user-{index}")
+
+
+@get(path="/users")
+async def users() -> JSONStream:
+    return JSONStream(iterator=all_users(), format="array", flush_items=500)
+
+
+app = Esmerald(routes=[Gateway(handler=users)])
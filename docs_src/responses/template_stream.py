@@ -0,0 +1,13 @@
+from esmerald import Esmerald, Gateway, Template, get
+
+
+@get(path="/report")
+async def report() -> Template:
+    return Template(
+        name="report.html",
+        context={"rows": range(100_000)},
+        stream=True,
+    )
+
+
+app = Esmerald(routes=[Gateway(handler=report)])
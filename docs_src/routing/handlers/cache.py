@@ -0,0 +1,28 @@
+from esmerald import Esmerald, Gateway, Include, get
+from esmerald.cache import MemoryCacheBackend, ResponseCache
+
+
+@get("/products", cache=ResponseCache(ttl=60, query_params=["page"], vary=["accept-language"]))
+async def products(page: int = 1) -> list:
+    return []
+
+
+@get("/categories")
+async def categories() -> list:
+    return []
+
+
+@get("/stock", cache=False)
+async def stock() -> dict:
+    return {"available": 10}
+
+
+app = Esmerald(
+    routes=[
+        Gateway(handler=products),
+        Include(
+            "/catalogue", routes=[Gateway(handler=categories), Gateway(handler=stock)], cache=300
+        ),
+    ],
+    response_cache_backend=MemoryCacheBackend(maxsize=10_000),
+)
@@ -0,0 +1,24 @@
+from esmerald import Esmerald, Gateway, get
+from esmerald.cache import RequestCoalescing
+
+
+@get("/products", coalesce=True, cache=30)
+async def products(page: int = 1) -> list:
+    # The expensive query runs once for all the identical concurrent requests.
+    return []
+
+
+@get("/recommendations")
+async def recommendations() -> list:
+    return []
+
+
+app = Esmerald(
+    routes=[
+        Gateway(handler=products),
+        Gateway(
+            handler=recommendations,
+            coalesce=RequestCoalescing(vary=["accept-language"], timeout=5),
+        ),
+    ]
+)
@@ -0,0 +1,30 @@
+from esmerald import Esmerald, Gateway, Include, Request, get
+
+
+@get("/users/{pk}", etag=True)
+async def user(pk: int) -> dict:
+    return {"pk": pk, "name": "Esmerald"}
+
+
+async def get_article_version(request: Request) -> str:
+    # For instance, the `updated_at` of the article read from a cache.
+    return f"article-{request.path_params['pk']}-v1"
+
+
+@get("/articles/{pk}", etag=get_article_version)
+async def article(pk: int) -> dict:
+    return {"pk": pk}
+
+
+@get("/products")
+async def products() -> list:
+    return []
+
+
+app = Esmerald(
+    routes=[
+        Gateway(handler=user),
+        Gateway(handler=article),
+        Include("/catalogue", routes=[Gateway(handler=products)], etag=True),
+    ]
+)
@@ -11,7 +11,7 @@ from esmerald.injector import Factory, Inject
 from .applications import ChildEsmerald, Esmerald
 from .backgound import BackgroundTask, BackgroundTasks
 from .config import CORSConfig, CSRFConfig, OpenAPIConfig, SessionConfig, StaticFilesConfig
-from .datastructures import JSON, Redirect, Stream, Template, UploadFile
+from .datastructures import JSON, JSONStream, Redirect, Stream, Template, UploadFile
 from .exceptions import (
     HTTPException,
     ImproperlyConfigured,
@@ -79,6 +79,7 @@ __all__ = [
     "ImproperlyConfigured",
     "JSON",
     "JSONResponse",
+    "JSONStream",
     "MethodNotAllowed",
     "MiddlewareProtocol",
     "NotAuthenticated",
@@ -22,12 +22,14 @@ from starlette.middleware import Middleware as StarletteMiddleware  # noqa
 from starlette.types import Lifespan, Receive, Scope, Send
 from typing_extensions import Annotated, Doc
 
+from esmerald.cache import MemoryCacheBackend
 from esmerald.conf import settings as esmerald_settings
 from esmerald.conf.global_settings import EsmeraldAPISettings
 from esmerald.config import CORSConfig, CSRFConfig, SessionConfig
 from esmerald.config.openapi import OpenAPIConfig
 from esmerald.config.static_files import StaticFilesConfig
 from esmerald.datastructures import State
+from esmerald.encoders import JSONEngine, get_json_engine, json_engine_context
 from esmerald.exception_handlers import (
     improperly_configured_exception_handler,
     pydantic_validation_error_handler,
@@ -35,14 +37,15 @@ from esmerald.exception_handlers import (
 )
 from esmerald.exceptions import ImproperlyConfigured, ValidationErrorException
 from esmerald.interceptors.types import Interceptor
-from esmerald.middleware.asyncexitstack import AsyncExitStackMiddleware
-from esmerald.middleware.cors import CORSMiddleware
+from esmerald.middleware.basic import fuse_middleware
+from esmerald.middleware.cors import CORSMiddleware, get_route_policies
 from esmerald.middleware.csrf import CSRFMiddleware
-from esmerald.middleware.exceptions import EsmeraldAPIExceptionMiddleware, ExceptionMiddleware
+from esmerald.middleware.exceptions import EsmeraldAPIExceptionMiddleware, FusedExceptionMiddleware
 from esmerald.middleware.sessions import SessionMiddleware
 from esmerald.middleware.trustedhost import TrustedHostMiddleware
 from esmerald.permissions.types import Permission
 from esmerald.pluggables import Extension, Pluggable
+from esmerald.protocols.cache import CacheBackendProtocol
 from esmerald.protocols.template import TemplateEngineProtocol
 from esmerald.routing import gateways
 from esmerald.routing.apis import base
@@ -104,11 +107,14 @@ class Esmerald(Starlette):
         "dependencies",
         "deprecated",
         "description",
+        "enable_concurrent_dependencies",
         "enable_openapi",
+        "enable_route_tree",
         "enable_scheduler",
         "exception_handlers",
         "include_in_schema",
         "interceptors",
+        "json_engine",
         "license",
         "middleware",
         "openapi_config",
@@ -117,6 +123,7 @@ class Esmerald(Starlette):
         "permissions",
         "pluggables",
         "redirect_slashes",
+        "response_cache_backend",
         "response_class",
         "response_cookies",
         "response_headers",
@@ -1464,6 +1471,84 @@ class Esmerald(Starlette):
                 """
             ),
         ] = None,
+        enable_route_tree: Annotated[
+            Optional[bool],
+            Doc(
+                """
+                Boolean flag indicating if the requests should be dispatched via a
+                prefix tree built from the routes instead of checking every route
+                one by one.
+
+                Useful for applications with a large number of routes.
+
+                **Example**
+
+                ```python
+                from esmerald import Esmerald
+
+                app = Esmerald(enable_route_tree=True)
+                ```
+                """
+            ),
+        ] = None,
+        enable_concurrent_dependencies: Annotated[
+            Optional[bool],
+            Doc(
+                """
+                Boolean flag indicating if the independent dependencies of a handler should be
+                resolved concurrently instead of one after the other.
+
+                **Example**
+
+                ```python
+                from esmerald import Esmerald
+
+                app = Esmerald(enable_concurrent_dependencies=True)
+                ```
+                """
+            ),
+        ] = None,
+        json_engine: Annotated[
+            Optional[Union[str, JSONEngine]],
+            Doc(
+                """
+                The JSON engine used to render the JSON responses (including the error
+                responses and the OpenAPI document) and to parse `Request.json()`.
+
+                One of `orjson` (the default), `msgspec`, `json` (the Python `json` module) or
+                an instance of `esmerald.encoders.JSONEngine`.
+
+                **Example**
+
+                ```python
+                from esmerald import Esmerald
+
+                app = Esmerald(json_engine="msgspec")
+                ```
+                """
+            ),
+        ] = None,
+        response_cache_backend: Annotated[
+            Optional[CacheBackendProtocol],
+            Doc(
+                """
+                The backend storing the responses cached via the `cache` of the handlers,
+                gateways and includes not declaring their own backend.
+
+                Defaults to an in-process `esmerald.cache.MemoryCacheBackend` keeping up to 1024
+                responses.
+
+                **Example**
+
+                ```python
+                from esmerald import Esmerald
+                from esmerald.cache import MemoryCacheBackend
+
+                app = Esmerald(response_cache_backend=MemoryCacheBackend(maxsize=10_000))
+                ```
+                """
+            ),
+        ] = None,
     ) -> None:
         self.settings_config = None
 
@@ -1545,6 +1630,17 @@ class Esmerald(Starlette):
         self.redirect_slashes = self.load_settings_value(
             "redirect_slashes", redirect_slashes, is_boolean=True
         )
+        self.enable_route_tree = self.load_settings_value(
+            "enable_route_tree", enable_route_tree, is_boolean=True
+        )
+        self.enable_concurrent_dependencies = self.load_settings_value(
+            "enable_concurrent_dependencies", enable_concurrent_dependencies, is_boolean=True
+        )
+        self.json_engine = get_json_engine(self.load_settings_value("json_engine", json_engine))
+        self.response_cache_backend = (
+            self.load_settings_value("response_cache_backend", response_cache_backend)
+            or MemoryCacheBackend()
+        )
         self.pluggables = self.load_settings_value("pluggables", pluggables)
 
         # OpenAPI Related
@@ -1585,6 +1681,7 @@ class Esmerald(Starlette):
             deprecated=deprecated,
             security=security,
             redirect_slashes=self.redirect_slashes,
+            enable_route_tree=self.enable_route_tree,
         )
 
         self.get_default_exception_handlers()
@@ -1594,6 +1691,7 @@ class Esmerald(Starlette):
         self.template_engine = self.get_template_engine(self.template_config)
 
         self._configure()
+        self.router.build_pipelines()
 
     def _configure(self) -> None:
         """
@@ -1608,6 +1706,7 @@ class Esmerald(Starlette):
                 static_route = Include(path=config.path, app=config.to_app())
                 self.router.validate_root_route_parent(static_route)
                 self.router.routes.append(static_route)
+            self.router.refresh_routes()
 
         if self.enable_scheduler:
             self.activate_scheduler()
@@ -1787,7 +1886,9 @@ class Esmerald(Starlette):
         if not template_config:
             return None
 
-        engine: "TemplateEngineProtocol" = template_config.engine(template_config.directory)
+        engine: "TemplateEngineProtocol" = template_config.engine(
+            template_config.directory, **template_config._build_kwargs()
+        )
         return engine
 
     def add_apiview(
@@ -1824,6 +1925,8 @@ class Esmerald(Starlette):
         ```
         """
         self.router.add_apiview(value=value)
+        self.refresh_cors_middleware()
+        self.router.build_pipelines()
 
     def add_route(
         self,
@@ -1960,6 +2063,7 @@ class Esmerald(Starlette):
             include_in_schema=include_in_schema,
             deprecated=deprecated,
         )
+        self.router.build_pipelines()
 
         if activate_openapi:
             self.activate_openapi()
@@ -2065,7 +2169,7 @@ class Esmerald(Starlette):
         ```
         """
         router = router or self.router
-        return router.add_websocket_route(
+        router.add_websocket_route(
             path=path,
             handler=handler,
             dependencies=dependencies,
@@ -2075,6 +2179,7 @@ class Esmerald(Starlette):
             middleware=middleware,
             name=name,
         )
+        self.router.build_pipelines()
 
     def add_include(
         self,
@@ -2111,6 +2216,9 @@ class Esmerald(Starlette):
 
         for route in include.routes:
             self.router.create_signature_models(route)
+        self.router.refresh_routes()
+        self.refresh_cors_middleware()
+        self.router.build_pipelines()
 
         self.activate_openapi()
 
@@ -2173,6 +2281,9 @@ class Esmerald(Starlette):
                 security=security,
             )
         )
+        self.router.refresh_routes()
+        self.refresh_cors_middleware()
+        self.router.build_pipelines()
         self.activate_openapi()
 
     def add_router(
@@ -2236,21 +2347,25 @@ class Esmerald(Starlette):
             if self.on_shutdown:
                 self.on_shutdown.extend(router.on_shutdown)
 
-            self.router.routes.append(
-                gateway(
-                    path=route.path,
-                    dependencies=route.dependencies,
-                    exception_handlers=route.exception_handlers,
-                    name=route.name,
-                    middleware=route.middleware,
-                    interceptors=route.interceptors,
-                    permissions=route.permissions,
-                    handler=route.handler,
-                    parent=self.router,
-                    is_from_router=True,
-                )
+            gate = gateway(
+                path=route.path,
+                dependencies=route.dependencies,
+                exception_handlers=route.exception_handlers,
+                name=route.name,
+                middleware=route.middleware,
+                interceptors=route.interceptors,
+                permissions=route.permissions,
+                handler=route.handler,
+                parent=self.router,
+                is_from_router=True,
             )
+            if isinstance(gate, gateways.Gateway):
+                gate.cors_config = getattr(route, "cors_config", None)
+            self.router.routes.append(gate)
 
+        self.router.refresh_routes()
+        self.refresh_cors_middleware()
+        self.router.build_pipelines()
         self.activate_openapi()
 
     def get_default_exception_handlers(self) -> None:
@@ -2323,7 +2438,15 @@ class Esmerald(Starlette):
             )
         if self.cors_config:
             user_middleware.append(
-                StarletteMiddleware(CORSMiddleware, **self.cors_config.model_dump())
+                StarletteMiddleware(
+                    CORSMiddleware, **self.cors_config.model_dump(), routes=self.router.routes
+                )
+            )
+        elif get_route_policies(self.router.routes):
+            user_middleware.append(
+                StarletteMiddleware(
+                    CORSMiddleware, routes=self.router.routes, default_policy=False
+                )
             )
         if self.csrf_config:
             user_middleware.append(StarletteMiddleware(CSRFMiddleware, config=self.csrf_config))
@@ -2340,6 +2463,19 @@ class Esmerald(Starlette):
                 user_middleware.append(StarletteMiddleware(middleware))
         return user_middleware
 
+    def refresh_cors_middleware(self) -> None:
+        """
+        Rebuilds the middleware stack when routes declaring a `cors_config` are added to an
+        application without one, the `CORSMiddleware` being only added for them.
+        """
+        if self.cors_config or any(
+            middleware.cls is CORSMiddleware for middleware in self.user_middleware
+        ):
+            return
+        if get_route_policies(self.router.routes):
+            self.user_middleware = self.build_user_middleware_stack()
+            self.middleware_stack = self.build_middleware_stack()
+
     def build_middleware_stack(self) -> "ASGIApp":
         """
         Esmerald uses the [esmerald.protocols.MiddlewareProtocol] (interfaces) and therefore we
@@ -2353,6 +2489,11 @@ class Esmerald(Starlette):
 
         For APIViews, since it's a "wrapper", the handler will update the current list to contain
         both.
+
+        The `ExceptionMiddleware` and `AsyncExitStackMiddleware` around the router, together
+        with the `EsmeraldAPIExceptionMiddleware` when there is no user middleware, run as a
+        single `FusedExceptionMiddleware` and the adjacent `HookMiddleware` as a single
+        `FusedHookMiddleware`.
         """
         debug = self.debug
         error_handler = None
@@ -2367,29 +2508,25 @@ class Esmerald(Starlette):
         for route in self.routes or []:
             exception_handlers.update(self.build_routes_exception_handlers(route))
 
-        middleware = (
-            [
-                StarletteMiddleware(
-                    EsmeraldAPIExceptionMiddleware,
-                    exception_handlers=exception_handlers,
-                    error_handler=error_handler,
-                    debug=debug,
-                ),
-            ]
-            + self.user_middleware
-            + [
-                StarletteMiddleware(
-                    ExceptionMiddleware,
-                    handlers=exception_handlers,
-                    debug=debug,
-                ),
-                StarletteMiddleware(AsyncExitStackMiddleware, config=self.async_exit_config),
-            ]
+        user_middleware = fuse_middleware(self.user_middleware)
+        app: "ASGIApp" = FusedExceptionMiddleware(
+            self.router,
+            debug=debug,
+            exception_handlers=exception_handlers,
+            async_exit_config=self.async_exit_config,
+            error_handler=error_handler,
+            catch_all=not user_middleware,
         )
-
-        app: "ASGIApp" = self.router
-        for cls, options in reversed(middleware):
+        for cls, options in reversed(user_middleware):
             app = cls(app=app, **options)
+
+        if user_middleware:
+            app = EsmeraldAPIExceptionMiddleware(
+                app,
+                exception_handlers=exception_handlers,
+                error_handler=error_handler,
+                debug=debug,
+            )
         return app
 
     def build_pluggable_stack(self) -> Optional["Esmerald"]:
@@ -2492,7 +2629,11 @@ class Esmerald(Starlette):
         if self.root_path:
             scope["root_path"] = self.root_path
         scope["state"] = {}
-        await super().__call__(scope, receive, send)
+        token = json_engine_context.set(self.json_engine)
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            json_engine_context.reset(token)
 
     def route(
         self,
@@ -0,0 +1,5 @@
+from .base import CachedResponse, ResponseCache
+from .coalescing import RequestCoalescing
+from .memory import MemoryCacheBackend
+
+__all__ = ["CachedResponse", "MemoryCacheBackend", "RequestCoalescing", "ResponseCache"]
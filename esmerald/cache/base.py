@@ -0,0 +1,199 @@
+from typing import TYPE_CHECKING, Callable, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+import msgspec
+from starlette.responses import Response as StarletteResponse
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.protocols.cache import CacheBackendProtocol
+    from esmerald.requests import Request
+
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+CACHEABLE_STATUS_CODES = frozenset({200, 203, 204, 300, 301, 308})
+CREDENTIAL_HEADERS = ("authorization", "cookie")
+
+
+def make_request_key(
+    request: "Request",
+    query_params: Optional[FrozenSet[str]] = None,
+    vary: Sequence[str] = (),
+) -> str:
+    """
+    Builds the key identifying the response of a request from the method, the path, the query
+    parameters (all of them or only the `query_params` given) and the values of the `vary`
+    request headers.
+    """
+    scope = request.scope
+    query = request.query_params
+    if query_params is not None:
+        items = sorted((key, value) for key, value in query.multi_items() if key in query_params)
+    else:
+        items = sorted(query.multi_items())
+
+    key = f"{scope['method']}:{scope.get('root_path', '')}{scope['path']}?"
+    key += "&".join(f"{name}={value}" for name, value in items)
+    if vary:
+        headers = request.headers
+        key += "|" + "|".join(f"{name}={headers.get(name, '')}" for name in vary)
+    return key
+
+
+def is_shareable(request: "Request", vary: Sequence[str] = ()) -> bool:
+    """
+    Checks if the response of a request can be shared with other clients. Requests sending
+    credentials in the `Authorization` or `Cookie` headers are not, unless the key varies
+    on them.
+    """
+    headers = request.headers
+    return all(header not in headers or header in vary for header in CREDENTIAL_HEADERS)
+
+
+def is_shareable_response(response: StarletteResponse) -> bool:
+    """
+    Checks if a response can be sent to other clients: it has a body, sets no cookies and
+    is not `Cache-Control: no-store` or `private`.
+    """
+    if getattr(response, "body", None) is None:
+        return False
+
+    headers = response.headers
+    if "set-cookie" in headers:
+        return False
+    cache_control = headers.get("cache-control", "").lower()
+    return "no-store" not in cache_control and "private" not in cache_control
+
+
+class CachedResponse:
+    """
+    The final status, headers and body of a response, as sent to the client.
+    """
+
+    __slots__ = ("status_code", "raw_headers", "body")
+
+    def __init__(
+        self, status_code: int, raw_headers: List[Tuple[bytes, bytes]], body: bytes
+    ) -> None:
+        self.status_code = status_code
+        self.raw_headers = raw_headers
+        self.body = body
+
+    @classmethod
+    def from_response(cls, response: StarletteResponse) -> "CachedResponse":
+        return cls(response.status_code, list(response.raw_headers), response.body)
+
+    def to_response(self) -> StarletteResponse:
+        response = StarletteResponse.__new__(StarletteResponse)
+        response.status_code = self.status_code
+        response.body = self.body
+        response.background = None
+        response.raw_headers = list(self.raw_headers)
+        return response
+
+    def encode(self) -> bytes:
+        """
+        Encodes the response to bytes, for the backends storing bytes.
+        """
+        return msgspec.msgpack.encode((self.status_code, self.raw_headers, self.body))
+
+    @classmethod
+    def decode(cls, data: bytes) -> "CachedResponse":
+        status_code, raw_headers, body = msgspec.msgpack.decode(data)
+        return cls(status_code, [(key, value) for key, value in raw_headers], body)
+
+
+class ResponseCache:
+    """
+    Caches the responses of the handlers.
+
+    A cached response is sent as is, skipping the dependencies, the validation of the
+    parameters, the handler and the serialisation of its return value.
+
+    The key is built from the method, the path, the query parameters (all of them or only
+    the `query_params` given) and the values of the `vary` request headers.
+
+    A request is not served from the cache when:
+
+    * Its method is not in `methods`.
+    * It sends `Cache-Control: no-cache` (the fresh response is cached) or
+    `Cache-Control: no-store`.
+    * It sends an `Authorization` or a `Cookie` header, unless the header is in `vary`.
+    * `bypass(request)` returns `True`.
+
+    Only the responses with a body, a cacheable status code, no cookies and no
+    `Cache-Control: no-store` or `private` are stored.
+
+    **Example**
+
+    ```python
+    from esmerald import Gateway, get
+    from esmerald.cache import ResponseCache
+
+
+    @get("/products", cache=ResponseCache(ttl=60, query_params=["page"], vary=["accept-language"]))
+    async def products(page: int = 1) -> list:
+        ...
+    ```
+    """
+
+    __slots__ = ("ttl", "backend", "query_params", "vary", "methods", "status_codes", "bypass")
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        backend: Optional["CacheBackendProtocol"] = None,
+        query_params: Optional[Sequence[str]] = None,
+        vary: Sequence[str] = (),
+        methods: Sequence[str] = tuple(CACHEABLE_METHODS),
+        status_codes: Sequence[int] = tuple(CACHEABLE_STATUS_CODES),
+        bypass: Optional[Callable[["Request"], bool]] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.backend = backend
+        self.query_params: Optional[FrozenSet[str]] = (
+            frozenset(query_params) if query_params is not None else None
+        )
+        self.vary: Tuple[str, ...] = tuple(sorted(header.lower() for header in vary))
+        self.methods: FrozenSet[str] = frozenset(method.upper() for method in methods)
+        self.status_codes: FrozenSet[int] = frozenset(status_codes)
+        self.bypass = bypass
+
+    @classmethod
+    def from_value(cls, value: Union[bool, float, "ResponseCache"]) -> Optional["ResponseCache"]:
+        """
+        Builds the cache for the `cache` of a handler, a gateway or an include.
+
+        `True` caches without expiry, a number is the time to live in seconds and `False`
+        disables the cache declared by an upper layer.
+        """
+        if isinstance(value, ResponseCache):
+            return value
+        if value is False:
+            return None
+        if value is True:
+            return cls()
+        return cls(ttl=value)
+
+    def get_key(self, request: "Request") -> str:
+        """
+        Builds the key of the request.
+        """
+        return make_request_key(request, self.query_params, self.vary)
+
+    def can_lookup(self, request: "Request") -> bool:
+        """
+        Checks if the response of the request can be served from the cache.
+        """
+        if request.method not in self.methods:
+            return False
+        if not is_shareable(request, self.vary):
+            return False
+        if self.bypass is not None and self.bypass(request):
+            return False
+        return True
+
+    def can_store(self, response: StarletteResponse) -> bool:
+        """
+        Checks if the response can be stored in the cache.
+        """
+        if response.status_code not in self.status_codes:
+            return False
+        return is_shareable_response(response)
@@ -0,0 +1,92 @@
+from typing import TYPE_CHECKING, FrozenSet, Optional, Sequence, Tuple, Union
+
+from esmerald.cache.base import (
+    CACHEABLE_METHODS,
+    is_shareable,
+    is_shareable_response,
+    make_request_key,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from starlette.responses import Response as StarletteResponse
+
+    from esmerald.requests import Request
+
+
+class RequestCoalescing:
+    """
+    Coalesces the identical concurrent requests of a handler into a single execution.
+
+    The first request of a key (the leader) calls the handler while the concurrent requests
+    with the same key (the followers) wait for it and receive a copy of its response. Once
+    the leader completes, nothing is kept and the next request calls the handler again.
+
+    The key is built from the method, the path, the query parameters (all of them or only
+    the `query_params` given) and the values of the `vary` request headers.
+
+    * When the leader raises, the followers raise the same exception.
+    * A follower waiting longer than `timeout` seconds calls the handler itself.
+    * When the response of the leader has no body, for instance a stream, sets cookies, is
+    `Cache-Control: no-store` or `private`, or the leader is cancelled, the followers call the
+    handler themselves.
+    * The background tasks of the response only run for the leader.
+
+    Only the `GET` and `HEAD` requests without an `Authorization` or a `Cookie` header,
+    unless the header is in `vary`, are coalesced.
+
+    **Example**
+
+    ```python
+    from esmerald import get
+    from esmerald.cache import RequestCoalescing
+
+
+    @get("/products", coalesce=RequestCoalescing(query_params=["page"], timeout=5))
+    async def products(page: int = 1) -> list:
+        ...
+    ```
+    """
+
+    __slots__ = ("query_params", "vary", "timeout", "methods")
+
+    def __init__(
+        self,
+        query_params: Optional[Sequence[str]] = None,
+        vary: Sequence[str] = (),
+        timeout: Optional[float] = None,
+        methods: Sequence[str] = tuple(CACHEABLE_METHODS),
+    ) -> None:
+        self.query_params: Optional[FrozenSet[str]] = (
+            frozenset(query_params) if query_params is not None else None
+        )
+        self.vary: Tuple[str, ...] = tuple(sorted(header.lower() for header in vary))
+        self.timeout = timeout
+        self.methods: FrozenSet[str] = frozenset(method.upper() for method in methods)
+
+    @classmethod
+    def from_value(cls, value: Union[bool, "RequestCoalescing"]) -> Optional["RequestCoalescing"]:
+        """
+        Builds the coalescing for the `coalesce` of a handler or a gateway. `False`
+        disables the coalescing declared by an upper layer.
+        """
+        if isinstance(value, RequestCoalescing):
+            return value
+        return cls() if value else None
+
+    def get_key(self, request: "Request") -> str:
+        """
+        Builds the key of the request.
+        """
+        return make_request_key(request, self.query_params, self.vary)
+
+    def can_coalesce(self, request: "Request") -> bool:
+        """
+        Checks if the request can share the response of an identical one.
+        """
+        return request.method in self.methods and is_shareable(request, self.vary)
+
+    def can_share(self, response: "StarletteResponse") -> bool:
+        """
+        Checks if the response of the leader can be sent to the followers.
+        """
+        return is_shareable_response(response)
@@ -0,0 +1,48 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Optional, Tuple
+
+
+class MemoryCacheBackend:
+    """
+    In-process cache backend, bounded to `maxsize` entries evicted by least recent use.
+
+    This is the default backend of the response cache. Each worker process has its own
+    entries.
+    """
+
+    __slots__ = ("maxsize", "entries")
+
+    def __init__(self, maxsize: Optional[int] = 1024) -> None:
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = monotonic() + ttl if ttl is not None else None
+        self.entries[key] = (value, expires_at)
+        self.entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
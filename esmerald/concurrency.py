@@ -1 +1,37 @@
 from contextlib import AsyncExitStack as AsyncExitStack  # noqa
+from typing import Any, Optional
+
+
+class LazyAsyncExitStack:
+    """
+    Stands for the `AsyncExitStack` of a request, only creating it when something is
+    registered in it, so the requests not using it do not pay for entering and exiting a
+    stack.
+
+    Any attribute of `AsyncExitStack`, such as `enter_async_context()` or
+    `push_async_callback()`, creates the stack. `get_stack()` returns it directly.
+    """
+
+    __slots__ = ("stack",)
+
+    def __init__(self) -> None:
+        self.stack: Optional[AsyncExitStack] = None
+
+    def get_stack(self) -> AsyncExitStack:
+        if self.stack is None:
+            self.stack = AsyncExitStack()
+        return self.stack
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get_stack(), name)
+
+    async def exit(self, exc: Optional[BaseException] = None) -> bool:
+        """
+        Unwinds the stack, if created, as when exiting it with the given exception, and
+        returns whether the exception was suppressed.
+        """
+        if self.stack is None:
+            return False
+        if exc is None:
+            return bool(await self.stack.__aexit__(None, None, None))
+        return bool(await self.stack.__aexit__(type(exc), exc, exc.__traceback__))
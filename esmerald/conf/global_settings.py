@@ -12,9 +12,11 @@ from esmerald.conf.enums import EnvironmentType
 from esmerald.config import CORSConfig, CSRFConfig, OpenAPIConfig, SessionConfig, StaticFilesConfig
 from esmerald.config.asyncexit import AsyncExitConfig
 from esmerald.datastructures import Secret
+from esmerald.encoders import JSONEngine
 from esmerald.interceptors.types import Interceptor
 from esmerald.permissions.types import Permission
 from esmerald.pluggables import Pluggable
+from esmerald.protocols.cache import CacheBackendProtocol
 from esmerald.routing import gateways
 from esmerald.types import (
     APIGateHandler,
@@ -418,6 +420,61 @@ class EsmeraldAPISettings(BaseSettings):
             """
         ),
     ] = True
+    enable_route_tree: Annotated[
+        bool,
+        Doc(
+            """
+            Boolean flag indicating if the requests should be dispatched via a
+            prefix tree built from the routes instead of checking every route
+            one by one.
+
+            The tree is built from the routes (including the ones inside any `Include`)
+            and respects the order of declaration.
+
+            !!! Tip
+                Enable this option for applications with a large number of routes.
+            """
+        ),
+    ] = False
+    enable_concurrent_dependencies: Annotated[
+        bool,
+        Doc(
+            """
+            Boolean flag indicating if the independent dependencies of a handler should be
+            resolved concurrently instead of one after the other.
+
+            Dependencies needing the value of another dependency of the same handler are
+            still resolved after it.
+
+            !!! Tip
+                Enable this option when the handlers depend on multiple I/O bound dependencies.
+            """
+        ),
+    ] = False
+    json_engine: Annotated[
+        Union[str, JSONEngine],
+        Doc(
+            """
+            The JSON engine used to render the JSON responses (including the error
+            responses and the OpenAPI document) and to parse `Request.json()`.
+
+            One of `orjson`, `msgspec`, `json` (the Python `json` module) or an instance of
+            `esmerald.encoders.JSONEngine`.
+            """
+        ),
+    ] = "orjson"
+    response_cache_backend: Annotated[
+        Optional[CacheBackendProtocol],
+        Doc(
+            """
+            The backend storing the responses cached via the `cache` of the handlers,
+            gateways and includes not declaring their own backend.
+
+            Defaults to an in-process `esmerald.cache.MemoryCacheBackend` keeping up to 1024
+            responses.
+            """
+        ),
+    ] = None
     root_path_in_servers: Annotated[
         bool,
         Doc(
@@ -1,4 +1,5 @@
 from .asyncexit import AsyncExitConfig
+from .compression import CompressionConfig
 from .cors import CORSConfig
 from .csrf import CSRFConfig
 from .openapi import OpenAPIConfig
@@ -7,6 +8,7 @@ from .static_files import StaticFilesConfig
 
 __all__ = [
     "AsyncExitConfig",
+    "CompressionConfig",
     "CORSConfig",
     "CSRFConfig",
     "OpenAPIConfig",
@@ -2,6 +2,11 @@ from pydantic import BaseModel
 
 
 class AsyncExitConfig(BaseModel):
-    """Configuration for AsyncExitMiddleware."""
+    """Configuration for AsyncExitMiddleware.
+
+    With `lazy`, the `AsyncExitStack` of a request is a `LazyAsyncExitStack`, only created
+    when used. The handlers declaring `eager_exit_stack` get the `AsyncExitStack` itself.
+    """
 
     context_name: str = "esmerald_astack"
+    lazy: bool = False
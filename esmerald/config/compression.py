@@ -0,0 +1,98 @@
+from typing import Dict, List
+
+from pydantic import BaseModel
+from typing_extensions import Annotated, Doc
+
+
+class CompressionConfig(BaseModel):
+    """
+    An instance of `CompressionConfig`.
+
+    This configuration is passed to the
+    [CompressionMiddleware](https://esmerald.dev/middleware/middleware/#compressionmiddleware)
+    and can also be declared in a handler or a `Gateway`, via `compression`, to override it
+    for the handlers of that level.
+
+    **Example**
+
+    ```python
+    from esmerald import Esmerald
+    from esmerald.config import CompressionConfig
+    from esmerald.middleware import CompressionMiddleware
+    from starlette.middleware import Middleware
+
+    compression_config = CompressionConfig(levels={"br": 5, "gzip": 6}, minimum_size=1024)
+
+    app = Esmerald(middleware=[Middleware(CompressionMiddleware, config=compression_config)])
+    ```
+    """
+
+    minimum_size: Annotated[
+        int,
+        Doc(
+            """
+            The minimum size, in bytes, of the responses to compress. Streaming responses are
+            always compressed as their size is not known in advance.
+            """
+        ),
+    ] = 500
+    encodings: Annotated[
+        List[str],
+        Doc(
+            """
+            The encodings, by order of preference of the server, negotiated with the
+            `Accept-Encoding` of the request.
+
+            `br` requires `brotli` and `zstd` requires `zstandard` to be installed, otherwise
+            they are ignored.
+            """
+        ),
+    ] = ["br", "zstd", "gzip"]
+    levels: Annotated[
+        Dict[str, int],
+        Doc(
+            """
+            The compression level of each encoding. `br` goes from 0 to 11, `zstd` from 1 to
+            22 and `gzip` from 1 to 9.
+            """
+        ),
+    ] = {"br": 4, "zstd": 3, "gzip": 6}
+    excluded_media_types: Annotated[
+        List[str],
+        Doc(
+            """
+            The media types not compressed as they are already compressed or meant to be
+            delivered as they are. A value ending with `/` excludes every media type with
+            that prefix.
+            """
+        ),
+    ] = [
+        "audio/",
+        "video/",
+        "image/avif",
+        "image/gif",
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+        "font/woff",
+        "font/woff2",
+        "application/gzip",
+        "application/octet-stream",
+        "application/pdf",
+        "application/x-7z-compressed",
+        "application/x-bzip2",
+        "application/x-rar-compressed",
+        "application/zip",
+        "application/zstd",
+        "text/event-stream",
+    ]
+    cache_maxsize: Annotated[
+        int,
+        Doc(
+            """
+            The number of compressed bodies kept in memory, keyed by the `ETag` of the
+            response, its encoding and level. Responses with the same `ETag` are only
+            compressed once. Use `0` to disable it.
+            """
+        ),
+    ] = 256
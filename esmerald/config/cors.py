@@ -31,7 +31,8 @@ class CORSConfig(BaseModel):
             It is possible to allow all by passing '*' and also
             wildcards are are allowed.
 
-            Example: `example.*` or `*.example.com`.
+            Example: `example.*` or `*.example.com`. A wildcard origin without
+            scheme matches any scheme.
 
             This option sets the 'Access-Control-Allow-Origin' header.
             """
@@ -93,3 +94,12 @@ class CORSConfig(BaseModel):
             """
         ),
     ] = 600
+    cache_maxsize: Annotated[
+        int,
+        Doc(
+            """
+            The maximum number of preflight responses, per origin, method and requested
+            headers, kept ready to be sent.
+            """
+        ),
+    ] = 1024
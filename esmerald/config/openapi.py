@@ -4,6 +4,7 @@ from openapi_schemas_pydantic.v3_1_0.security_scheme import SecurityScheme
 from pydantic import AnyUrl, BaseModel
 from typing_extensions import Annotated, Doc
 
+from esmerald.enums import MediaType
 from esmerald.openapi.docs import (
     get_redoc_html,
     get_stoplight_html,
@@ -13,7 +14,7 @@ from esmerald.openapi.docs import (
 from esmerald.openapi.models import Contact, License
 from esmerald.openapi.openapi import get_openapi
 from esmerald.requests import Request
-from esmerald.responses import HTMLResponse, JSONResponse
+from esmerald.responses import HTMLResponse, Response
 from esmerald.routing.handlers import get
 
 
@@ -354,13 +355,13 @@ class OpenAPIConfig(BaseModel):
             server_urls = set(urls)
 
             @get(path=self.openapi_url)
-            async def _openapi(request: Request) -> JSONResponse:
+            async def _openapi(request: Request) -> Response:
                 root_path = request.scope.get("root_path", "").rstrip("/")
                 if root_path not in server_urls:
                     if root_path and self.root_path_in_servers:
                         self.servers.insert(0, {"url": root_path})
                         server_urls.add(root_path)
-                return JSONResponse(self.openapi(app))
+                return Response(self.openapi(app), media_type=MediaType.JSON)
 
             app.add_route(
                 path="/",
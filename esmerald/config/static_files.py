@@ -2,10 +2,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, DirectoryPath, constr, field_validator
-from starlette.staticfiles import StaticFiles
 from starlette.types import ASGIApp
 from typing_extensions import Annotated, Doc
 
+from esmerald.staticfiles import StaticFiles
 from esmerald.utils.url import clean_path
 
 
@@ -72,6 +72,51 @@ class StaticFilesConfig(BaseModel):
             """
         ),
     ] = True
+    scan: Annotated[
+        bool,
+        Doc(
+            """
+            Scan the directories once, on the first request, and serve the files from that
+            index with their headers computed once.
+            """
+        ),
+    ] = False
+    precompressed: Annotated[
+        bool,
+        Doc(
+            """
+            Serve the `.br`, `.zst` and `.gz` siblings of the files to the clients accepting
+            those encodings. Implies `scan`.
+            """
+        ),
+    ] = False
+    cache_maxsize: Annotated[
+        int,
+        Doc(
+            """
+            The number of small files kept in memory. `0` disables the cache. Implies `scan`.
+            """
+        ),
+    ] = 0
+    cache_max_file_size: Annotated[
+        int,
+        Doc(
+            """
+            The size, in bytes, of the largest file kept in memory.
+            """
+        ),
+    ] = (
+        64 * 1024
+    )
+    immutable_pattern: Annotated[
+        Optional[str],
+        Doc(
+            """
+            A regular expression matching the names of the fingerprinted files, sent with an
+            immutable `Cache-Control`, for instance `esmerald.staticfiles.HASHED_FILENAME_PATTERN`.
+            """
+        ),
+    ] = None
 
     @field_validator("path")
     def validate_path(cls, value: str) -> str:
@@ -85,7 +130,15 @@ class StaticFilesConfig(BaseModel):
         """
         Builds the necessary kwargs to create an StaticFiles object.
         """
-        kwargs = {"html": self.html, "check_dir": self.check_dir}
+        kwargs = {
+            "html": self.html,
+            "check_dir": self.check_dir,
+            "scan": self.scan,
+            "precompressed": self.precompressed,
+            "cache_maxsize": self.cache_maxsize,
+            "cache_max_file_size": self.cache_max_file_size,
+            "immutable_pattern": self.immutable_pattern,
+        }
         if self.packages:
             kwargs.update({"packages": self.packages})  # type: ignore
         if self.directory:
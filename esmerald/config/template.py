@@ -1,9 +1,11 @@
-from typing import List, Type, Union
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel, ConfigDict, DirectoryPath
 from typing_extensions import Annotated, Doc
 
 from esmerald.protocols.template import TemplateEngineProtocol
+from esmerald.template.cache import FragmentCache
 from esmerald.template.jinja import JinjaTemplateEngine
 
 
@@ -55,3 +57,38 @@ class TemplateConfig(BaseModel):
             """
         ),
     ]
+    bytecode_cache: Annotated[
+        Optional[Union[str, Path, Any]],
+        Doc(
+            """
+            Where to keep the compiled templates, so they are not compiled again by every
+            process, `"memory"` or the path of a directory. A `jinja2.BytecodeCache` instance
+            is also accepted by the `JinjaTemplateEngine`.
+
+            The `esmerald precompile_templates` directive fills the cache at build time.
+            """
+        ),
+    ] = None
+    fragment_cache: Annotated[
+        Union[bool, FragmentCache],
+        Doc(
+            """
+            Cache the rendered template fragments, the `{% cache %}` tag with Jinja and the
+            `cached` blocks and defs with Mako. `True` uses a `FragmentCache` of 1024 entries
+            kept for 300 seconds by default.
+            """
+        ),
+    ] = False
+
+    def _build_kwargs(self) -> Dict[str, Any]:
+        """
+        Builds the kwargs, other than the directory, to create the template engine.
+        """
+        kwargs: Dict[str, Any] = {}
+        if self.bytecode_cache is not None:
+            kwargs["bytecode_cache"] = self.bytecode_cache
+        if self.fragment_cache is True:
+            kwargs["fragment_cache"] = FragmentCache()
+        elif isinstance(self.fragment_cache, FragmentCache):
+            kwargs["fragment_cache"] = self.fragment_cache
+        return kwargs
@@ -0,0 +1,125 @@
+"""
+Cache used by the `Inject` and `Factory` providers.
+"""
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import anyio
+
+from esmerald.typing import Void
+
+
+class PendingCall:
+    """
+    A call in flight shared by every concurrent miss of the same key.
+    """
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+        self.value: Any = Void
+        self.error: Optional[BaseException] = None
+
+
+class ProviderCache:
+    """
+    LRU cache with an optional time to live for the values of a provider, keyed on the
+    arguments the provider is called with.
+
+    Concurrent misses of the same key share a single call of the provider.
+    """
+
+    __slots__ = ("ttl", "maxsize", "entries", "pending")
+
+    def __init__(self, ttl: Optional[float] = None, maxsize: Optional[int] = None) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self.pending: Dict[Hashable, PendingCall] = {}
+
+    @staticmethod
+    def make_key(*args: Any, **kwargs: Any) -> Optional[Hashable]:
+        """
+        Builds the key for the given arguments or returns `None` when any of them is not
+        hashable, in which case the value is not cached.
+        """
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Returns the value for the key or `Void` when missing or expired.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return Void
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self.entries[key]
+            return Void
+
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = monotonic() + self.ttl if self.ttl is not None else None
+        self.entries[key] = (value, expires_at)
+        self.entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    async def get_or_call(
+        self, key: Optional[Hashable], call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Returns the cached value for the key or awaits the call and caches the result.
+        """
+        if key is None:
+            return await call()
+
+        value = self.get(key)
+        if value is not Void:
+            return value
+
+        pending = self.pending.get(key)
+        if pending is not None:
+            await pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            if pending.value is not Void:
+                return pending.value
+            return await self.get_or_call(key, call)
+
+        pending = self.pending[key] = PendingCall()
+        try:
+            pending.value = await call()
+        except Exception as e:
+            pending.error = e
+            raise
+        finally:
+            del self.pending[key]
+            pending.event.set()
+
+        self.set(key, pending.value)
+        return pending.value
+
+    def invalidate(self, key: Optional[Hashable]) -> None:
+        """
+        Removes the value of the key from the cache.
+        """
+        if key is not None:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all the values from the cache.
+        """
+        self.entries.clear()
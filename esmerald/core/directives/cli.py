@@ -18,6 +18,7 @@ from esmerald.core.directives.operations import (
     create_app,
     create_project,
     list,
+    precompile_templates,
     run,
     runserver,
     shell,
@@ -128,3 +129,4 @@ esmerald_cli.add_command(create_project)
 esmerald_cli.add_command(create_app)
 esmerald_cli.add_command(runserver)
 esmerald_cli.add_command(shell)
+esmerald_cli.add_command(precompile_templates)
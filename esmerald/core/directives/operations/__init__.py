@@ -1,6 +1,7 @@
 from .createapp import create_app as create_app  # noqa
 from .createproject import create_project as create_project  # noqa
 from .list import list as list  # noqa
+from .precompile_templates import precompile_templates as precompile_templates  # noqa
 from .run import run as run  # noqa
 from .runserver import runserver as runserver  # noqa
 from .shell import shell as shell  # noqa
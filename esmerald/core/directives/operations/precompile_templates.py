@@ -0,0 +1,67 @@
+import os
+import sys
+from typing import Tuple
+
+import click
+
+from esmerald.core.directives.constants import ESMERALD_DISCOVER_APP
+from esmerald.core.directives.env import DirectiveEnv
+from esmerald.core.terminal import Print
+
+printer = Print()
+
+
+@click.option(
+    "-e",
+    "--extension",
+    "extensions",
+    multiple=True,
+    help="Only compile the templates with the extension. Can be repeated.",
+)
+@click.option(
+    "--ignore-errors",
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help="Skip the templates failing to compile instead of stopping.",
+)
+@click.command(name="precompile_templates")
+def precompile_templates(
+    env: DirectiveEnv, extensions: Tuple[str, ...], ignore_errors: bool
+) -> None:
+    """Compiles all the templates of a given application, filling the bytecode cache
+    of the `TemplateConfig`, so the processes of the application do not compile them again.
+
+    How to run: `esmerald precompile_templates`
+
+    Example: `esmerald precompile_templates -e html`
+    """
+    if os.getenv(ESMERALD_DISCOVER_APP) is None and getattr(env, "app", None) is None:
+        error = (
+            "You cannot specify a custom directive without specifying the --app or setting "
+            "ESMERALD_DEFAULT_APP environment variable."
+        )
+        printer.write_error(error)
+        sys.exit(1)
+
+    engine = getattr(env.app, "template_engine", None)
+    if engine is None:
+        printer.write_error("The application has no template engine configured.")
+        sys.exit(1)
+
+    precompile = getattr(engine, "precompile", None)
+    if precompile is None:
+        printer.write_error(f"{type(engine).__name__} does not support precompiling templates.")
+        sys.exit(1)
+
+    if getattr(env.app.template_config, "bytecode_cache", None) is None:
+        printer.write_warning(
+            "No bytecode_cache is set in the TemplateConfig, the compiled templates are not kept."
+        )
+
+    try:
+        compiled = precompile(extensions=extensions or None, ignore_errors=ignore_errors)
+    except Exception as e:
+        printer.write_error(f"Failed to compile the templates: {e}")
+        sys.exit(1)
+    printer.write_success(f"{len(compiled)} template(s) compiled.")
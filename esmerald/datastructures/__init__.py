@@ -16,7 +16,7 @@ from .base import (
 from .file import File
 from .json import JSON
 from .redirect import Redirect
-from .stream import Stream
+from .stream import JSONStream, Stream
 from .template import Template
 
 __all__ = [
@@ -26,6 +26,7 @@ __all__ = [
     "FormData",
     "Headers",
     "JSON",
+    "JSONStream",
     "MutableHeaders",
     "QueryParams",
     "Redirect",
@@ -2,11 +2,11 @@ import os
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union, cast
 
 from pydantic import FilePath, field_validator, model_validator  # noqa
-from starlette.responses import FileResponse  # noqa
 from typing_extensions import Annotated, Doc
 
 from esmerald.datastructures.base import ResponseContainer
 from esmerald.enums import MediaType
+from esmerald.responses.file import FileResponse
 
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.applications import Esmerald
@@ -37,6 +37,16 @@ class File(ResponseContainer[FileResponse]):
             """
         ),
     ] = None
+    zero_copy: Annotated[
+        bool,
+        Doc(
+            """
+            Sends the file via the ASGI `http.response.pathsend` extension when the server
+            supports it, letting the server send the file without going through Python.
+            Otherwise, the file is memory mapped and sent in large chunks.
+            """
+        ),
+    ] = False
 
     @model_validator(mode="before")
     def validate_fields(cls, values: Dict[str, Any]) -> Any:
@@ -59,4 +69,5 @@ class File(ResponseContainer[FileResponse]):
             path=self.path,
             stat_result=self.stat_result,
             status_code=status_code,
+            zero_copy=self.zero_copy,
         )
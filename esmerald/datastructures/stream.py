@@ -9,14 +9,18 @@ from typing import (
     Generator,
     Iterable,
     Iterator,
+    Literal,
+    Optional,
     Type,
     Union,
 )
 
+from starlette.concurrency import iterate_in_threadpool
 from starlette.responses import StreamingResponse  # noqa
 from typing_extensions import Annotated, Doc
 
 from esmerald.datastructures.base import ResponseContainer  # noqa
+from esmerald.encoders import get_json_engine
 from esmerald.enums import MediaType
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -55,3 +59,145 @@ class Stream(ResponseContainer[StreamingResponse]):
             media_type=media_type,
             status_code=status_code,
         )
+
+
+class JSONStream(ResponseContainer[StreamingResponse]):
+    """
+    Streams the items of an iterator as JSON, encoding them one by one instead of
+    serialising the whole content at once.
+
+    The items can be anything the JSON engine of the application can encode, such as
+    Pydantic models, dataclasses, `msgspec.Struct` or dictionaries.
+
+    The next items are only pulled from the iterator once the previous chunk was sent,
+    following the pace of the client.
+
+    **Example**
+
+    ```python
+    from esmerald import get
+    from esmerald.datastructures import JSONStream
+
+
+    @get("/users")
+    async def users() -> JSONStream:
+        return JSONStream(iterator=dao.iterate_users(), format="array")
+    ```
+    """
+
+    iterator: Annotated[
+        Union[
+            Iterable[Any],
+            AsyncIterable[Any],
+            Callable[[], Iterable[Any]],
+            Callable[[], AsyncIterable[Any]],
+        ],
+        Doc(
+            """
+            Any sync or async iterable of the items to stream.
+            """
+        ),
+    ]
+    format: Annotated[
+        Literal["ndjson", "array"],
+        Doc(
+            """
+            How the items are streamed. `ndjson` sends one JSON document per line and
+            `array` sends a single JSON array.
+            """
+        ),
+    ] = "ndjson"
+    flush_items: Annotated[
+        Optional[int],
+        Doc(
+            """
+            Sends a chunk every time this number of items is encoded.
+            """
+        ),
+    ] = None
+    flush_bytes: Annotated[
+        Optional[int],
+        Doc(
+            """
+            Sends a chunk every time the encoded items reach this size in bytes.
+
+            When neither `flush_items` nor `flush_bytes` are set, the default, every item
+            is sent on its own.
+            """
+        ),
+    ] = None
+    media_type: Annotated[
+        Optional[str],
+        Doc(
+            """
+            The media type of the response. Defaults to `application/x-ndjson` for `ndjson`
+            and `application/json` for `array`.
+            """
+        ),
+    ] = None
+
+    async def encode(self) -> AsyncIterator[bytes]:
+        """
+        Encodes the items of the iterator into chunks of bytes.
+        """
+        dumps = get_json_engine().dumps
+        iterator = (
+            self.iterator
+            if isinstance(self.iterator, (Iterable, AsyncIterable))
+            else self.iterator()
+        )
+        if not isinstance(iterator, AsyncIterable):
+            iterator = iterate_in_threadpool(iterator)
+
+        is_array = self.format == "array"
+        flush_items = self.flush_items
+        flush_bytes = self.flush_bytes
+        if flush_items is None and flush_bytes is None:
+            flush_items = 1
+
+        chunk = bytearray(b"[" if is_array else b"")
+        items = 0
+        separator = b""
+        async for item in iterator:
+            if is_array:
+                chunk += separator
+                chunk += dumps(item)
+                separator = b","
+            else:
+                chunk += dumps(item)
+                chunk += b"\n"
+            items += 1
+
+            if (flush_items is not None and items >= flush_items) or (
+                flush_bytes is not None and len(chunk) >= flush_bytes
+            ):
+                yield bytes(chunk)
+                chunk.clear()
+                items = 0
+
+        if is_array:
+            chunk += b"]"
+        if chunk:
+            yield bytes(chunk)
+
+    def to_response(
+        self,
+        headers: Dict[str, Any],
+        media_type: Union["MediaType", str],
+        status_code: int,
+        app: Type["Esmerald"],
+    ) -> StreamingResponse:
+        if self.media_type is not None:
+            media_type = self.media_type
+        elif self.format == "ndjson":
+            media_type = MediaType.NDJSON
+        else:
+            media_type = MediaType.JSON
+
+        return StreamingResponse(
+            background=self.background,
+            content=self.encode(),
+            headers=headers,
+            media_type=media_type,
+            status_code=status_code,
+        )
@@ -5,7 +5,7 @@ from typing_extensions import Annotated, Doc
 from esmerald.datastructures.base import ResponseContainer  # noqa
 from esmerald.enums import MediaType
 from esmerald.exceptions import TemplateNotFound  # noqa
-from esmerald.responses import TemplateResponse  # noqa
+from esmerald.responses import StreamingTemplateResponse, TemplateResponse  # noqa
 
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.applications import Esmerald
@@ -70,6 +70,15 @@ class Template(ResponseContainer[TemplateResponse]):
             """
         ),
     ] = None
+    stream: Annotated[
+        bool,
+        Doc(
+            """
+            Send the template in chunks while it is rendered, via a
+            `StreamingTemplateResponse`, instead of rendering the whole page first.
+            """
+        ),
+    ] = False
 
     def to_response(
         self,
@@ -77,9 +86,9 @@ class Template(ResponseContainer[TemplateResponse]):
         media_type: Union["MediaType", str],
         status_code: int,
         app: Type["Esmerald"],
-    ) -> "TemplateResponse":
+    ) -> Union["TemplateResponse", "StreamingTemplateResponse"]:
         from esmerald.exceptions import ImproperlyConfigured
-        from esmerald.responses import TemplateResponse
+        from esmerald.responses import StreamingTemplateResponse, TemplateResponse
 
         if not app.template_engine:
             raise ImproperlyConfigured("Template engine is not configured")
@@ -92,12 +101,15 @@ class Template(ResponseContainer[TemplateResponse]):
             "template_engine": app.template_engine,
             "media_type": media_type,
         }
+        response_class: Type[Union[TemplateResponse, StreamingTemplateResponse]] = (
+            StreamingTemplateResponse if self.stream else TemplateResponse
+        )
         try:
-            return TemplateResponse(template_name=self.name, **data)
+            return response_class(template_name=self.name, **data)
         except TemplateNotFound as e:  # pragma: no cover
             if self.alternative_template:
                 try:
-                    return TemplateResponse(template_name=self.alternative_template, **data)
+                    return response_class(template_name=self.alternative_template, **data)
                 except TemplateNotFound as ex:  # pragma: no cover
                     raise ex
             raise e
@@ -0,0 +1,167 @@
+"""
+The JSON engines used by Esmerald to render and parse JSON content.
+
+The engine of an application is set via the `json_engine` setting and is used by the default
+`Response`, the error responses, the OpenAPI document and `Request.json()`.
+"""
+import dataclasses
+import json
+from contextvars import ContextVar
+from dataclasses import is_dataclass
+from typing import Any, Callable, ClassVar, Dict, Optional, Type, Union
+
+import msgspec
+import orjson
+from orjson import OPT_NON_STR_KEYS, OPT_SERIALIZE_NUMPY
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, to_jsonable_python
+
+from esmerald.exceptions import ImproperlyConfigured
+
+ENCODERS: Dict[Type[Any], Callable[[Any], Any]] = {}
+
+
+def register_encoder(type_: Type[Any], encoder: Callable[[Any], Any]) -> None:
+    """
+    Registers how to encode the values of a given type (and its subclasses) the JSON engines
+    do not know how to encode.
+
+    The encoder must return a value the engine can encode, for instance a `str` or a `dict`.
+
+    **Example**
+
+    ```python
+    from esmerald.encoders import register_encoder
+
+    register_encoder(Money, lambda value: f"{value.amount} {value.currency}")
+    ```
+    """
+    ENCODERS[type_] = encoder
+
+
+def encode_default(value: Any) -> Any:
+    """
+    Encodes the values a JSON engine does not support natively.
+
+    Registered encoders take precedence, then Pydantic models, dataclasses and
+    `msgspec.Struct` are turned into dictionaries and anything else Pydantic knows how to
+    serialise (datetime, Decimal, UUID, Enum, sets...) is converted the same way Pydantic does.
+    """
+    if ENCODERS:
+        for base in type(value).__mro__:
+            encoder = ENCODERS.get(base)
+            if encoder is not None:
+                return encoder(value)
+
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if is_dataclass(value):
+        return dataclasses.asdict(value)
+    if isinstance(value, msgspec.Struct):
+        return msgspec.structs.asdict(value)
+    try:
+        return to_jsonable_python(value)
+    except PydanticSerializationError as e:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable") from e
+
+
+class JSONEngine:
+    """
+    Base of the JSON engines.
+    """
+
+    name: ClassVar[str]
+
+    def dumps(self, content: Any, default: Callable[[Any], Any] = encode_default) -> bytes:
+        raise NotImplementedError()  # pragma: no cover
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        raise NotImplementedError()  # pragma: no cover
+
+
+class StdlibJSONEngine(JSONEngine):
+    """
+    JSON engine using the Python `json` module.
+    """
+
+    name = "json"
+
+    def dumps(self, content: Any, default: Callable[[Any], Any] = encode_default) -> bytes:
+        return json.dumps(content, default=default, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        return json.loads(content)
+
+
+class OrjsonJSONEngine(JSONEngine):
+    """
+    JSON engine using `orjson`.
+
+    The content `orjson` does not support, such as the integers above 64 bits, is encoded
+    with the Python `json` module, as compact.
+    """
+
+    name = "orjson"
+
+    def dumps(self, content: Any, default: Callable[[Any], Any] = encode_default) -> bytes:
+        try:
+            return orjson.dumps(
+                content, default=default, option=OPT_SERIALIZE_NUMPY | OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            return json.dumps(
+                content, default=default, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        return orjson.loads(content)
+
+
+class MsgspecJSONEngine(JSONEngine):
+    """
+    JSON engine using `msgspec`.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        self.encoder = msgspec.json.Encoder(enc_hook=encode_default)
+        self.decoder = msgspec.json.Decoder()
+
+    def dumps(self, content: Any, default: Callable[[Any], Any] = encode_default) -> bytes:
+        if default is encode_default:
+            return self.encoder.encode(content)
+        return msgspec.json.encode(content, enc_hook=default)
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        return self.decoder.decode(content)
+
+
+JSON_ENGINES: Dict[str, Type[JSONEngine]] = {
+    engine.name: engine for engine in (StdlibJSONEngine, OrjsonJSONEngine, MsgspecJSONEngine)
+}
+
+DEFAULT_JSON_ENGINE = OrjsonJSONEngine()
+
+json_engine_context: ContextVar[JSONEngine] = ContextVar(
+    "json_engine", default=DEFAULT_JSON_ENGINE
+)
+
+
+def get_json_engine(engine: Optional[Union[str, JSONEngine]] = None) -> JSONEngine:
+    """
+    Returns the JSON engine for the given name or instance.
+
+    Without arguments, returns the engine of the application handling the current request.
+    """
+    if engine is None:
+        return json_engine_context.get()
+    if isinstance(engine, JSONEngine):
+        return engine
+    if engine == DEFAULT_JSON_ENGINE.name:
+        return DEFAULT_JSON_ENGINE
+    if engine not in JSON_ENGINES:
+        raise ImproperlyConfigured(
+            f"Unknown JSON engine '{engine}'. Use one of {', '.join(JSON_ENGINES)}."
+        )
+    return JSON_ENGINES[engine]()
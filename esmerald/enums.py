@@ -14,6 +14,7 @@ class HttpMethod(str, Enum):
 
 class MediaType(str, Enum):
     JSON = "application/json"
+    NDJSON = "application/x-ndjson"
     HTML = "text/html"
     TEXT = "text/plain"
     MESSAGE_PACK = "application/x-msgpack"
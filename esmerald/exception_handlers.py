@@ -1,4 +1,5 @@
-from typing import Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Union
 
 from orjson import loads
 from pydantic import ValidationError
@@ -7,60 +8,125 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.requests import Request
 from starlette.responses import Response as StarletteResponse
 
+from esmerald.encoders import JSONEngine, get_json_engine
 from esmerald.enums import MediaType
 from esmerald.exceptions import ExceptionErrorMap, HTTPException, ImproperlyConfigured
-from esmerald.responses import JSONResponse, Response
+from esmerald.responses import Response
+
+
+class CachedExceptionHandlers(dict):
+    """
+    The exception handlers keyed by exception class or status code, resolving the handler of
+    an exception class, walking its MRO, once.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.resolved: Dict[type, Optional[Callable]] = {}
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.resolved.clear()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.resolved.clear()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.resolved.clear()
+
+    def lookup(self, exc_class: type) -> Optional[Callable]:
+        try:
+            return self.resolved[exc_class]
+        except KeyError:
+            pass
+
+        handler = None
+        for klass in exc_class.__mro__:
+            if klass in self:
+                handler = self[klass]
+                break
+        self.resolved[exc_class] = handler
+        return handler
+
+
+@lru_cache(maxsize=1024)
+def render_error_body(
+    engine: JSONEngine, detail: Optional[str], status_code: Optional[int] = None
+) -> bytes:
+    """
+    Encodes, once per JSON engine, the body of an error made of a `detail` and optionally its
+    `status_code`.
+    """
+    content: Dict[str, Any] = {"detail": detail} if detail is not None else {}
+    if status_code is not None:
+        content["status_code"] = status_code
+    return engine.dumps(content)
+
+
+def error_response(
+    status_code: int,
+    detail: Any,
+    headers: Optional[Dict[str, Any]] = None,
+    extra: Any = None,
+    include_status_code: bool = False,
+) -> Response:
+    """
+    Builds the JSON response of an error, `{"detail": ...}` with the `extra` and the
+    `status_code` when given.
+
+    The bodies made of a string `detail` only, such as the ones of the `NotFound` or
+    `NotAuthorized` exceptions, are encoded once and reused.
+    """
+    body_status_code = status_code if include_status_code else None
+    engine = get_json_engine()
+    if not extra and (detail is None or isinstance(detail, str)):
+        body = render_error_body(engine, detail, body_status_code)
+    else:
+        content: Dict[str, Any] = {"detail": detail} if detail is not None else {}
+        if extra:
+            content["extra"] = extra
+        if body_status_code is not None:
+            content["status_code"] = body_status_code
+        body = engine.dumps(content)
+    return Response(body, status_code=status_code, headers=headers)
 
 
 async def http_exception_handler(
     request: Request, exc: Union[HTTPException, StarletteHTTPException]
-) -> Union[JSONResponse, Response]:  # pragma: no cover
+) -> Response:  # pragma: no cover
     """
     Default exception handler for StarletteHTTPException and Esmerald HTTPException.
     """
-    extra = getattr(exc, "extra", None)
     headers = getattr(exc, "headers", None)
 
     if exc.status_code in {204, 304}:
-        return JSONResponse(None, status_code=exc.status_code, headers=headers)
-
-    if headers and not extra:
-        return JSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
-    elif headers and extra:
-        return JSONResponse(
-            {"detail": exc.detail, "extra": extra},
-            status_code=exc.status_code,
-            headers=headers,
-        )
-    elif not headers and extra:
-        return JSONResponse({"detail": exc.detail, "extra": extra}, status_code=exc.status_code)
-    else:
-        return JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
+        return Response(None, status_code=exc.status_code, headers=headers)
+    return error_response(exc.status_code, exc.detail, headers, getattr(exc, "extra", None))
 
 
 async def validation_error_exception_handler(
     request: Request, exc: ValidationError
-) -> JSONResponse:  # pragma: no cover
+) -> Response:  # pragma: no cover
     extra = getattr(exc, "extra", None)
     status_code = status.HTTP_400_BAD_REQUEST
 
     if extra:
         errors_extra = exc.extra.get("extra", {})
-        return JSONResponse(
+        return Response(
             {"detail": exc.detail, "errors": errors_extra},
             status_code=status_code,
         )
     else:
-        return JSONResponse(
+        return Response(
             {"detail": exc.detail},
             status_code=status_code,
         )
 
 
-async def http_error_handler(
-    _: Request, exc: ExceptionErrorMap
-) -> JSONResponse:  # pragma: no cover
-    return JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
+async def http_error_handler(_: Request, exc: ExceptionErrorMap) -> Response:  # pragma: no cover
+    return error_response(exc.status_code, exc.detail)
 
 
 async def improperly_configured_exception_handler(
@@ -92,7 +158,7 @@ async def improperly_configured_exception_handler(
 
 async def pydantic_validation_error_handler(
     request: Request, exc: ValidationError
-) -> JSONResponse:  # pragma: no cover
+) -> Response:  # pragma: no cover
     """
     This handler is to be used when a pydantic validation error is triggered during the logic
     of a code block and not the definition of a handler.
@@ -100,16 +166,14 @@ async def pydantic_validation_error_handler(
     This is different from validation_error_exception_handler
     """
     status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
-    return JSONResponse({"detail": loads(exc.json())}, status_code=status_code)
+    return Response({"detail": loads(exc.json())}, status_code=status_code)
 
 
-async def value_error_handler(
-    request: Request, exc: ValueError
-) -> JSONResponse:  # pragma: no cover
+async def value_error_handler(request: Request, exc: ValueError) -> Response:  # pragma: no cover
     """
     Simple handler that manages all the ValueError exceptions thrown to the user properly
     formatted.
     """
     status_code = status.HTTP_400_BAD_REQUEST
     details = loads(exc.json()) if hasattr(exc, "json") else exc.args[0]
-    return JSONResponse({"detail": details}, status_code=status_code)
+    return Response({"detail": details}, status_code=status_code)
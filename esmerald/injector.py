@@ -1,5 +1,7 @@
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, Union
 
+from esmerald.core.di.cache import ProviderCache
 from esmerald.core.di.provider import load_provider
 from esmerald.parsers import ArbitraryHashableBaseModel
 from esmerald.transformers.datastructures import Signature
@@ -10,15 +12,34 @@ if TYPE_CHECKING:  # pragma: no cover
     from esmerald.typing import AnyCallable
 
 
+def create_cache(ttl: Optional[float], maxsize: Optional[int]) -> Optional[ProviderCache]:
+    """
+    Creates the cache of a provider when any of the cache options is set.
+    """
+    if ttl is None and maxsize is None:
+        return None
+    return ProviderCache(ttl=ttl, maxsize=maxsize)
+
+
 class Factory:
-    def __init__(self, provides: Union["AnyCallable", str], *args: Any) -> None:
+    def __init__(
+        self,
+        provides: Union["AnyCallable", str],
+        *args: Any,
+        cache_ttl: Optional[float] = None,
+        cache_maxsize: Optional[int] = None,
+    ) -> None:
         """
         The provider can be passed in separate ways. Via direct callable
         or via string value where it will be automatically imported by the application.
+
+        When `cache_ttl` and/or `cache_maxsize` are provided, the provided objects are cached
+        per arguments for `cache_ttl` seconds, keeping up to `cache_maxsize` of them.
         """
         self.__args: Tuple[Any, ...] = ()
         self.set_args(*args)
         self.is_nested: bool = False
+        self.cache = create_cache(cache_ttl, cache_maxsize)
 
         if isinstance(provides, str):
             self.provides, self.is_nested = load_provider(provides)
@@ -42,6 +63,11 @@ class Factory:
             1. MyClass.func
             2. MyClass.AnotherClass.func
         """
+        if self.cache is not None:
+            return await self.cache.get_or_call(self.cache.make_key(*self.__args), self.provide)
+        return await self.provide()
+
+    async def provide(self) -> Any:
         if self.is_nested:
             self.provides = self.provides()
 
@@ -51,33 +77,91 @@ class Factory:
             value = self.provides(*self.__args)
         return value
 
+    def invalidate(self) -> None:
+        """
+        Removes the cached object for the current arguments.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(self.cache.make_key(*self.__args))
+
+    def clear_cache(self) -> None:
+        """
+        Removes all the cached objects.
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
 
 class Inject(ArbitraryHashableBaseModel):
-    def __init__(self, dependency: "AnyCallable", use_cache: bool = False, **kwargs: Any):
+    def __init__(
+        self,
+        dependency: "AnyCallable",
+        use_cache: bool = False,
+        use_request_cache: bool = True,
+        cache_ttl: Optional[float] = None,
+        cache_maxsize: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """
+        The value of the dependency is resolved once per request and shared by every
+        dependency requiring it, unless `use_request_cache` is `False`.
+
+        When `cache_ttl` and/or `cache_maxsize` are provided, the values are cached across
+        requests per arguments for `cache_ttl` seconds, keeping up to `cache_maxsize` of them.
+        """
         super().__init__(**kwargs)
         self.dependency = dependency
         self.signature_model: Optional["Type[Signature]"] = None
         self.use_cache = use_cache
+        self.use_request_cache = use_request_cache
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self.cache = create_cache(cache_ttl, cache_maxsize)
         self.value: Any = Void
 
     async def __call__(self, **kwargs: Dict[str, Any]) -> Any:
         if self.use_cache and self.value is not Void:
             return self.value
 
-        if is_async_callable(self.dependency):
-            value = await self.dependency(**kwargs)
+        if self.cache is not None:
+            value = await self.cache.get_or_call(
+                self.cache.make_key(**kwargs), partial(self.resolve, **kwargs)
+            )
         else:
-            value = self.dependency(**kwargs)
+            value = await self.resolve(**kwargs)
 
         if self.use_cache:
             self.value = value
 
         return value
 
+    async def resolve(self, **kwargs: Dict[str, Any]) -> Any:
+        if is_async_callable(self.dependency):
+            return await self.dependency(**kwargs)
+        return self.dependency(**kwargs)
+
+    def invalidate(self, **kwargs: Any) -> None:
+        """
+        Removes the cached value for the given arguments.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(self.cache.make_key(**kwargs))
+
+    def clear_cache(self) -> None:
+        """
+        Removes all the cached values.
+        """
+        self.value = Void
+        if self.cache is not None:
+            self.cache.clear()
+
     def __eq__(self, other: Any) -> bool:
         return other is self or (
             isinstance(other, self.__class__)
             and other.dependency == self.dependency
             and other.use_cache == self.use_cache
+            and other.use_request_cache == self.use_request_cache
+            and other.cache_ttl == self.cache_ttl
+            and other.cache_maxsize == self.cache_maxsize
             and other.value == self.value
         )
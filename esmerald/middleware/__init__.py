@@ -1,6 +1,7 @@
 from .asyncexitstack import AsyncExitStackMiddleware
 from .authentication import BaseAuthMiddleware
 from .basic import BasicHTTPMiddleware
+from .compression import CompressionMiddleware
 from .cors import CORSMiddleware
 from .csrf import CSRFMiddleware
 from .gzip import GZipMiddleware
@@ -14,6 +15,7 @@ __all__ = [
     "AsyncExitStackMiddleware",
     "BaseAuthMiddleware",
     "BasicHTTPMiddleware",
+    "CompressionMiddleware",
     "CORSMiddleware",
     "CSRFMiddleware",
     "GZipMiddleware",
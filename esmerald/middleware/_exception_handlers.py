@@ -14,6 +14,16 @@ from starlette.responses import Response
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from starlette.websockets import WebSocket
 
+from esmerald.exception_handlers import CachedExceptionHandlers
+
+
+def lookup_exception_handler(
+    exception_handlers: ExceptionHandlers, exc: Exception
+) -> typing.Optional[typing.Callable]:
+    if isinstance(exception_handlers, CachedExceptionHandlers):
+        return exception_handlers.lookup(type(exc))
+    return _lookup_exception_handler(exception_handlers, exc)
+
 
 def wrap_app_handling_exceptions(app: ASGIApp, conn: typing.Union[Request, WebSocket]) -> ASGIApp:
     exception_handlers: ExceptionHandlers
@@ -42,7 +52,7 @@ def wrap_app_handling_exceptions(app: ASGIApp, conn: typing.Union[Request, WebSo
                 handler = status_handlers.get(exc.status_code)
 
             if handler is None:
-                handler = _lookup_exception_handler(exception_handlers, exc)
+                handler = lookup_exception_handler(exception_handlers, exc)
 
             if handler is None:
                 raise exc
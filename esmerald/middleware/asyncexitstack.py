@@ -1,6 +1,4 @@
-from typing import Optional
-
-from esmerald.concurrency import AsyncExitStack
+from esmerald.concurrency import AsyncExitStack, LazyAsyncExitStack
 from esmerald.config import AsyncExitConfig
 from esmerald.protocols.middleware import MiddlewareProtocol
 from esmerald.types import ASGIApp, Receive, Scope, Send
@@ -22,13 +20,28 @@ class AsyncExitStackMiddleware(MiddlewareProtocol):
         if not AsyncExitStack:
             await self.app(scope, receive, send)  # pragma: no cover
 
-        exception: Optional[Exception] = None
+        await call_with_exit_stack(self.app, self.config, scope, receive, send)
+
+
+async def call_with_exit_stack(
+    app: "ASGIApp", config: "AsyncExitConfig", scope: "Scope", receive: "Receive", send: "Send"
+) -> None:
+    """
+    Calls the app with the `AsyncExitStack` of the request in `scope[config.context_name]`,
+    a `LazyAsyncExitStack` when `config.lazy` is set.
+    """
+    if not config.lazy:
         async with AsyncExitStack() as stack:
-            scope[self.config.context_name] = stack
-            try:
-                await self.app(scope, receive, send)
-            except Exception as e:
-                exception = e
-                raise e
-            if exception:
-                raise exception
+            scope[config.context_name] = stack
+            await app(scope, receive, send)
+        return
+
+    lazy_stack = LazyAsyncExitStack()
+    scope[config.context_name] = lazy_stack
+    try:
+        await app(scope, receive, send)
+    except BaseException as e:
+        if not await lazy_stack.exit(e):
+            raise
+    else:
+        await lazy_stack.exit()
@@ -1,10 +1,14 @@
-from typing import TypeVar
+from typing import Any, List, Optional, Sequence, Tuple, Type, TypeVar
 
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware as StarletteMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware  # noqa
 from starlette.middleware.base import RequestResponseEndpoint as RequestResponseEndpoint  # noqa
 from starlette.requests import Request as StarletteRequest
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from esmerald.protocols.middleware import MiddlewareProtocol
 from esmerald.requests import Request
 
 Req = TypeVar("Req", Request, StarletteRequest)
@@ -18,3 +22,129 @@ class BasicHTTPMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Req, call_next: RequestResponseEndpoint) -> Response:
         response = await call_next(request)
         return response
+
+
+class HookMiddleware(MiddlewareProtocol):
+    """
+    Pure ASGI base of the HTTP middleware running code before the request and when the
+    response starts, without the task group, memory streams and response buffering of the
+    `BasicHTTPMiddleware`.
+
+    * `before_request` is called with the request and may return a response, sent instead of
+    calling the application.
+    * `after_response` is called with the request, the status code and the mutable headers of
+    the response, before they are sent.
+
+    The body of the request must not be read by the hooks, it is for the application.
+
+    Adjacent `HookMiddleware` of the application are fused in a single ASGI layer.
+
+    **Example**
+
+    ```python
+    from esmerald.middleware.basic import HookMiddleware
+
+
+    class TimingMiddleware(HookMiddleware):
+        async def before_request(self, request):
+            request.state.started_at = time.perf_counter()
+
+        async def after_response(self, request, status_code, headers):
+            elapsed = time.perf_counter() - request.state.started_at
+            headers["server-timing"] = f"app;dur={elapsed * 1000:.1f}"
+    ```
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs: Any) -> None:
+        self.app = app
+
+    async def before_request(self, request: Request) -> Optional[Response]:
+        return None
+
+    async def after_response(
+        self, request: Request, status_code: int, headers: MutableHeaders
+    ) -> None:
+        ...
+
+    @classmethod
+    def has_after_response(cls) -> bool:
+        return cls.after_response is not HookMiddleware.after_response
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await call_with_hooks(self.app, (self,), scope, receive, send)
+
+
+async def call_with_hooks(
+    app: ASGIApp, hooks: Sequence[HookMiddleware], scope: Scope, receive: Receive, send: Send
+) -> None:
+    """
+    Calls the application through the hooks, in order, as if each hook wrapped the next.
+    """
+    request = Request(scope, receive, send)
+    for index, hook in enumerate(hooks):
+        response = await hook.before_request(request)
+        if response is not None:
+            await response(scope, receive, wrap_send(send, request, hooks[:index]))
+            return
+    await app(scope, receive, wrap_send(send, request, hooks))
+
+
+def wrap_send(send: Send, request: Request, hooks: Sequence[HookMiddleware]) -> Send:
+    after_hooks = [hook for hook in reversed(hooks) if hook.has_after_response()]
+    if not after_hooks:
+        return send
+
+    async def send_wrapper(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(scope=message)
+            for hook in after_hooks:
+                await hook.after_response(request, message["status"], headers)
+        await send(message)
+
+    return send_wrapper
+
+
+class FusedHookMiddleware(MiddlewareProtocol):
+    """
+    Adjacent `HookMiddleware` running in a single ASGI layer.
+    """
+
+    def __init__(
+        self, app: ASGIApp, middleware: Sequence[Tuple[Type[HookMiddleware], Any]]
+    ) -> None:
+        self.app = app
+        self.hooks = [cls(app=app, **options) for cls, options in middleware]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await call_with_hooks(self.app, self.hooks, scope, receive, send)
+
+
+def fuse_middleware(middleware: Sequence[StarletteMiddleware]) -> List[StarletteMiddleware]:
+    """
+    Replaces the runs of adjacent `HookMiddleware` by a `FusedHookMiddleware`.
+    """
+    fused: List[StarletteMiddleware] = []
+    run: List[Tuple[Type[HookMiddleware], Any]] = []
+
+    def flush() -> None:
+        if len(run) == 1:
+            cls, options = run[0]
+            fused.append(StarletteMiddleware(cls, **options))
+        elif run:
+            fused.append(StarletteMiddleware(FusedHookMiddleware, middleware=list(run)))
+        run.clear()
+
+    for cls, options in middleware:
+        if isinstance(cls, type) and issubclass(cls, HookMiddleware):
+            run.append((cls, options))
+            continue
+        flush()
+        fused.append(StarletteMiddleware(cls, **options))
+    flush()
+    return fused
@@ -0,0 +1,313 @@
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from esmerald.config.compression import CompressionConfig
+from esmerald.enums import ScopeType
+from esmerald.protocols.middleware import MiddlewareProtocol
+from esmerald.utils.constants import COMPRESSION
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class GzipCompressor:
+    __slots__ = ("compressor",)
+
+    def __init__(self, level: int) -> None:
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        body = self.compressor.compress(data)
+        return body + self.compressor.flush(zlib.Z_SYNC_FLUSH) if flush else body
+
+    def finish(self) -> bytes:
+        return self.compressor.flush()
+
+
+class BrotliCompressor:
+    __slots__ = ("compressor",)
+
+    def __init__(self, level: int) -> None:
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        body = self.compressor.process(data)
+        return body + self.compressor.flush() if flush else body
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()  # type: ignore[no-any-return]
+
+
+class ZstdCompressor:
+    __slots__ = ("compressor",)
+
+    def __init__(self, level: int) -> None:
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, flush: bool = True) -> bytes:
+        body = self.compressor.compress(data)
+        if flush:
+            body += self.compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return body  # type: ignore[no-any-return]
+
+    def finish(self) -> bytes:
+        return self.compressor.flush()  # type: ignore[no-any-return]
+
+
+Compressor = Union[GzipCompressor, BrotliCompressor, ZstdCompressor]
+
+COMPRESSORS: Dict[str, Callable[[int], Compressor]] = {"gzip": GzipCompressor}
+if brotli is not None:
+    COMPRESSORS["br"] = BrotliCompressor
+if zstandard is not None:
+    COMPRESSORS["zstd"] = ZstdCompressor
+
+
+@lru_cache(maxsize=256)
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """
+    Parses the `Accept-Encoding` of a request into the quality of each encoding.
+    """
+    encodings: Dict[str, float] = {}
+    for item in value.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> Optional[str]:
+    """
+    Returns the encoding, from the ones supported by the server by order of preference,
+    with the highest quality in the `Accept-Encoding` of the request.
+    """
+    accepted = parse_accept_encoding(accept_encoding)
+    default = accepted.get("*", 0.0)
+    selected: Optional[str] = None
+    selected_quality = 0.0
+    for encoding in encodings:
+        if encoding not in COMPRESSORS:
+            continue
+        quality = accepted.get(encoding, default)
+        if quality > selected_quality:
+            selected, selected_quality = encoding, quality
+    return selected
+
+
+def is_excluded_media_type(content_type: str, excluded_media_types: Sequence[str]) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return any(
+        media_type.startswith(excluded) if excluded.endswith("/") else media_type == excluded
+        for excluded in excluded_media_types
+    )
+
+
+# The path, the query string and the ETag of the response, the encoding and the level.
+CacheKey = Tuple[str, bytes, str, str, int]
+
+
+class CompressionMiddleware(MiddlewareProtocol):
+    def __init__(
+        self, app: "ASGIApp", config: Optional[CompressionConfig] = None, **kwargs: Any
+    ) -> None:
+        """Compression Middleware class.
+
+        Compresses the responses with `br`, `zstd` or `gzip`, negotiated via the
+        `Accept-Encoding` of the request. Streaming responses are compressed chunk by chunk.
+
+        The handlers and gateways can override the configuration or opt out via
+        `compression`.
+
+        Args:
+            app: The 'next' ASGI app to call.
+            config: The CompressionConfig instance. The keyword arguments are used to build
+                one when not provided.
+        """
+        super().__init__(app)
+        self.app = app
+        self.config = config or CompressionConfig(**kwargs)
+        self.cache: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        if scope["type"] != ScopeType.HTTP or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        if not accept_encoding:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(self, scope, accept_encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def get_cached(self, key: CacheKey) -> Optional[bytes]:
+        body = self.cache.get(key)
+        if body is not None:
+            self.cache.move_to_end(key)
+        return body
+
+    def set_cached(self, key: CacheKey, body: bytes) -> None:
+        self.cache[key] = body
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.config.cache_maxsize:
+            self.cache.popitem(last=False)
+
+
+class CompressionResponder:
+    """
+    Compresses the response of a single request.
+
+    The start of the response is held until its first body message, when the size and the
+    media type are known.
+    """
+
+    __slots__ = (
+        "middleware",
+        "scope",
+        "accept_encoding",
+        "downstream",
+        "start_message",
+        "compressor",
+        "passthrough",
+    )
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        scope: "Scope",
+        accept_encoding: str,
+        send: "Send",
+    ) -> None:
+        self.middleware = middleware
+        self.scope = scope
+        self.accept_encoding = accept_encoding
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: "Message") -> None:
+        if self.passthrough:
+            await self.downstream(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            # For instance `http.response.pathsend`, sent as it is.
+            if self.compressor is None and self.start_message is not None:
+                self.passthrough = True
+                await self.downstream(self.start_message)
+            await self.downstream(message)
+            return
+
+        if self.compressor is not None:
+            more_body = message.get("more_body", False)
+            body = self.compressor.compress(message.get("body", b""))
+            if not more_body:
+                body += self.compressor.finish()
+            if body or not more_body:
+                await self.downstream(
+                    {"type": "http.response.body", "body": body, "more_body": more_body}
+                )
+            return
+
+        await self.start(message)
+
+    async def start(self, message: "Message") -> None:
+        start_message = self.start_message
+        assert start_message is not None
+
+        config = self.get_config()
+        headers = MutableHeaders(raw=list(start_message["headers"]))
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        encoding = self.get_encoding(config, start_message["status"], headers)
+
+        if encoding is None or (not more_body and len(body) < config.minimum_size):
+            self.passthrough = True
+            await self.downstream(start_message)
+            await self.downstream(message)
+            return
+
+        level = config.levels.get(encoding, self.middleware.config.levels.get(encoding, 6))
+        etag = headers.get("etag")
+        headers["content-encoding"] = encoding
+        headers.add_vary_header("Accept-Encoding")
+        if etag is not None and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+
+        if more_body:
+            del headers["content-length"]
+            self.compressor = COMPRESSORS[encoding](level)
+            start_message["headers"] = headers.raw
+            await self.downstream(start_message)
+            await self.send(message)
+            return
+
+        body = self.compress(body, encoding, level, etag)
+        headers["content-length"] = str(len(body))
+        start_message["headers"] = headers.raw
+        self.passthrough = True
+        await self.downstream(start_message)
+        await self.downstream({"type": "http.response.body", "body": body})
+
+    def get_config(self) -> CompressionConfig:
+        """
+        Returns the configuration of the handler, when declared, or the one of the middleware.
+        """
+        config = self.scope.get(COMPRESSION)
+        if isinstance(config, CompressionConfig):
+            return config
+        return self.middleware.config
+
+    def get_encoding(
+        self, config: CompressionConfig, status_code: int, headers: MutableHeaders
+    ) -> Optional[str]:
+        if self.scope.get(COMPRESSION) is False:
+            return None
+        if status_code < 200 or status_code in (204, 206, 304):
+            return None
+        if "content-encoding" in headers:
+            return None
+        if is_excluded_media_type(headers.get("content-type", ""), config.excluded_media_types):
+            return None
+        return negotiate_encoding(self.accept_encoding, config.encodings)
+
+    def compress(self, body: bytes, encoding: str, level: int, etag: Optional[str]) -> bytes:
+        if etag is None or not self.middleware.config.cache_maxsize:
+            compressor = COMPRESSORS[encoding](level)
+            return compressor.compress(body, flush=False) + compressor.finish()
+
+        # An ETag is only unique within a resource.
+        key = (self.scope["path"], self.scope.get("query_string", b""), etag, encoding, level)
+        compressed = self.middleware.get_cached(key)
+        if compressed is None:
+            compressor = COMPRESSORS[encoding](level)
+            compressed = compressor.compress(body, flush=False) + compressor.finish()
+            self.middleware.set_cached(key, compressed)
+        return compressed
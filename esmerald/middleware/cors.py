@@ -1,3 +1,402 @@
-from starlette.middleware.cors import CORSMiddleware  # noqa
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
 
-__all__ = ["CORSMiddleware"]
+from starlette.datastructures import Headers
+from starlette.routing import BaseRoute, Host, Mount, WebSocketRoute, compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from esmerald.config.cors import CORSConfig
+from esmerald.enums import ScopeType
+from esmerald.protocols.middleware import MiddlewareProtocol
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+SAFELISTED_HEADERS = {"Accept", "Accept-Language", "Content-Language", "Content-Type"}
+SCHEME_PATTERN = r"[a-zA-Z][a-zA-Z0-9+.-]*://"
+
+RawHeaders = List[Tuple[bytes, bytes]]
+Preflight = Tuple[int, RawHeaders, bytes]
+RoutePolicies = List[Tuple[Pattern[str], Optional["CORSPolicy"]]]
+
+
+def wildcard_to_regex(origin: str) -> str:
+    """
+    Translates an origin with wildcards, such as `https://*.example.com`, into a regular
+    expression. The `*` matches anything but a `/` and an origin without scheme matches any
+    scheme.
+    """
+    pattern = re.escape(origin).replace(r"\*", "[^/]*")
+    if "://" not in origin:
+        pattern = SCHEME_PATTERN + pattern
+    return pattern
+
+
+def encode_headers(headers: Dict[str, str]) -> RawHeaders:
+    return [
+        (key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in headers.items()
+    ]
+
+
+def add_vary_origin(headers: RawHeaders) -> RawHeaders:
+    vary = [value for key, value in headers if key == b"vary"]
+    if not vary:
+        headers.append((b"vary", b"Origin"))
+        return headers
+    headers = [(key, value) for key, value in headers if key != b"vary"]
+    headers.append((b"vary", vary[0] + b", Origin"))
+    return headers
+
+
+class CORSPolicy:
+    """
+    A CORS configuration compiled once: the exact origins in a set, the origins with
+    wildcards and the `allow_origin_regex` in a single regular expression and the headers of
+    the responses as raw ASGI headers.
+
+    The preflight responses are kept, per origin, method and requested headers, in a bounded
+    cache of `cache_maxsize` entries.
+    """
+
+    __slots__ = (
+        "allow_all_origins",
+        "allow_all_headers",
+        "allow_origins",
+        "allow_origin_regex",
+        "allow_methods",
+        "allow_headers",
+        "preflight_explicit_allow_origin",
+        "simple_headers",
+        "simple_header_names",
+        "preflight_headers",
+        "cache_maxsize",
+        "cache",
+    )
+
+    def __init__(
+        self,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        allow_origin_regex: Optional[str] = None,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600,
+        cache_maxsize: int = 1024,
+    ) -> None:
+        if "*" in allow_methods:
+            allow_methods = ALL_METHODS
+
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_origins = frozenset(origin for origin in allow_origins if "*" not in origin)
+        patterns = [
+            wildcard_to_regex(origin)
+            for origin in allow_origins
+            if "*" in origin and origin != "*"
+        ]
+        if allow_origin_regex is not None:
+            patterns.append(allow_origin_regex)
+        self.allow_origin_regex: Optional[Pattern[str]] = (
+            re.compile("|".join(f"(?:{pattern})" for pattern in patterns)) if patterns else None
+        )
+        self.allow_methods = frozenset(allow_methods)
+        self.preflight_explicit_allow_origin = not self.allow_all_origins or allow_credentials
+
+        simple_headers = {}
+        if self.allow_all_origins:
+            simple_headers["Access-Control-Allow-Origin"] = "*"
+        if allow_credentials:
+            simple_headers["Access-Control-Allow-Credentials"] = "true"
+        if expose_headers:
+            simple_headers["Access-Control-Expose-Headers"] = ", ".join(expose_headers)
+        self.simple_headers = encode_headers(simple_headers)
+        self.simple_header_names = frozenset(key for key, _ in self.simple_headers)
+
+        preflight_headers = {}
+        if self.preflight_explicit_allow_origin:
+            preflight_headers["Vary"] = "Origin"
+        else:
+            preflight_headers["Access-Control-Allow-Origin"] = "*"
+        preflight_headers["Access-Control-Allow-Methods"] = ", ".join(allow_methods)
+        preflight_headers["Access-Control-Max-Age"] = str(max_age)
+        headers = sorted(SAFELISTED_HEADERS | set(allow_headers))
+        if headers and not self.allow_all_headers:
+            preflight_headers["Access-Control-Allow-Headers"] = ", ".join(headers)
+        if allow_credentials:
+            preflight_headers["Access-Control-Allow-Credentials"] = "true"
+        self.preflight_headers = encode_headers(preflight_headers)
+        self.allow_headers = frozenset(header.lower() for header in headers)
+
+        self.cache_maxsize = cache_maxsize
+        self.cache: "OrderedDict[Tuple[str, str, Optional[str]], Preflight]" = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: CORSConfig) -> "CORSPolicy":
+        return cls(**config.model_dump())
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self.allow_origins:
+            return True
+        return self.allow_origin_regex is not None and bool(
+            self.allow_origin_regex.fullmatch(origin)
+        )
+
+    def preflight(self, origin: str, method: str, requested_headers: Optional[str]) -> Preflight:
+        """
+        Returns the status, the raw headers and the body of the preflight response, built once
+        per origin, method and requested headers.
+        """
+        key = (origin, method, requested_headers)
+        response = self.cache.get(key)
+        if response is not None:
+            self.cache.move_to_end(key)
+            return response
+
+        response = self.build_preflight(origin, method, requested_headers)
+        if self.cache_maxsize:
+            self.cache[key] = response
+            while len(self.cache) > self.cache_maxsize:
+                self.cache.popitem(last=False)
+        return response
+
+    def build_preflight(
+        self, origin: str, method: str, requested_headers: Optional[str]
+    ) -> Preflight:
+        headers = list(self.preflight_headers)
+        failures = []
+
+        if self.is_allowed_origin(origin):
+            if self.preflight_explicit_allow_origin:
+                headers.append((b"access-control-allow-origin", origin.encode("latin-1")))
+        else:
+            failures.append("origin")
+
+        if method not in self.allow_methods:
+            failures.append("method")
+
+        if self.allow_all_headers and requested_headers is not None:
+            headers = [
+                (key, value) for key, value in headers if key != b"access-control-allow-headers"
+            ]
+            headers.append((b"access-control-allow-headers", requested_headers.encode("latin-1")))
+        elif requested_headers is not None:
+            for header in requested_headers.lower().split(","):
+                if header.strip() not in self.allow_headers:
+                    failures.append("headers")
+                    break
+
+        if failures:
+            status_code, body = 400, ("Disallowed CORS " + ", ".join(failures)).encode("utf-8")
+        else:
+            status_code, body = 200, b"OK"
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        return status_code, headers, body
+
+    def apply(self, headers: RawHeaders, origin: str, has_cookie: bool) -> RawHeaders:
+        """
+        Adds the CORS headers to the raw headers of a response to an actual request.
+        """
+        if self.simple_header_names:
+            headers = [
+                (key, value) for key, value in headers if key not in self.simple_header_names
+            ]
+            headers.extend(self.simple_headers)
+
+        # With all the origins allowed, a credentialed request gets its origin instead of `*`.
+        if self.allow_all_origins:
+            explicit_origin = has_cookie
+        else:
+            explicit_origin = self.is_allowed_origin(origin)
+
+        if explicit_origin:
+            headers = [
+                (key, value) for key, value in headers if key != b"access-control-allow-origin"
+            ]
+            headers.append((b"access-control-allow-origin", origin.encode("latin-1")))
+            headers = add_vary_origin(headers)
+        return headers
+
+
+def get_route_policies(routes: Sequence[BaseRoute]) -> RoutePolicies:
+    """
+    Compiles the paths of the routes, `Include` included, into the `(regex, policy)` entries
+    of the routes, in routing order, each route using its `cors_config` or the closest one of
+    its `Include`. `None` is the policy of the middleware.
+
+    Returns no entries when none of the routes declares a `cors_config`.
+    """
+    entries = compile_route_policies(routes, "", None, {})
+    if all(policy is None for _, policy in entries):
+        return []
+    return entries
+
+
+def compile_route_policies(
+    routes: Sequence[BaseRoute],
+    prefix: str,
+    policy: Optional[CORSPolicy],
+    policies: Dict[int, CORSPolicy],
+) -> RoutePolicies:
+    entries: RoutePolicies = []
+    for route in routes:
+        if isinstance(route, (WebSocketRoute, Host)):
+            continue
+
+        route_policy = policy
+        config = getattr(route, "cors_config", None)
+        if config is not None:
+            # The routes sharing a `CORSConfig` share its policy and preflight cache.
+            if id(config) not in policies:
+                policies[id(config)] = CORSPolicy.from_config(config)
+            route_policy = policies[id(config)]
+
+        # The path of an `Include("/")` is `/`, its routes being under the empty prefix.
+        path = prefix.rstrip("/") + route.path  # type: ignore[attr-defined]
+        if isinstance(route, Mount):
+            entries.extend(compile_route_policies(route.routes, path, route_policy, policies))
+            entries.append((compile_path(path.rstrip("/") + "/{path:path}")[0], route_policy))
+        else:
+            entries.append((compile_path(path)[0], route_policy))
+    return entries
+
+
+class CORSMiddleware(MiddlewareProtocol):
+    def __init__(
+        self,
+        app: "ASGIApp",
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        allow_origin_regex: Optional[str] = None,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600,
+        cache_maxsize: int = 1024,
+        routes: Optional[Sequence[BaseRoute]] = None,
+        default_policy: bool = True,
+    ) -> None:
+        """CORS Middleware class.
+
+        Handles the preflight requests and adds the CORS headers to the responses to the
+        actual requests. The configuration is compiled once into a `CORSPolicy` and the
+        preflight responses are cached.
+
+        The `Gateway` and `Include` declaring a `cors_config` in the given `routes` use their
+        own policy, resolved from the path of the request. The paths of the routes are
+        compiled on the first request and again when routes are added.
+
+        Args:
+            app: The 'next' ASGI app to call.
+            allow_origins: The allowed origins, `*` and wildcards such as
+                `https://*.example.com` included.
+            allow_methods: The allowed methods.
+            allow_headers: The allowed request headers.
+            allow_credentials: Allows the requests with credentials.
+            allow_origin_regex: A regular expression the allowed origins fully match.
+            expose_headers: The response headers exposed to the browser.
+            max_age: The time, in seconds, the browser caches the preflight responses.
+            cache_maxsize: The maximum number of preflight responses kept.
+            routes: The routes whose `cors_config` overrides the one of the middleware.
+            default_policy: With `False`, only the requests to the routes declaring a
+                `cors_config` are handled.
+        """
+        super().__init__(app)
+        self.app = app
+        self.policy: Optional[CORSPolicy] = None
+        if default_policy:
+            self.policy = CORSPolicy(
+                allow_origins=allow_origins,
+                allow_methods=allow_methods,
+                allow_headers=allow_headers,
+                allow_credentials=allow_credentials,
+                allow_origin_regex=allow_origin_regex,
+                expose_headers=expose_headers,
+                max_age=max_age,
+                cache_maxsize=cache_maxsize,
+            )
+        self.routes = routes if routes is not None else []
+        self.route_policies: RoutePolicies = []
+        self.routes_count = -1
+        self.last_route: Optional[BaseRoute] = None
+        self.cache_maxsize = cache_maxsize
+        self.path_cache: "OrderedDict[str, Optional[CORSPolicy]]" = OrderedDict()
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        if scope["type"] != ScopeType.HTTP:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        origin = headers.get("origin")
+        policy = self.get_policy(scope["path"]) if origin is not None else None
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and "access-control-request-method" in headers:
+            status_code, raw_headers, body = policy.preflight(
+                origin,  # type: ignore[arg-type]
+                headers["access-control-request-method"],
+                headers.get("access-control-request-headers"),
+            )
+            await send(
+                {"type": "http.response.start", "status": status_code, "headers": raw_headers}
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        has_cookie = "cookie" in headers
+
+        async def send_with_cors(message: "Message") -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = policy.apply(  # type: ignore[union-attr]
+                    list(message.get("headers", [])), origin, has_cookie  # type: ignore[arg-type]
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    def refresh_routes(self) -> None:
+        """
+        Compiles the policies of the current routes again.
+        """
+        self.route_policies = get_route_policies(self.routes)
+        self.path_cache.clear()
+        self.routes_count = len(self.routes)
+        self.last_route = self.routes[-1] if self.routes else None
+
+    def check_routes(self) -> None:
+        """
+        Refreshes the policies of the routes if the routes changed since they were compiled,
+        the same way the router refreshes its lookup tables.
+        """
+        routes = self.routes
+        if len(routes) != self.routes_count or (routes and routes[-1] is not self.last_route):
+            self.refresh_routes()
+
+    def get_policy(self, path: str) -> Optional[CORSPolicy]:
+        """
+        Returns the policy of the route matching the path, or the one of the middleware.
+        """
+        self.check_routes()
+        if not self.route_policies:
+            return self.policy
+
+        try:
+            policy = self.path_cache[path]
+        except KeyError:
+            policy = self.policy
+            for regex, route_policy in self.route_policies:
+                if regex.match(path):
+                    policy = route_policy or self.policy
+                    break
+            self.path_cache[path] = policy
+            while len(self.path_cache) > self.cache_maxsize:
+                self.path_cache.popitem(last=False)
+        else:
+            self.path_cache.move_to_end(path)
+        return policy
+
+
+__all__ = ["CORSMiddleware", "CORSPolicy"]
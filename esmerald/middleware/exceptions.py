@@ -1,7 +1,6 @@
 from inspect import getmro
-from typing import Any, Callable, Dict, List, Mapping, Optional, Type, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Type, Union, cast
 
-from pydantic import BaseModel
 from starlette import status
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.errors import ServerErrorMiddleware
@@ -9,15 +8,23 @@ from starlette.middleware.exceptions import ExceptionMiddleware as StarletteExce
 from starlette.responses import Response as StarletteResponse
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from esmerald.enums import MediaType, ScopeType
-from esmerald.exception_handlers import http_exception_handler
+from esmerald.enums import ScopeType
+from esmerald.exception_handlers import (
+    CachedExceptionHandlers,
+    error_response,
+    http_exception_handler,
+)
 from esmerald.exceptions import HTTPException, WebSocketException
 from esmerald.middleware._exception_handlers import wrap_app_handling_exceptions
+from esmerald.middleware.asyncexitstack import call_with_exit_stack
 from esmerald.requests import Request
 from esmerald.responses import Response
 from esmerald.types import ExceptionHandler, ExceptionHandlerMap
 from esmerald.websockets import WebSocket
 
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.config import AsyncExitConfig
+
 
 class ExceptionMiddleware(StarletteExceptionMiddleware):
     """
@@ -33,11 +40,13 @@ class ExceptionMiddleware(StarletteExceptionMiddleware):
         self.app = app
         self.debug = debug
         self._status_handlers: Dict[int, Callable] = {}
-        self._exception_handlers: Dict[Type[Exception], Callable] = {
-            HTTPException: http_exception_handler,
-            StarletteHTTPException: http_exception_handler,
-            WebSocketException: self.websocket_exception,
-        }
+        self._exception_handlers: Dict[Type[Exception], Callable] = CachedExceptionHandlers(
+            {
+                HTTPException: http_exception_handler,
+                StarletteHTTPException: http_exception_handler,
+                WebSocketException: self.websocket_exception,
+            }
+        )
         if handlers is not None:
             for key, value in handlers.items():
                 self.add_exception_handler(key, value)  # type: ignore
@@ -63,13 +72,6 @@ class ExceptionMiddleware(StarletteExceptionMiddleware):
         await wrap_app_handling_exceptions(self.app, conn)(scope, receive, send)
 
 
-class ResponseContent(BaseModel):
-    detail: Optional[str]
-    extra: Optional[Union[Dict[str, Any], List[Any]]] = None
-    headers: Optional[Dict[str, str]] = None
-    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
-
-
 class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
     def __init__(
         self,
@@ -79,7 +81,9 @@ class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
         error_handler: Optional[Callable] = None,
     ) -> None:
         self.app = app
-        self.exception_handlers = exception_handlers
+        self.exception_handlers: ExceptionHandlerMap = CachedExceptionHandlers(
+            exception_handlers or {}
+        )
         self.debug = debug
         self.error_handler = error_handler
 
@@ -87,27 +91,32 @@ class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
         try:
             await self.app(scope, receive, send)
         except Exception as ex:
-            if scope["type"] == ScopeType.HTTP:
-                exception_handler = (
-                    self.get_exception_handler(self.exception_handlers, ex)
-                    or self.default_http_exception_handler
-                )
-                response = exception_handler(Request(scope, receive, send), ex)
-                await response(scope, receive, send)
-                return
-
-            if isinstance(ex, WebSocketException):
-                code = ex.code
-                reason = ex.detail
-            elif isinstance(ex, StarletteHTTPException):
-                code = ex.status_code + 4000
-                reason = ex.detail
-            else:
-                code = status.HTTP_500_INTERNAL_SERVER_ERROR + 4000
-                reason = repr(ex)
-
-            event = {"type": "websocket.close", "code": code, "reason": reason}
-            await send(event)
+            await self.handle_exception(scope, receive, send, ex)
+
+    async def handle_exception(
+        self, scope: Scope, receive: Receive, send: Send, ex: Exception
+    ) -> None:
+        if scope["type"] == ScopeType.HTTP:
+            exception_handler = (
+                self.get_exception_handler(self.exception_handlers, ex)
+                or self.default_http_exception_handler
+            )
+            response = exception_handler(Request(scope, receive, send), ex)
+            await response(scope, receive, send)
+            return
+
+        if isinstance(ex, WebSocketException):
+            code = ex.code
+            reason = ex.detail
+        elif isinstance(ex, StarletteHTTPException):
+            code = ex.status_code + 4000
+            reason = ex.detail
+        else:
+            code = status.HTTP_500_INTERNAL_SERVER_ERROR + 4000
+            reason = repr(ex)
+
+        event = {"type": "websocket.close", "code": code, "reason": reason}
+        await send(event)
 
     def default_http_exception_handler(
         self, request: Request, exc: Exception
@@ -125,20 +134,16 @@ class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
 
     def create_exception_response(self, exc: Exception) -> Response:
         if isinstance(exc, (HTTPException, StarletteHTTPException)):
-            content = ResponseContent(detail=exc.detail, status_code=exc.status_code)
-            if isinstance(exc, HTTPException):
-                extra = exc.extra.get("extra", {})
-                if extra:
-                    content.extra = extra
-        else:
-            content = ResponseContent(detail=repr(exc))
-        return Response(
-            media_type=MediaType.JSON,
-            content=content.model_dump(exclude_none=True),
-            status_code=content.status_code,
-            headers=exc.headers
-            if isinstance(exc, (HTTPException, StarletteHTTPException))
-            else None,
+            extra = exc.extra.get("extra", {}) if isinstance(exc, HTTPException) else None
+            return error_response(
+                exc.status_code,
+                exc.detail,
+                headers=exc.headers,
+                extra=extra,
+                include_status_code=True,
+            )
+        return error_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR, repr(exc), include_status_code=True
         )
 
     def get_exception_handler(
@@ -146,16 +151,74 @@ class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
         exception_handlers: ExceptionHandlerMap,
         exc: Exception,
     ) -> Union[ExceptionHandler, None]:
+        """
+        Returns the handler of the closest class of the exception in the handlers, resolved
+        once per exception class for the handlers of the middleware.
+        """
         if not exception_handlers:
             return None
 
-        if not isinstance(exc, HTTPException) and exc.__class__ in exception_handlers:
-            return exception_handlers[exc.__class__]
-
-        if isinstance(exc, HTTPException) and exc.__class__ in exception_handlers:
-            return exception_handlers[exc.__class__]
+        if isinstance(exception_handlers, CachedExceptionHandlers):
+            return cast("Optional[ExceptionHandler]", exception_handlers.lookup(type(exc)))
 
         for klass in getmro(type(exc)):
             if klass in exception_handlers:
-                return exception_handlers[cast("Type[Exception]", exc)]
+                return exception_handlers[cast("Type[Exception]", klass)]
         return None
+
+
+class FusedExceptionMiddleware:
+    """
+    The `ExceptionMiddleware` and the `AsyncExitStackMiddleware` wrapping the router, and the
+    `EsmeraldAPIExceptionMiddleware` when no other middleware sits between them, fused in a
+    single ASGI layer.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        debug: bool,
+        exception_handlers: ExceptionHandlerMap,
+        async_exit_config: "AsyncExitConfig",
+        error_handler: Optional[Callable] = None,
+        catch_all: bool = True,
+    ) -> None:
+        self.app = app
+        self.async_exit_config = async_exit_config
+        self.exception_middleware = ExceptionMiddleware(
+            app, handlers=exception_handlers, debug=debug
+        )
+        self.api_exception_middleware: Optional[EsmeraldAPIExceptionMiddleware] = None
+        if catch_all:
+            self.api_exception_middleware = EsmeraldAPIExceptionMiddleware(
+                app, debug, exception_handlers, error_handler
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.api_exception_middleware is None:
+            await self.handle(scope, receive, send)
+            return
+        try:
+            await self.handle(scope, receive, send)
+        except Exception as ex:
+            await self.api_exception_middleware.handle_exception(scope, receive, send, ex)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        middleware = self.exception_middleware
+        scope["starlette.exception_handlers"] = (
+            middleware._exception_handlers,
+            middleware._status_handlers,
+        )
+        conn: Union[Request, WebSocket]
+        if scope["type"] == "http":
+            conn = Request(scope, receive, send)
+        else:
+            conn = WebSocket(scope, receive, send)
+        await wrap_app_handling_exceptions(self.call_app, conn)(scope, receive, send)
+
+    async def call_app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await call_with_exit_stack(self.app, self.async_exit_config, scope, receive, send)
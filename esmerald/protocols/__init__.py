@@ -1,9 +1,11 @@
 from .asyncdao import AsyncDAOProtocol
+from .cache import CacheBackendProtocol
 from .dao import DaoProtocol
 from .middleware import MiddlewareProtocol
 
 __all__ = [
     "AsyncDAOProtocol",
+    "CacheBackendProtocol",
     "DaoProtocol",
     "MiddlewareProtocol",
 ]
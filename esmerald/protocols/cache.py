@@ -0,0 +1,26 @@
+from typing import Any, Optional
+
+from typing_extensions import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class CacheBackendProtocol(Protocol):  # pragma: no cover
+    """
+    Generic object storing the responses cached by the `cache` of the handlers.
+
+    The values are `esmerald.cache.CachedResponse` objects. Backends storing bytes, for
+    instance Redis or Memcached, can use `CachedResponse.encode()` and
+    `CachedResponse.decode()`.
+    """
+
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    async def delete(self, key: str) -> None:
+        ...
+
+    async def clear(self) -> None:
+        ...
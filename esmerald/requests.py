@@ -1,7 +1,5 @@
-# from json import loads
 from typing import TYPE_CHECKING, Any, cast
 
-from orjson import loads
 from starlette.datastructures import URL  # noqa
 from starlette.requests import ClientDisconnect as ClientDisconnect  # noqa
 from starlette.requests import HTTPConnection as HTTPConnection  # noqa: F401
@@ -9,6 +7,7 @@ from starlette.requests import Request as StarletteRequest  # noqa: F401
 from starlette.requests import empty_receive, empty_send  # noqa
 from starlette.types import Receive, Scope, Send
 
+from esmerald.encoders import get_json_engine
 from esmerald.typing import Void
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -55,13 +54,18 @@ class Request(StarletteRequest):
         ), "RequestSettingsMiddleware must be added to the middlewares"
         return cast("EsmeraldAPISettings", self.scope["app_settings"])
 
+    async def json_body(self) -> bytes:
+        """
+        The raw body to decode as JSON, `null` when the body is empty.
+        """
+        if "_body" in self.scope:
+            return cast(bytes, self.scope["_body"])
+        body = self.scope["_body"] = await self.body() or b"null"
+        return body
+
     async def json(self) -> Any:
         if self._json is Void:
-            if "_body" in self.scope:
-                body = self.scope["_body"]
-            else:
-                body = self.scope["_body"] = await self.body() or b"null"
-            self._json = loads(body)
+            self._json = get_json_engine().loads(await self.json_body())
         return self._json
 
     def url_for(self, __name: str, **path_params: Any) -> Any:
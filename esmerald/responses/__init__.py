@@ -7,7 +7,7 @@ from .base import (
     StarletteResponse,
     StreamingResponse,
 )
-from .template import TemplateResponse
+from .template import StreamingTemplateResponse, TemplateResponse
 
 __all__ = [
     "FileResponse",
@@ -17,5 +17,6 @@ __all__ = [
     "Response",
     "StarletteResponse",
     "StreamingResponse",
+    "StreamingTemplateResponse",
     "TemplateResponse",
 ]
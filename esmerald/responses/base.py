@@ -1,12 +1,6 @@
-import dataclasses
-from dataclasses import is_dataclass
-from json import dumps
 from typing import TYPE_CHECKING, Any, Dict, Generic, NoReturn, Optional, TypeVar, Union, cast
 
-import msgspec
-from pydantic import BaseModel
 from starlette import status
-from starlette.responses import FileResponse as FileResponse  # noqa
 from starlette.responses import HTMLResponse as HTMLResponse  # noqa
 from starlette.responses import JSONResponse as JSONResponse  # noqa
 from starlette.responses import PlainTextResponse as PlainTextResponse  # noqa
@@ -15,8 +9,10 @@ from starlette.responses import Response as StarletteResponse  # noqa
 from starlette.responses import StreamingResponse as StreamingResponse  # noqa
 from typing_extensions import Annotated, Doc
 
+from esmerald.encoders import encode_default, get_json_engine
 from esmerald.enums import MediaType
 from esmerald.exceptions import ImproperlyConfigured
+from esmerald.responses.file import FileResponse as FileResponse  # noqa
 
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.backgound import BackgroundTask, BackgroundTasks
@@ -137,19 +133,14 @@ class Response(StarletteResponse, Generic[T]):
         self.cookies = cookies or []
 
     @staticmethod
-    def transform(value: Any) -> Dict[str, Any]:
+    def transform(value: Any) -> Any:
         """
         The transformation of the data being returned.
 
-        It supports Pydantic models, `dataclasses` and `msgspec.Struct`.
+        It supports Pydantic models, `dataclasses`, `msgspec.Struct`, the types registered via
+        `esmerald.encoders.register_encoder` and the types Pydantic knows how to serialise.
         """
-        if isinstance(value, BaseModel):
-            return value.model_dump()
-        if is_dataclass(value):
-            return dataclasses.asdict(value)
-        if isinstance(value, msgspec.Struct):
-            return msgspec.structs.asdict(value)
-        raise TypeError("unsupported type")  # pragma: no cover
+        return encode_default(value)
 
     def render(self, content: Any) -> bytes:
         try:
@@ -163,8 +154,10 @@ class Response(StarletteResponse, Generic[T]):
                 )
             ):
                 return b""
+            if isinstance(content, bytes):
+                return content
             if self.media_type == MediaType.JSON:
-                return dumps(content, default=self.transform, ensure_ascii=False).encode("utf-8")
+                return get_json_engine().dumps(content, default=self.transform)
             return super().render(content)
         except (AttributeError, ValueError, TypeError) as e:  # pragma: no cover
             raise ImproperlyConfigured("Unable to serialize response content") from e
@@ -1,8 +1,17 @@
-from typing import Any
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from inspect import Signature
+from typing import Any, Callable, Dict, Iterator, NoReturn, Optional, Type
+from uuid import UUID
 
+import msgspec
+from pydantic import TypeAdapter
+from pydantic_core import PydanticSerializationError
 from starlette.responses import JSONResponse as JSONResponse
 
+from esmerald.encoders import ENCODERS, encode_default, get_json_engine
 from esmerald.responses.json import BaseJSONResponse
+from esmerald.utils.helpers import is_class_and_subclass
 
 try:
     import orjson
@@ -42,3 +51,92 @@ class UJSONResponse(BaseJSONResponse):
     def render(self, content: Any) -> bytes:
         assert ujson is not None, "You must install the encoders or ujson to use UJSONResponse"
         return ujson.dumps(content, ensure_ascii=False).encode("utf-8")
+
+
+UNTYPED_SCHEMAS = frozenset(["any", "is-instance", "is-subclass", "callable"])
+
+SCHEMA_TYPES: Dict[str, Type[Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "bytes": bytes,
+    "date": date,
+    "datetime": datetime,
+    "time": time,
+    "timedelta": timedelta,
+    "decimal": Decimal,
+    "uuid": UUID,
+    "list": list,
+    "tuple": tuple,
+    "set": set,
+    "frozenset": frozenset,
+    "dict": dict,
+}
+
+
+def walk_schema(schema: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Yields every schema nested in a pydantic core schema.
+    """
+    if isinstance(schema, dict):
+        if "type" in schema:
+            yield schema
+        for value in schema.values():
+            yield from walk_schema(value)
+    elif isinstance(schema, (list, tuple)):
+        for value in schema:
+            yield from walk_schema(value)
+
+
+def is_fully_typed(adapter: TypeAdapter) -> bool:
+    """
+    Checks that the annotation describes all of its content, with no `Any` nor arbitrary
+    type, and that none of its types has an encoder registered with `register_encoder`.
+    """
+    for schema in walk_schema(adapter.core_schema):
+        if schema["type"] in UNTYPED_SCHEMAS:
+            return False
+        if ENCODERS:
+            type_ = schema.get("cls", SCHEMA_TYPES.get(schema["type"]))
+            if isinstance(type_, type) and any(
+                issubclass(type_, registered) for registered in ENCODERS
+            ):
+                return False
+    return True
+
+
+def create_response_encoder(annotation: Any) -> Optional[Callable[[Any], bytes]]:
+    """
+    Builds a JSON encoder specialised for the return annotation of a handler.
+
+    `msgspec.Struct` annotations are encoded with a `msgspec.json.Encoder` and everything
+    else Pydantic knows how to serialise with a `TypeAdapter`. Returns `None` when the
+    annotation does not describe all of its content (`Any`, arbitrary types, types with a
+    registered encoder) or cannot be compiled, leaving it to the JSON engine of the
+    application. The content the `TypeAdapter` cannot serialise, not matching the
+    annotation, is also rendered by the JSON engine.
+    """
+    if annotation in (Signature.empty, Any, None, NoReturn, bytes, type(None)):
+        return None
+
+    if is_class_and_subclass(annotation, msgspec.Struct):
+        return msgspec.json.Encoder(enc_hook=encode_default).encode
+
+    try:
+        adapter: TypeAdapter = TypeAdapter(annotation)
+    except Exception:  # noqa
+        return None
+
+    if not is_fully_typed(adapter):
+        return None
+
+    def encode(content: Any) -> bytes:
+        try:
+            return adapter.dump_json(content, warnings=False, serialize_as_any=True)
+        except PydanticSerializationError:
+            # The content does not match the annotation and holds values Pydantic cannot
+            # serialise, the JSON engine of the application renders it instead.
+            return get_json_engine().dumps(content)
+
+    return encode
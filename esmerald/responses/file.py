@@ -0,0 +1,287 @@
+import mmap
+import os
+import stat
+from email.utils import parsedate_to_datetime
+from secrets import token_hex
+from typing import Any, List, Optional, Tuple
+
+import anyio
+from starlette import status
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse as StarletteFileResponse
+from starlette.types import Receive, Scope, Send
+
+PATHSEND = "http.response.pathsend"
+MAX_RANGES = 16
+
+
+def parse_range_header(value: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parses a `Range` header into the sorted and merged `(start, end)` byte windows, the end
+    being exclusive, for a file of the given size.
+
+    Returns `None` when the header is invalid or asks for too many ranges, in which case it
+    is ignored, and an empty list when none of the ranges is satisfiable.
+    """
+    unit, _, specs = value.partition("=")
+    if unit.strip().lower() != "bytes" or not specs:
+        return None
+
+    ranges: List[Tuple[int, int]] = []
+    items = specs.split(",")
+    if len(items) > MAX_RANGES:
+        return None
+
+    for item in items:
+        first, dash, last = item.strip().partition("-")
+        if not dash:
+            return None
+        try:
+            if not first:
+                suffix = int(last)
+                if suffix <= 0:
+                    continue
+                start, end = max(size - suffix, 0), size
+            else:
+                start = int(first)
+                end = int(last) + 1 if last else size
+                if last and end <= start:
+                    return None
+        except ValueError:
+            return None
+        if start < size:
+            ranges.append((start, min(end, size)))
+
+    ranges.sort()
+    merged: List[Tuple[int, int]] = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class FileResponse(StarletteFileResponse):
+    """
+    Sends a file to the client.
+
+    The `Range` requests are answered with the requested byte windows only, with a
+    `206 Partial Content` (a `multipart/byteranges` body for many ranges) or a
+    `416 Range Not Satisfiable`. A `Range` with an `If-Range` not matching the `ETag` or the
+    `Last-Modified` of the file is ignored.
+
+    With `zero_copy=True`, the file is handed over to the server via the ASGI
+    `http.response.pathsend` extension, when the server advertises it, so it can send it
+    without going through Python at all, for instance with `sendfile`. Otherwise, the file is
+    memory mapped and sent in chunks of `mmap_chunk_size`.
+
+    !!! Warning
+        The middleware wrapping the responses sent with `http.response.pathsend` must
+        forward that message. The `BaseHTTPMiddleware` of Starlette does not.
+    """
+
+    mmap_chunk_size = 1024 * 1024
+
+    def __init__(self, *args: Any, zero_copy: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.zero_copy = zero_copy
+
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        super().set_stat_headers(stat_result)
+        self.headers.setdefault("accept-ranges", "bytes")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        range_header: Optional[str] = None
+        if self.status_code == status.HTTP_200_OK:
+            range_header = Headers(scope=scope).get("range")
+
+        if not self.zero_copy and range_header is None:
+            await super().__call__(scope, receive, send)
+            return
+
+        if self.stat_result is None:
+            try:
+                stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+            except FileNotFoundError as e:
+                raise RuntimeError(f"File at path {self.path} does not exist.") from e
+            if not stat.S_ISREG(stat_result.st_mode):
+                raise RuntimeError(f"File at path {self.path} is not a file.")
+            self.set_stat_headers(stat_result)
+            self.stat_result = stat_result
+
+        ranges = self.get_ranges(range_header, scope) if range_header is not None else None
+        if ranges is None:
+            await self.send_file(scope, send)
+        elif not ranges:
+            await self.send_range_not_satisfiable(send)
+        elif len(ranges) == 1:
+            await self.send_range(send, *ranges[0])
+        else:
+            await self.send_multipart_ranges(send, ranges)
+
+        if self.background is not None:
+            await self.background()
+
+    def get_ranges(self, range_header: str, scope: Scope) -> Optional[List[Tuple[int, int]]]:
+        """
+        Returns the byte windows of the `Range` of the request or `None` when the whole file
+        must be sent.
+        """
+        if_range = Headers(scope=scope).get("if-range")
+        if if_range is not None and not self.matches_if_range(if_range):
+            return None
+        size = self.stat_result.st_size if self.stat_result is not None else 0
+        return parse_range_header(range_header, size)
+
+    def matches_if_range(self, if_range: str) -> bool:
+        """
+        Checks if the `If-Range` of the request matches the file. ETags use the strong
+        comparison and dates must be the exact `Last-Modified` of the file.
+        """
+        if if_range.startswith("W/"):
+            return False
+        if if_range.startswith('"'):
+            etag = self.headers.get("etag", "")
+            return not etag.startswith("W/") and etag.strip('"') == if_range.strip('"')
+
+        last_modified = self.headers.get("last-modified")
+        if last_modified is None:
+            return False
+        try:
+            return parsedate_to_datetime(if_range) == parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError):
+            return False
+
+    async def send_file(self, scope: Scope, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if self.send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif PATHSEND in scope.get("extensions", {}):
+            await send({"type": PATHSEND, "path": os.path.abspath(self.path)})
+        else:
+            await self.send_mapped(send)
+
+    async def send_range_not_satisfiable(self, send: Send) -> None:
+        size = self.stat_result.st_size if self.stat_result is not None else 0
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                "headers": [
+                    (b"content-range", f"bytes */{size}".encode("latin-1")),
+                    (b"content-length", b"0"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def send_range(self, send: Send, start: int, end: int) -> None:
+        size = self.stat_result.st_size if self.stat_result is not None else 0
+        headers = self.get_partial_headers(end - start)
+        headers.append((b"content-range", f"bytes {start}-{end - 1}/{size}".encode("latin-1")))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_206_PARTIAL_CONTENT,
+                "headers": headers,
+            }
+        )
+        if self.send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        else:
+            await self.send_mapped(send, start, end)
+
+    async def send_multipart_ranges(self, send: Send, ranges: List[Tuple[int, int]]) -> None:
+        size = self.stat_result.st_size if self.stat_result is not None else 0
+        boundary = token_hex(16)
+        content_type = self.headers.get("content-type", self.media_type)
+        part_headers = [
+            (
+                f"--{boundary}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end - 1}/{size}\r\n\r\n"
+            ).encode("latin-1")
+            for start, end in ranges
+        ]
+        closing = f"--{boundary}--\r\n".encode("latin-1")
+        content_length = sum(
+            len(part) + end - start + 2 for part, (start, end) in zip(part_headers, ranges)
+        ) + len(closing)
+
+        headers = [
+            (key, value)
+            for key, value in self.get_partial_headers(content_length)
+            if key != b"content-type"
+        ]
+        headers.append(
+            (b"content-type", f"multipart/byteranges; boundary={boundary}".encode("latin-1"))
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_206_PARTIAL_CONTENT,
+                "headers": headers,
+            }
+        )
+        if self.send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        mapped = await anyio.to_thread.run_sync(self.open_mapped)
+        try:
+            for part, (start, end) in zip(part_headers, ranges):
+                await send({"type": "http.response.body", "body": part, "more_body": True})
+                await self.send_chunks(send, mapped, start, end, more_body=True)
+                await send({"type": "http.response.body", "body": b"\r\n", "more_body": True})
+        finally:
+            mapped.close()
+        await send({"type": "http.response.body", "body": closing, "more_body": False})
+
+    def get_partial_headers(self, content_length: int) -> List[Tuple[bytes, bytes]]:
+        headers = [(key, value) for key, value in self.raw_headers if key != b"content-length"]
+        headers.append((b"content-length", str(content_length).encode("latin-1")))
+        return headers
+
+    async def send_mapped(self, send: Send, start: int = 0, end: Optional[int] = None) -> None:
+        """
+        Sends the bytes of the file from `start` to `end` in chunks read from a memory map
+        of the file.
+        """
+        size = self.stat_result.st_size if self.stat_result is not None else 0
+        end = size if end is None else end
+        if end <= start:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        mapped = await anyio.to_thread.run_sync(self.open_mapped)
+        try:
+            await self.send_chunks(send, mapped, start, end)
+        finally:
+            mapped.close()
+
+    async def send_chunks(
+        self, send: Send, mapped: mmap.mmap, start: int, end: int, more_body: bool = False
+    ) -> None:
+        position = start
+        while position < end:
+            chunk_end = min(position + self.mmap_chunk_size, end)
+            chunk = await anyio.to_thread.run_sync(mapped.__getitem__, slice(position, chunk_end))
+            position = chunk_end
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": more_body or position < end,
+                }
+            )
+
+    def open_mapped(self) -> mmap.mmap:
+        with open(self.path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
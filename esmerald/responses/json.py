@@ -1,9 +1,6 @@
-import dataclasses
-from dataclasses import is_dataclass
-from typing import Any, Dict
-
-from pydantic import BaseModel
+from typing import Any
 
+from esmerald.encoders import encode_default
 from esmerald.responses import JSONResponse as JSONResponse  # noqa
 
 
@@ -13,13 +10,9 @@ class BaseJSONResponse(JSONResponse):
     """
 
     @staticmethod
-    def transform(value: Any) -> Dict[str, Any]:  # pragma: no cover
+    def transform(value: Any) -> Any:  # pragma: no cover
         """
         Makes sure that every value is checked and if it's a pydantic model then parses into
         a dict().
         """
-        if isinstance(value, BaseModel):
-            return value.model_dump()
-        if is_dataclass(value):
-            return dataclasses.asdict(value)
-        raise TypeError("unsupported type")
+        return encode_default(value)
@@ -1,11 +1,11 @@
 from mimetypes import guess_type
 from pathlib import PurePath
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, Optional, Union
 
 from starlette.types import Receive, Scope, Send
 
 from esmerald.enums import MediaType
-from esmerald.responses.base import Response
+from esmerald.responses.base import Response, StreamingResponse
 
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.backgound import BackgroundTask, BackgroundTasks
@@ -13,6 +13,21 @@ if TYPE_CHECKING:  # pragma: no cover
     from esmerald.types import ResponseCookies
 
 
+def get_template_media_type(template_name: str, media_type: Union[MediaType, str]) -> str:
+    """
+    Guesses the media type from the suffixes of the template name when the media type is the
+    default JSON.
+    """
+    if media_type != MediaType.JSON:
+        return media_type
+
+    for suffix in PurePath(template_name).suffixes:
+        _type = guess_type("name" + suffix)[0]
+        if _type:
+            return _type
+    return MediaType.TEXT  # pragma: no cover
+
+
 class TemplateResponse(Response):
     def __init__(
         self,
@@ -25,16 +40,7 @@ class TemplateResponse(Response):
         cookies: Optional["ResponseCookies"] = None,
         media_type: Union[MediaType, str] = MediaType.HTML,
     ):
-        if media_type == MediaType.JSON:  # we assume this is the default
-            suffixes = PurePath(template_name).suffixes
-            for suffix in suffixes:
-                _type = guess_type("name" + suffix)[0]
-                if _type:
-                    media_type = _type
-                    break
-            else:
-                media_type = MediaType.TEXT  # pragma: no cover
-
+        media_type = get_template_media_type(template_name, media_type)
         self.template = template_engine.get_template(template_name)
         self.context = context or {}
         content = self.template.render(**context)
@@ -61,3 +67,61 @@ class TemplateResponse(Response):
                 }
             )
         await super().__call__(scope, receive, send)
+
+
+class StreamingTemplateResponse(StreamingResponse):
+    """
+    Sends the template in chunks while it is rendered, so large pages start arriving before
+    the rendering finishes.
+
+    Jinja templates are rendered with `generate_async()`, or `generate()` in a thread when
+    the engine does not provide async templates. The templates of the engines not able to
+    render in chunks, such as Mako, are rendered at once.
+    """
+
+    def __init__(
+        self,
+        template_name: str,
+        template_engine: "TemplateEngineProtocol",
+        status_code: int = 200,
+        context: Optional[Dict[str, Any]] = None,
+        background: Optional[Union["BackgroundTask", "BackgroundTasks"]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        media_type: Union[MediaType, str] = MediaType.HTML,
+    ):
+        get_async_template = getattr(template_engine, "get_async_template", None)
+        if get_async_template is not None:
+            self.template = get_async_template(template_name)
+        else:
+            self.template = template_engine.get_template(template_name)
+        self.context = context or {}
+        super().__init__(
+            content=self.generate(),
+            status_code=status_code,
+            headers=headers,
+            media_type=get_template_media_type(template_name, media_type),
+            background=background,
+        )
+
+    def generate(self) -> Union[AsyncIterator[str], Iterator[str]]:
+        environment = getattr(self.template, "environment", None)
+        if environment is not None and environment.is_async:
+            return self.template.generate_async(**self.context)  # type: ignore[no-any-return]
+        if getattr(self.template, "generate", None) is not None:
+            return self.template.generate(**self.context)  # type: ignore[no-any-return]
+        return iter([self.template.render(**self.context)])
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:  # pragma: no cover
+        request = self.context.get("request", {})
+        extensions = request.get("extensions", {})
+        if "http.response.template" in extensions:
+            await send(
+                {
+                    "type": "http.response.template",
+                    "template": self.template,
+                    "context": self.context,
+                }
+            )
+        await super().__call__(scope, receive, send)
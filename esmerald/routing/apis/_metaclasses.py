@@ -76,8 +76,12 @@ class ListAPIMeta(SimpleAPIMeta):
         if not hasattr(view, "__filtered_handlers__"):
             return view
 
+        from esmerald.datastructures import JSONStream
+
         for handler_name in view.__filtered_handlers__:
             for base in view.__bases__:
                 attribute = getattr(view, handler_name)
-                view.is_signature_valid(handler_name, base, attribute, signature_type=list)
+                view.is_signature_valid(
+                    handler_name, base, attribute, signature_type=(list, JSONStream)
+                )
         return view
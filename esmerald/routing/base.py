@@ -11,8 +11,11 @@ from typing import (
     Callable,
     Dict,
     List,
+    Mapping,
     Optional,
+    Sequence,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -20,27 +23,38 @@ from typing import (
 )
 from uuid import UUID
 
+import anyio
 from starlette.convertors import CONVERTOR_TYPES
+from starlette.datastructures import Headers
 from starlette.requests import HTTPConnection
 from starlette.responses import Response as StarletteResponse
 from starlette.routing import Mount as Mount  # noqa
 from starlette.routing import compile_path
-from starlette.types import Receive, Scope, Send
 from typing_extensions import TypedDict
 
 from esmerald.backgound import BackgroundTask, BackgroundTasks
-from esmerald.datastructures import ResponseContainer
+from esmerald.cache import CachedResponse, RequestCoalescing, ResponseCache
+from esmerald.core.di.cache import PendingCall
+from esmerald.datastructures import ResponseContainer, ResponseHeader
 from esmerald.enums import MediaType
 from esmerald.exceptions import ImproperlyConfigured
 from esmerald.injector import Inject
 from esmerald.permissions.utils import continue_or_raise_permission_exception
 from esmerald.requests import Request
 from esmerald.responses import JSONResponse, Response
+from esmerald.responses.encoders import create_response_encoder
 from esmerald.routing.apis.base import View
 from esmerald.transformers.model import TransformerModel
 from esmerald.transformers.signature import SignatureFactory
 from esmerald.transformers.utils import get_signature
 from esmerald.typing import Void, VoidType
+from esmerald.utils.conditional import (
+    etag_matches,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    quote_etag,
+)
 from esmerald.utils.constants import DATA, PAYLOAD
 from esmerald.utils.helpers import is_async_callable, is_class_and_subclass
 from esmerald.utils.sync import AsyncCallable
@@ -49,7 +63,6 @@ if TYPE_CHECKING:  # pragma: no cover
     from openapi_schemas_pydantic.v3_1_0.security_scheme import SecurityScheme
 
     from esmerald.applications import Esmerald
-    from esmerald.interceptors.interceptor import EsmeraldInterceptor
     from esmerald.interceptors.types import Interceptor
     from esmerald.permissions import BasePermission
     from esmerald.permissions.types import Permission
@@ -57,7 +70,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from esmerald.types import (
         APIGateHandler,
         AsyncAnyCallable,
+        CompressionType,
         Dependencies,
+        ETagCallable,
         ResponseCookies,
         ResponseHeaders,
     )
@@ -78,6 +93,8 @@ param_type_map = {
 
 CONV2TYPE = {conv: typ for typ, conv in CONVERTOR_TYPES.items()}
 
+CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
+
 
 T = TypeVar("T", bound="BaseHandlerMixin")
 
@@ -157,25 +174,29 @@ class BaseResponseHandler:
     def response_container_handler(
         self,
         cookies: "ResponseCookies",
-        headers: Dict[str, Any],
+        headers: "ResponseHeaders",
         media_type: str,
         status_code: int,
     ) -> "AsyncAnyCallable":
         """Creates a handler for ResponseContainer Types"""
+        handler_headers = self.get_headers(headers)
+        raw_cookies = self.get_raw_cookies(cookies)
 
         async def response_content(
             data: ResponseContainer, app: Type["Esmerald"], **kwargs: Dict[str, Any]
         ) -> StarletteResponse:
-            _headers = {**self.get_headers(headers), **data.headers}
-            _cookies = self.get_cookies(data.cookies, cookies)
+            _headers = {**handler_headers, **data.headers} if data.headers else handler_headers
             response: Response = data.to_response(
                 app=app,
                 headers=_headers,
                 status_code=status_code,
                 media_type=media_type,
             )
-            for cookie in _cookies:
-                response.set_cookie(**cookie)
+            if data.cookies:
+                for cookie in self.get_cookies(data.cookies, cookies):
+                    response.set_cookie(**cookie)
+            else:
+                response.raw_headers.extend(raw_cookies)
             return response
 
         return response_content
@@ -187,16 +208,16 @@ class BaseResponseHandler:
         status_code: Optional[int] = None,
         media_type: Optional[str] = MediaType.TEXT,
     ) -> "AsyncAnyCallable":
-        async def response_content(data: Response, **kwargs: Dict[str, Any]) -> StarletteResponse:
-            _cookies = self.get_cookies(data.cookies, cookies)
-            _headers = {
-                **self.get_headers(headers),
-                **data.headers,
-                **self.allow_header,
-            }
+        raw_headers = self.get_raw_headers(headers or {})
+        raw_cookies = self.get_raw_cookies(cookies)
+        raw_allow_header = self.get_raw_headers(self.allow_header)
 
-            for cookie in _cookies:
-                data.set_cookie(**cookie)
+        async def response_content(data: Response, **kwargs: Dict[str, Any]) -> StarletteResponse:
+            if data.cookies:
+                for cookie in self.get_cookies(data.cookies, cookies):
+                    data.set_cookie(**cookie)
+            else:
+                data.raw_headers.extend(raw_cookies)
 
             if status_code:
                 data.status_code = status_code
@@ -204,8 +225,7 @@ class BaseResponseHandler:
             if media_type:
                 data.media_type = media_type
 
-            for header, value in _headers.items():
-                data.headers[header] = value
+            self.merge_raw_headers(data, raw_headers, raw_allow_header)
             return data
 
         return response_content
@@ -217,19 +237,13 @@ class BaseResponseHandler:
         headers: Optional["ResponseHeaders"] = None,
     ) -> "AsyncAnyCallable":
         """Creates a handler function for Esmerald JSON responses"""
+        raw_headers = self.get_raw_headers(headers or {})
+        raw_cookies = self.get_raw_cookies(cookies or [])
+        raw_allow_header = self.get_raw_headers(self.allow_header)
 
         async def response_content(data: Response, **kwargs: Dict[str, Any]) -> StarletteResponse:
-            _cookies = self.get_cookies(cookies, [])
-            _headers = {
-                **self.get_headers(headers),
-                **data.headers,
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)  # pragma: no cover
-
-            for header, value in _headers.items():
-                data.headers[header] = value
+            data.raw_headers.extend(raw_cookies)
+            self.merge_raw_headers(data, raw_headers, raw_allow_header)
 
             if status_code:
                 data.status_code = status_code
@@ -243,21 +257,15 @@ class BaseResponseHandler:
         headers: Optional["ResponseHeaders"] = None,
     ) -> "AsyncAnyCallable":
         """Creates an handler for Starlette Responses."""
+        raw_headers = self.get_raw_headers(headers or {})
+        raw_cookies = self.get_raw_cookies(cookies)
+        raw_allow_header = self.get_raw_headers(self.allow_header)
 
         async def response_content(
             data: StarletteResponse, **kwargs: Dict[str, Any]
         ) -> StarletteResponse:
-            _cookies = self.get_cookies(cookies, [])
-            _headers = {
-                **self.get_headers(headers),
-                **data.headers,
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)  # pragma: no cover
-
-            for header, value in _headers.items():
-                data.headers[header] = value
+            data.raw_headers.extend(raw_cookies)
+            self.merge_raw_headers(data, raw_headers, raw_allow_header)
             return data
 
         return response_content
@@ -266,109 +274,224 @@ class BaseResponseHandler:
         self,
         background: Optional[Union["BackgroundTask", "BackgroundTasks"]],
         cookies: "ResponseCookies",
-        headers: Dict[str, Any],
+        headers: "ResponseHeaders",
         media_type: str,
         response_class: Any,
         status_code: int,
+        encoder: Optional[Callable[[Any], bytes]] = None,
     ) -> "AsyncAnyCallable":
+        raw_headers = self.get_raw_headers(headers)
+        raw_cookies = self.get_raw_cookies(cookies)
+
         async def response_content(data: Any, **kwargs: Dict[str, Any]) -> StarletteResponse:
             data = await self.get_response_data(data=data)
-            _cookies = self.get_cookies(cookies, [])
             if isinstance(data, JSONResponse):
                 response = data
                 response.status_code = status_code
                 response.background = background
             else:
+                if encoder is not None and data is not None and not isinstance(data, bytes):
+                    data = encoder(data)
                 response = response_class(
                     background=background,
                     content=data,
-                    headers=headers,
                     media_type=media_type,
                     status_code=status_code,
                 )
+                if raw_headers:
+                    self.merge_raw_headers(response, overrides=raw_headers)
 
-            for cookie in _cookies:
-                response.set_cookie(**cookie)  # pragma: no cover
+            response.raw_headers.extend(raw_cookies)
             return response
 
         return response_content
 
-    async def get_response_for_request(
+    def get_conditional_response_handler(
         self,
-        scope: "Scope",
-        request: Request,
-        route: "HTTPHandler",
-        parameter_model: "TransformerModel",
-    ) -> "StarletteResponse":
-        response: Optional["StarletteResponse"] = None
-        if not response:
-            response = await self.call_handler_function(
-                scope=scope,
-                request=request,
-                route=route,
-                parameter_model=parameter_model,
-            )
+        get_response: Callable[[Request], Awaitable[StarletteResponse]],
+        etag: Union[bool, "ETagCallable"],
+    ) -> Callable[[Request], Awaitable[StarletteResponse]]:
+        """
+        Wraps the building of the response to answer the conditional `GET` and `HEAD`
+        requests with a `304 Not Modified` when the client has the current representation.
+
+        With `etag=True`, the ETag is computed from the rendered body. A callable computes
+        it from the request instead and, when it matches `If-None-Match`, the handler is
+        not called at all.
+        """
+        compute_etag = etag if callable(etag) else None
+        is_async = is_async_callable(compute_etag) if compute_etag is not None else False
+
+        async def conditional_response(request: Request) -> StarletteResponse:
+            if request.method not in CONDITIONAL_METHODS:
+                return await get_response(request)
+
+            tag: Optional[str] = None
+            if compute_etag is not None:
+                value = await compute_etag(request) if is_async else compute_etag(request)
+                if value is not None:
+                    tag = quote_etag(str(value))
+                    if_none_match = request.headers.get("if-none-match")
+                    if if_none_match is not None and etag_matches(tag, if_none_match):
+                        return not_modified_response(Headers({"etag": tag}))
+
+            response = await get_response(request)
+            if not 200 <= response.status_code < 300:
+                return response
+
+            if "etag" not in response.headers:
+                if compute_etag is None and getattr(response, "body", None) is not None:
+                    tag = make_etag(response.body)
+                if tag is not None:
+                    response.raw_headers.append((b"etag", tag.encode("latin-1")))
+
+            if is_not_modified(response.headers, request.headers):
+                return not_modified_response(response.headers, response.background)
+            return response
 
-        return response
+        return conditional_response
 
-    async def call_handler_function(
+    def get_cached_response_handler(
         self,
-        scope: "Scope",
-        request: Request,
-        route: "HTTPHandler",
-        parameter_model: "TransformerModel",
-    ) -> Any:
-        response_data = await self._get_response_data(
-            route=route,
-            parameter_model=parameter_model,
-            request=request,
-        )
+        get_response: Callable[[Request], Awaitable[StarletteResponse]],
+        cache: ResponseCache,
+    ) -> Callable[[Request], Awaitable[StarletteResponse]]:
+        """
+        Wraps the building of the response to serve it from the cache of the handler.
 
-        return await self.to_response(
-            app=scope["app"],
-            data=response_data,
-        )
+        The backend of the cache, when not declared, is the `response_cache_backend` of the
+        application.
+        """
+        ttl = cache.ttl
 
-    @staticmethod
-    async def _get_response_data(
-        route: "HTTPHandler", parameter_model: "TransformerModel", request: Request
-    ) -> Any:
+        async def cached_response(request: Request) -> StarletteResponse:
+            if not cache.can_lookup(request):
+                return await get_response(request)
+
+            cache_control = request.headers.get("cache-control", "").lower()
+            if "no-store" in cache_control:
+                return await get_response(request)
+
+            backend = cache.backend or request.scope["app"].response_cache_backend
+            key = cache.get_key(request)
+
+            if "no-cache" not in cache_control:
+                cached = await backend.get(key)
+                if cached is not None:
+                    return cast(CachedResponse, cached).to_response()
+
+            response = await get_response(request)
+            if cache.can_store(response):
+                await backend.set(key, CachedResponse.from_response(response), ttl)
+            return response
+
+        return cached_response
+
+    def get_coalesced_response_handler(
+        self,
+        get_response: Callable[[Request], Awaitable[StarletteResponse]],
+        coalescing: RequestCoalescing,
+    ) -> Callable[[Request], Awaitable[StarletteResponse]]:
+        """
+        Wraps the building of the response to share it across the identical concurrent
+        requests.
+
+        Only the requests in flight are tracked, the response is dropped as soon as the
+        leader completes.
+        """
+        in_flight: Dict[str, PendingCall] = {}
+        timeout = coalescing.timeout
+
+        async def coalesced_response(request: Request) -> StarletteResponse:
+            if not coalescing.can_coalesce(request):
+                return await get_response(request)
+
+            key = coalescing.get_key(request)
+            pending = in_flight.get(key)
+            if pending is not None:
+                with anyio.move_on_after(timeout):
+                    await pending.event.wait()
+                if pending.error is not None:
+                    raise pending.error
+                if pending.value is not Void:
+                    return cast(CachedResponse, pending.value).to_response()
+                return await get_response(request)
+
+            pending = in_flight[key] = PendingCall()
+            try:
+                response = await get_response(request)
+                if coalescing.can_share(response):
+                    pending.value = CachedResponse.from_response(response)
+            except Exception as e:
+                pending.error = e
+                raise
+            finally:
+                del in_flight[key]
+                pending.event.set()
+            return response
+
+        return coalesced_response
+
+    def get_response_data_handler(
+        self, parameter_model: "TransformerModel"
+    ) -> Callable[[Request], Awaitable[Any]]:
         """
-        Determines what kwargs are required for the given handler and assignes to the specific
-        object dictionary.
+        Builds the function calling the handler with the parameters extracted from the request.
+
+        Everything that does not depend on the request (the signature model, the handler
+        function and if it is async) is resolved once and the parameter extraction is
+        left out when the handler does not declare any.
         """
-        signature_model = get_signature(route)
-        is_data_or_payload: str = None
+        fn = cast("AnyCallable", self.fn)
+        if isinstance(self.parent, View):
+            fn = partial(fn, self.parent)
+        is_async = is_async_callable(fn)
+
+        if not parameter_model.has_kwargs:
+            if is_async:
+                return cast("Callable[[Request], Awaitable[Any]]", lambda request: fn())
+
+            async def call_sync(request: Request) -> Any:
+                return fn()
+
+            return call_sync
 
-        if parameter_model.has_kwargs:
-            kwargs = parameter_model.to_kwargs(connection=request, handler=route)
+        signature_model = get_signature(self)
+        concurrent = self.get_concurrent_dependencies()
+        handler = cast("HTTPHandler", self)
+
+        async def get_response_data(request: Request) -> Any:
+            kwargs = parameter_model.to_kwargs(connection=request, handler=handler)
 
             is_data_or_payload = DATA if kwargs.get(DATA) else PAYLOAD
             request_data = kwargs.get(DATA) or kwargs.get(PAYLOAD)
 
             if request_data:
                 kwargs[is_data_or_payload] = await request_data
-            for dependency in parameter_model.dependencies:
-                kwargs[dependency.key] = await parameter_model.get_dependencies(
-                    dependency=dependency, connection=request, **kwargs
-                )
+            await parameter_model.resolve_dependencies(
+                connection=request, kwargs=kwargs, concurrent=concurrent
+            )
             parsed_kwargs = signature_model.parse_values_for_connection(
                 connection=request, **kwargs
             )
-        else:
-            parsed_kwargs = {}
-        if isinstance(route.parent, View):
-            fn = partial(
-                cast("AnyCallable", route.fn),
-                route.parent,
-                **parsed_kwargs,
-            )
-        else:
-            fn = partial(cast("AnyCallable", route.fn), **parsed_kwargs)
+            if is_async:
+                return await fn(**parsed_kwargs)
+            return fn(**parsed_kwargs)
 
-        if is_async_callable(fn):
-            return await fn()
-        return fn()
+        return get_response_data
+
+    def get_response_encoder(
+        self, media_type: str, response_class: Any
+    ) -> Optional[Callable[[Any], bytes]]:
+        """
+        Compiles the encoder for the return annotation of the handler when the content is
+        rendered as JSON by the default `Response`.
+
+        Custom response classes keep their own rendering.
+        """
+        if media_type != MediaType.JSON or response_class is not Response:
+            return None
+        return create_response_encoder(self.signature.return_annotation)
 
     def get_response_handler(self) -> Callable[[Any], Awaitable[StarletteResponse]]:
         """
@@ -418,6 +541,7 @@ class BaseResponseHandler:
                     media_type=media_type,
                     response_class=response_class,
                     status_code=self.status_code,
+                    encoder=self.get_response_encoder(media_type, response_class),
                 )
             self._response_handler = handler
         return cast(
@@ -509,6 +633,61 @@ class BaseHandlerMixin(BaseSignature, BaseResponseHandler, OpenAPIDefinitionMixi
             )
         return cast("List[AsyncCallable]", self._permissions)
 
+    def get_concurrent_dependencies(self) -> bool:
+        """
+        Returns if the dependencies should be resolved concurrently, as set by the closest
+        application to the handler.
+        """
+        for layer in reversed(self.parent_levels):
+            value = getattr(layer, "enable_concurrent_dependencies", None)
+            if value is not None:
+                return cast(bool, value)
+        return False
+
+    def get_etag(self) -> Optional[Union[bool, "ETagCallable"]]:
+        """
+        Returns the `etag` of the closest layer declaring one, from the handler up to the
+        application.
+        """
+        for layer in reversed(self.parent_levels):
+            value = getattr(layer, "etag", None)
+            if value is not None:
+                return cast("Union[bool, ETagCallable]", value)
+        return None
+
+    def get_response_cache(self) -> Optional[ResponseCache]:
+        """
+        Returns the response cache of the closest layer declaring a `cache`, from the handler
+        up to the application.
+        """
+        for layer in reversed(self.parent_levels):
+            value = getattr(layer, "cache", None)
+            if value is not None:
+                return ResponseCache.from_value(value)
+        return None
+
+    def get_request_coalescing(self) -> Optional[RequestCoalescing]:
+        """
+        Returns the request coalescing of the closest layer declaring a `coalesce`, from the
+        handler up to the application.
+        """
+        for layer in reversed(self.parent_levels):
+            value = getattr(layer, "coalesce", None)
+            if value is not None:
+                return RequestCoalescing.from_value(value)
+        return None
+
+    def get_compression(self) -> Optional["CompressionType"]:
+        """
+        Returns the `compression` of the closest layer declaring one, from the handler up to
+        the application.
+        """
+        for layer in reversed(self.parent_levels):
+            value = getattr(layer, "compression", None)
+            if value is not None:
+                return cast("CompressionType", value)
+        return None
+
     def get_dependencies(self) -> "Dependencies":
         """
         Returns all dependencies of the handler function's starting from the parent levels.
@@ -566,6 +745,50 @@ class BaseHandlerMixin(BaseSignature, BaseResponseHandler, OpenAPIDefinitionMixi
         """
         return {k: v.value for k, v in headers.items()}
 
+    def get_raw_headers(
+        self, headers: Union["ResponseHeaders", Mapping[str, str]]
+    ) -> List[Tuple[bytes, bytes]]:
+        """
+        Renders the response headers, once, into raw ASGI headers.
+        """
+        raw_headers: List[Tuple[bytes, bytes]] = []
+        for key, header in headers.items():
+            value = header.value if isinstance(header, ResponseHeader) else header
+            if value is not None:
+                raw_headers.append((key.lower().encode("latin-1"), str(value).encode("latin-1")))
+        return raw_headers
+
+    def get_raw_cookies(self, cookies: "ResponseCookies") -> List[Tuple[bytes, bytes]]:
+        """
+        Renders the response cookies, once, into raw `set-cookie` headers.
+        """
+        response = StarletteResponse()
+        for cookie in self.get_cookies(cookies, []):
+            response.set_cookie(**cookie)
+        return [header for header in response.raw_headers if header[0] == b"set-cookie"]
+
+    @staticmethod
+    def merge_raw_headers(
+        response: StarletteResponse,
+        raw_headers: Sequence[Tuple[bytes, bytes]] = (),
+        overrides: Sequence[Tuple[bytes, bytes]] = (),
+    ) -> None:
+        """
+        Adds the raw headers the response does not have yet and replaces the ones of the
+        response with the `overrides`.
+        """
+        if overrides:
+            names = {key for key, _ in overrides}
+            response.raw_headers = [
+                header for header in response.raw_headers if header[0] not in names
+            ]
+        if raw_headers:
+            present = {key for key, _ in response.raw_headers}
+            response.raw_headers.extend(
+                header for header in raw_headers if header[0] not in present
+            )
+        response.raw_headers.extend(overrides)
+
     async def get_response_data(self, data: Any) -> Any:  # pragma: no cover
         """
         Retrives the response data for sync and async.
@@ -627,12 +850,3 @@ class BaseInterceptorMixin(BaseHandlerMixin):  # pragma: no cover
                 [AsyncCallable(interceptors) for interceptors in self._interceptors],
             )
         return cast("List[AsyncCallable]", self._interceptors)
-
-    async def intercept(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
-        """
-        Checks for every interceptor on each level and runs them all before reaching any
-        of the handlers.
-        """
-        for interceptor in self.get_interceptors():
-            awaitable: "EsmeraldInterceptor" = await interceptor()
-            await awaitable.intercept(scope, receive, send)
@@ -5,7 +5,7 @@ from starlette.middleware import Middleware as StarletteMiddleware
 from starlette.routing import Route as StarletteRoute
 from starlette.routing import WebSocketRoute as StarletteWebSocketRoute
 from starlette.routing import compile_path
-from starlette.types import Receive, Scope, Send
+from starlette.types import ASGIApp, Receive, Scope, Send
 from typing_extensions import Annotated, Doc
 
 from esmerald.routing.apis.base import View
@@ -17,10 +17,21 @@ from esmerald.utils.url import clean_path
 if TYPE_CHECKING:  # pragma: no cover
     from openapi_schemas_pydantic.v3_1_0.security_scheme import SecurityScheme
 
+    from esmerald.config.cors import CORSConfig
+    from esmerald.interceptors.interceptor import EsmeraldInterceptor
     from esmerald.interceptors.types import Interceptor
     from esmerald.permissions.types import Permission
     from esmerald.routing.router import HTTPHandler, WebhookHandler, WebSocketHandler
-    from esmerald.types import Dependencies, ExceptionHandlerMap, Middleware, ParentType
+    from esmerald.types import (
+        CompressionType,
+        Dependencies,
+        ETagCallable,
+        ExceptionHandlerMap,
+        Middleware,
+        ParentType,
+        RequestCoalescingType,
+        ResponseCacheType,
+    )
 
 
 class BaseRoute(StarletteRoute):
@@ -57,12 +68,68 @@ class BaseRoute(StarletteRoute):
             else:
                 self._middleware.append(StarletteMiddleware(middleware))  # type: ignore
 
-        for cls, options in reversed(self._middleware):
-            self.app = cls(app=self.app, **options)
-            self.is_middleware = True
+        self.is_middleware = bool(self._middleware)
+
+
+class GatewayPipelineMixin:
+    """
+    Builds the ASGI app of a gateway running the route middleware, the interceptors and
+    the handler, in this order.
+    """
+
+    _pipeline: Union["ASGIApp", VoidType]
+
+    def get_pipeline(self) -> "ASGIApp":
+        """
+        Returns the ASGI app of the gateway, building it on the first call.
+
+        The application builds the pipelines of its gateways once they are part of it, see
+        `Router.build_pipelines()`. Building it here only covers the gateways added to the
+        routes by other means.
+        """
+        if self._pipeline is Void:
+            self._pipeline = self.build_pipeline()
+        return cast("ASGIApp", self._pipeline)
+
+    def reset_pipeline(self) -> None:
+        """
+        Drops the ASGI app of the gateway and the interceptors and permissions resolved from
+        the parent layers, for them to be built again.
+        """
+        self._pipeline = Void
+        self._interceptors = Void
+        handler = self.handler  # type: ignore[attr-defined]
+        if hasattr(handler, "reset_pipeline"):
+            handler.reset_pipeline()
+
+    def build_pipeline(self) -> "ASGIApp":
+        """
+        Chains the stages of the gateway into a single ASGI app. The interceptors and
+        the route middleware are only part of it when declared.
+        """
+        handler = self.handler  # type: ignore[attr-defined]
+        app: "ASGIApp" = (
+            handler.get_pipeline() if hasattr(handler, "get_pipeline") else handler.handle
+        )
+
+        interceptors = self.get_interceptors()  # type: ignore[attr-defined]
+        if interceptors:
+            inner = app
+
+            async def intercept(scope: "Scope", receive: "Receive", send: "Send") -> None:
+                for interceptor in interceptors:
+                    awaitable: "EsmeraldInterceptor" = await interceptor()
+                    await awaitable.intercept(scope, receive, send)
+                await inner(scope, receive, send)
+
+            app = intercept
+
+        for cls, options in reversed(self._middleware):  # type: ignore[attr-defined]
+            app = cls(app=app, **options)
+        return app
 
 
-class Gateway(BaseRoute, BaseInterceptorMixin):
+class Gateway(GatewayPipelineMixin, BaseRoute, BaseInterceptorMixin):
     """
     `Gateway` object class used by Esmerald routes.
 
@@ -99,6 +166,11 @@ class Gateway(BaseRoute, BaseInterceptorMixin):
         "permissions",
         "deprecated",
         "tags",
+        "etag",
+        "cache",
+        "coalesce",
+        "compression",
+        "cors_config",
     )
 
     def __init__(
@@ -248,6 +320,114 @@ class Gateway(BaseRoute, BaseInterceptorMixin):
                 """
             ),
         ] = None,
+        etag: Annotated[
+            Optional[Union[bool, "ETagCallable"]],
+            Doc(
+                """
+                Enables the conditional `GET` requests for the handlers of the `Gateway`.
+
+                With `True`, a strong ETag is computed from the rendered body of the response.
+                A callable receiving the `Request` and returning the ETag (or `None`) can be
+                used instead and, when the ETag matches the `If-None-Match` of the request,
+                the handler is not called at all.
+
+                When the representation of the client is still current, a `304 Not Modified`
+                is returned without body.
+
+                **Example**
+
+                ```python
+                from esmerald import Gateway
+
+                Gateway(handler=home, etag=True)
+                ```
+                """
+            ),
+        ] = None,
+        cache: Annotated[
+            Optional["ResponseCacheType"],
+            Doc(
+                """
+                Caches the responses of the handlers of the `Gateway`. A cached response is sent
+                as is, skipping the dependencies, the validation and the handler itself.
+
+                A number is the time to live of the responses, in seconds, and `True` caches
+                them without expiry. An `esmerald.cache.ResponseCache` configures the query
+                parameters and the headers the key is built from, the backend and when the
+                cache is bypassed. `False` disables the cache of an upper level.
+
+                **Example**
+
+                ```python
+                from esmerald import Gateway
+
+                Gateway(handler=home, cache=60)
+                ```
+                """
+            ),
+        ] = None,
+        coalesce: Annotated[
+            Optional["RequestCoalescingType"],
+            Doc(
+                """
+                Coalesces the identical concurrent `GET` requests of the handlers of the
+                `Gateway` into a single execution, the other requests receiving a copy of its
+                response.
+
+                With `True`, the key is built from the method, the path and the query
+                parameters. An `esmerald.cache.RequestCoalescing` configures the query
+                parameters and the headers the key is built from and how long the requests
+                wait for the response. `False` disables the coalescing of an upper level.
+
+                **Example**
+
+                ```python
+                from esmerald import Gateway
+
+                Gateway(handler=home, coalesce=True)
+                ```
+                """
+            ),
+        ] = None,
+        compression: Annotated[
+            Optional["CompressionType"],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handlers of the `Gateway`. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                **Example**
+
+                ```python
+                from esmerald import Gateway
+                from esmerald.config import CompressionConfig
+
+                Gateway(handler=home, compression=CompressionConfig(levels={"br": 11}))
+                ```
+                """
+            ),
+        ] = None,
+        cors_config: Annotated[
+            Optional["CORSConfig"],
+            Doc(
+                """
+                Overrides the [CORSConfig](https://esmerald.dev/configurations/cors/) of the
+                application for the handlers of the `Gateway`. The override is applied by the
+                `CORSMiddleware` of the application, preflight requests included.
+
+                **Example**
+
+                ```python
+                from esmerald import Gateway
+                from esmerald.config import CORSConfig
+
+                Gateway(handler=home, cors_config=CORSConfig(allow_origins=["https://*.example.com"]))
+                ```
+                """
+            ),
+        ] = None,
     ) -> None:
         if not path:
             path = "/"
@@ -293,6 +473,11 @@ class Gateway(BaseRoute, BaseInterceptorMixin):
         self.response_headers = None
         self.deprecated = deprecated
         self.parent = parent
+        self.etag = etag
+        self.cache = cache
+        self.coalesce = coalesce
+        self.compression = compression
+        self.cors_config = cors_config
         self.security = security
         self.tags = tags or []
         (
@@ -301,6 +486,7 @@ class Gateway(BaseRoute, BaseInterceptorMixin):
             handler.param_convertors,
         ) = compile_path(self.path)
         self._middleware = []
+        self._pipeline: Union["ASGIApp", VoidType] = Void
         self.is_middleware: bool = False
 
         if not is_class_and_subclass(self.handler, View) and not isinstance(self.handler, View):
@@ -317,12 +503,7 @@ class Gateway(BaseRoute, BaseInterceptorMixin):
         """
         Handles the interception of messages and calls from the API.
         """
-        if self.is_middleware:
-            await self.app(scope, receive, send)
-
-        if self.get_interceptors():
-            await self.intercept(scope, receive, send)
-        await self.handler.handle(scope, receive, send)
+        await self.get_pipeline()(scope, receive, send)
 
     def generate_operation_id(self) -> str:
         """
@@ -337,7 +518,7 @@ class Gateway(BaseRoute, BaseInterceptorMixin):
         return operation_id
 
 
-class WebSocketGateway(StarletteWebSocketRoute, BaseInterceptorMixin):
+class WebSocketGateway(GatewayPipelineMixin, StarletteWebSocketRoute, BaseInterceptorMixin):
     """
     `WebSocketGateway` object class used by Esmerald routes.
 
@@ -522,6 +703,7 @@ class WebSocketGateway(StarletteWebSocketRoute, BaseInterceptorMixin):
         ) = compile_path(self.path)
 
         self._middleware: List["Middleware"] = []
+        self._pipeline: Union["ASGIApp", VoidType] = Void
         self.is_middleware: bool = False
 
     def handle_middleware(self) -> None:
@@ -536,21 +718,13 @@ class WebSocketGateway(StarletteWebSocketRoute, BaseInterceptorMixin):
             else:
                 self._middleware.append(StarletteMiddleware(middleware))  # type: ignore
 
-        for cls, options in reversed(self._middleware):
-            self.app = cls(app=self.app, **options)
-            self.is_middleware = True
+        self.is_middleware = bool(self._middleware)
 
     async def handle(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
         Handles the interception of messages and calls from the API.
         """
-        if self.is_middleware:
-            await self.app(scope, receive, send)
-
-        if self.get_interceptors():
-            await self.intercept(scope, receive, send)
-
-        await self.handler.handle(scope, receive, send)
+        await self.get_pipeline()(scope, receive, send)
 
 
 class WebhookGateway(StarletteRoute, BaseInterceptorMixin):
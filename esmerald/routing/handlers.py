@@ -10,9 +10,13 @@ from esmerald.permissions.types import Permission
 from esmerald.routing.router import HTTPHandler, WebSocketHandler
 from esmerald.types import (
     BackgroundTaskType,
+    CompressionType,
     Dependencies,
+    ETagCallable,
     ExceptionHandlerMap,
     Middleware,
+    RequestCoalescingType,
+    ResponseCacheType,
     ResponseCookies,
     ResponseHeaders,
     ResponseType,
@@ -395,6 +399,119 @@ class get(HTTPHandler):
                 """
             ),
         ] = None,
+        etag: Annotated[
+            Optional[Union[bool, ETagCallable]],
+            Doc(
+                """
+                Enables the conditional `GET` requests for the handler.
+
+                With `True`, a strong ETag is computed from the rendered body of the response.
+                A callable receiving the `Request` and returning the ETag (or `None`) can be
+                used instead and, when the ETag matches the `If-None-Match` of the request,
+                the handler is not called at all.
+
+                When the representation of the client is still current, a `304 Not Modified`
+                is returned without body.
+
+                It can also be set on the `Gateway` and `Include` levels.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+
+                @get(etag=True)
+                ```
+                """
+            ),
+        ] = None,
+        cache: Annotated[
+            Optional[ResponseCacheType],
+            Doc(
+                """
+                Caches the responses of the handler. A cached response is sent as is,
+                skipping the dependencies, the validation and the handler itself.
+
+                A number is the time to live of the responses, in seconds, and `True` caches
+                them without expiry. An `esmerald.cache.ResponseCache` configures the query
+                parameters and the headers the key is built from, the backend and when the
+                cache is bypassed. `False` disables the cache of an upper level.
+
+                It can also be set on the `Gateway` and `Include` levels.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+
+                @get(cache=60)
+                ```
+                """
+            ),
+        ] = None,
+        coalesce: Annotated[
+            Optional[RequestCoalescingType],
+            Doc(
+                """
+                Coalesces the identical concurrent `GET` requests of the handler into a
+                single execution, the other requests receiving a copy of its response.
+
+                With `True`, the key is built from the method, the path and the query
+                parameters. An `esmerald.cache.RequestCoalescing` configures the query
+                parameters and the headers the key is built from and how long the requests
+                wait for the response. `False` disables the coalescing of an upper level.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+
+                @get(coalesce=True)
+                ```
+                """
+            ),
+        ] = None,
+        compression: Annotated[
+            Optional[CompressionType],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handler. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+
+                @get(compression=False)
+                ```
+                """
+            ),
+        ] = None,
+        eager_exit_stack: Annotated[
+            bool,
+            Doc(
+                """
+                Hands the handler the `AsyncExitStack` of the request itself instead of the
+                `LazyAsyncExitStack` standing for it, when the application creates it lazily
+                via `AsyncExitConfig(lazy=True)`.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+
+                @get(eager_exit_stack=True)
+                ```
+                """
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             path=path,
@@ -420,6 +537,11 @@ class get(HTTPHandler):
             operation_id=operation_id,
             response_description=response_description,
             responses=responses,
+            etag=etag,
+            cache=cache,
+            coalesce=coalesce,
+            compression=compression,
+            eager_exit_stack=eager_exit_stack,
         )
 
 
@@ -658,6 +780,45 @@ class head(HTTPHandler):
                 """
             ),
         ] = None,
+        compression: Annotated[
+            Optional[CompressionType],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handler. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import head
+
+                @head(compression=False)
+                ```
+                """
+            ),
+        ] = None,
+        eager_exit_stack: Annotated[
+            bool,
+            Doc(
+                """
+                Hands the handler the `AsyncExitStack` of the request itself instead of the
+                `LazyAsyncExitStack` standing for it, when the application creates it lazily
+                via `AsyncExitConfig(lazy=True)`.
+
+                **Example**
+
+                ```python
+                from esmerald import head
+
+                @head(eager_exit_stack=True)
+                ```
+                """
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             path=path,
@@ -683,6 +844,8 @@ class head(HTTPHandler):
             operation_id=operation_id,
             response_description=response_description,
             responses=responses,
+            compression=compression,
+            eager_exit_stack=eager_exit_stack,
         )
 
 
@@ -921,6 +1084,45 @@ class options(HTTPHandler):
                 """
             ),
         ] = None,
+        compression: Annotated[
+            Optional[CompressionType],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handler. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import options
+
+                @options(compression=False)
+                ```
+                """
+            ),
+        ] = None,
+        eager_exit_stack: Annotated[
+            bool,
+            Doc(
+                """
+                Hands the handler the `AsyncExitStack` of the request itself instead of the
+                `LazyAsyncExitStack` standing for it, when the application creates it lazily
+                via `AsyncExitConfig(lazy=True)`.
+
+                **Example**
+
+                ```python
+                from esmerald import options
+
+                @options(eager_exit_stack=True)
+                ```
+                """
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             path=path,
@@ -946,6 +1148,8 @@ class options(HTTPHandler):
             operation_id=operation_id,
             response_description=response_description,
             responses=responses,
+            compression=compression,
+            eager_exit_stack=eager_exit_stack,
         )
 
 
@@ -1185,6 +1389,45 @@ class trace(HTTPHandler):  # pragma: no cover
                 """
             ),
         ] = None,
+        compression: Annotated[
+            Optional[CompressionType],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handler. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import trace
+
+                @trace(compression=False)
+                ```
+                """
+            ),
+        ] = None,
+        eager_exit_stack: Annotated[
+            bool,
+            Doc(
+                """
+                Hands the handler the `AsyncExitStack` of the request itself instead of the
+                `LazyAsyncExitStack` standing for it, when the application creates it lazily
+                via `AsyncExitConfig(lazy=True)`.
+
+                **Example**
+
+                ```python
+                from esmerald import trace
+
+                @trace(eager_exit_stack=True)
+                ```
+                """
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             path=path,
@@ -1210,6 +1453,8 @@ class trace(HTTPHandler):  # pragma: no cover
             operation_id=operation_id,
             response_description=response_description,
             responses=responses,
+            compression=compression,
+            eager_exit_stack=eager_exit_stack,
         )
 
 
@@ -1587,6 +1832,45 @@ class post(HTTPHandler):
                 """
             ),
         ] = None,
+        compression: Annotated[
+            Optional[CompressionType],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handler. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import post
+
+                @post(compression=False)
+                ```
+                """
+            ),
+        ] = None,
+        eager_exit_stack: Annotated[
+            bool,
+            Doc(
+                """
+                Hands the handler the `AsyncExitStack` of the request itself instead of the
+                `LazyAsyncExitStack` standing for it, when the application creates it lazily
+                via `AsyncExitConfig(lazy=True)`.
+
+                **Example**
+
+                ```python
+                from esmerald import post
+
+                @post(eager_exit_stack=True)
+                ```
+                """
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             path=path,
@@ -1612,6 +1896,8 @@ class post(HTTPHandler):
             operation_id=operation_id,
             response_description=response_description,
             responses=responses,
+            compression=compression,
+            eager_exit_stack=eager_exit_stack,
         )
 
 
@@ -1984,6 +2270,45 @@ class put(HTTPHandler):
                 """
             ),
         ] = None,
+        compression: Annotated[
+            Optional[CompressionType],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handler. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import put
+
+                @put(compression=False)
+                ```
+                """
+            ),
+        ] = None,
+        eager_exit_stack: Annotated[
+            bool,
+            Doc(
+                """
+                Hands the handler the `AsyncExitStack` of the request itself instead of the
+                `LazyAsyncExitStack` standing for it, when the application creates it lazily
+                via `AsyncExitConfig(lazy=True)`.
+
+                **Example**
+
+                ```python
+                from esmerald import put
+
+                @put(eager_exit_stack=True)
+                ```
+                """
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             path=path,
@@ -2009,6 +2334,8 @@ class put(HTTPHandler):
             operation_id=operation_id,
             response_description=response_description,
             responses=responses,
+            compression=compression,
+            eager_exit_stack=eager_exit_stack,
         )
 
 
@@ -2381,6 +2708,45 @@ class patch(HTTPHandler):
                 """
             ),
         ] = None,
+        compression: Annotated[
+            Optional[CompressionType],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handler. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import patch
+
+                @patch(compression=False)
+                ```
+                """
+            ),
+        ] = None,
+        eager_exit_stack: Annotated[
+            bool,
+            Doc(
+                """
+                Hands the handler the `AsyncExitStack` of the request itself instead of the
+                `LazyAsyncExitStack` standing for it, when the application creates it lazily
+                via `AsyncExitConfig(lazy=True)`.
+
+                **Example**
+
+                ```python
+                from esmerald import patch
+
+                @patch(eager_exit_stack=True)
+                ```
+                """
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             path=path,
@@ -2406,6 +2772,8 @@ class patch(HTTPHandler):
             operation_id=operation_id,
             response_description=response_description,
             responses=responses,
+            compression=compression,
+            eager_exit_stack=eager_exit_stack,
         )
 
 
@@ -2778,6 +3146,45 @@ class delete(HTTPHandler):
                 """
             ),
         ] = None,
+        compression: Annotated[
+            Optional[CompressionType],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handler. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import delete
+
+                @delete(compression=False)
+                ```
+                """
+            ),
+        ] = None,
+        eager_exit_stack: Annotated[
+            bool,
+            Doc(
+                """
+                Hands the handler the `AsyncExitStack` of the request itself instead of the
+                `LazyAsyncExitStack` standing for it, when the application creates it lazily
+                via `AsyncExitConfig(lazy=True)`.
+
+                **Example**
+
+                ```python
+                from esmerald import delete
+
+                @delete(eager_exit_stack=True)
+                ```
+                """
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             path=path,
@@ -2803,6 +3210,8 @@ class delete(HTTPHandler):
             operation_id=operation_id,
             response_description=response_description,
             responses=responses,
+            compression=compression,
+            eager_exit_stack=eager_exit_stack,
         )
 
 
@@ -3194,6 +3603,119 @@ class route(HTTPHandler):
                 """
             ),
         ] = None,
+        etag: Annotated[
+            Optional[Union[bool, ETagCallable]],
+            Doc(
+                """
+                Enables the conditional `GET` requests for the handler.
+
+                With `True`, a strong ETag is computed from the rendered body of the response.
+                A callable receiving the `Request` and returning the ETag (or `None`) can be
+                used instead and, when the ETag matches the `If-None-Match` of the request,
+                the handler is not called at all.
+
+                When the representation of the client is still current, a `304 Not Modified`
+                is returned without body.
+
+                It can also be set on the `Gateway` and `Include` levels.
+
+                **Example**
+
+                ```python
+                from esmerald import route
+
+                @route(etag=True)
+                ```
+                """
+            ),
+        ] = None,
+        cache: Annotated[
+            Optional[ResponseCacheType],
+            Doc(
+                """
+                Caches the responses of the handler. A cached response is sent as is,
+                skipping the dependencies, the validation and the handler itself.
+
+                A number is the time to live of the responses, in seconds, and `True` caches
+                them without expiry. An `esmerald.cache.ResponseCache` configures the query
+                parameters and the headers the key is built from, the backend and when the
+                cache is bypassed. `False` disables the cache of an upper level.
+
+                It can also be set on the `Gateway` and `Include` levels.
+
+                **Example**
+
+                ```python
+                from esmerald import route
+
+                @route(cache=60)
+                ```
+                """
+            ),
+        ] = None,
+        coalesce: Annotated[
+            Optional[RequestCoalescingType],
+            Doc(
+                """
+                Coalesces the identical concurrent `GET` requests of the handler into a
+                single execution, the other requests receiving a copy of its response.
+
+                With `True`, the key is built from the method, the path and the query
+                parameters. An `esmerald.cache.RequestCoalescing` configures the query
+                parameters and the headers the key is built from and how long the requests
+                wait for the response. `False` disables the coalescing of an upper level.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import route
+
+                @route(coalesce=True)
+                ```
+                """
+            ),
+        ] = None,
+        compression: Annotated[
+            Optional[CompressionType],
+            Doc(
+                """
+                Overrides the configuration of the `CompressionMiddleware` for the
+                handler. `False` disables the compression of the responses and a
+                `CompressionConfig` sets the levels, the minimum size, the encodings and the
+                excluded media types.
+
+                It can also be set on the `Gateway` level.
+
+                **Example**
+
+                ```python
+                from esmerald import route
+
+                @route(compression=False)
+                ```
+                """
+            ),
+        ] = None,
+        eager_exit_stack: Annotated[
+            bool,
+            Doc(
+                """
+                Hands the handler the `AsyncExitStack` of the request itself instead of the
+                `LazyAsyncExitStack` standing for it, when the application creates it lazily
+                via `AsyncExitConfig(lazy=True)`.
+
+                **Example**
+
+                ```python
+                from esmerald import route
+
+                @route(eager_exit_stack=True)
+                ```
+                """
+            ),
+        ] = False,
     ) -> None:
         if not methods or not isinstance(methods, list):
             raise ImproperlyConfigured(
@@ -3236,6 +3758,11 @@ class route(HTTPHandler):
             operation_id=operation_id,
             response_description=response_description,
             responses=responses,
+            etag=etag,
+            cache=cache,
+            coalesce=coalesce,
+            compression=compression,
+            eager_exit_stack=eager_exit_stack,
         )
 
 
@@ -35,10 +35,16 @@ from starlette.routing import compile_path
 from starlette.types import ASGIApp, Lifespan, Receive, Scope, Send
 from typing_extensions import Annotated, Doc
 
+from esmerald.concurrency import LazyAsyncExitStack
 from esmerald.conf import settings
 from esmerald.core.urls import include
 from esmerald.datastructures import File, Redirect
 from esmerald.enums import HttpMethod, MediaType
+from esmerald.exception_handlers import (
+    CachedExceptionHandlers,
+    error_response,
+    http_exception_handler,
+)
 from esmerald.exceptions import (
     ImproperlyConfigured,
     MethodNotAllowed,
@@ -56,11 +62,19 @@ from esmerald.routing.apis.base import View
 from esmerald.routing.base import BaseHandlerMixin
 from esmerald.routing.events import handle_lifespan_events
 from esmerald.routing.gateways import Gateway, WebhookGateway, WebSocketGateway
+from esmerald.routing.tree import IncludeRouter, RouteDispatchMixin
 from esmerald.transformers.datastructures import EsmeraldSignature as SignatureModel
 from esmerald.transformers.model import TransformerModel
 from esmerald.transformers.utils import get_signature
 from esmerald.typing import Void, VoidType
-from esmerald.utils.constants import DATA, PAYLOAD, REDIRECT_STATUS_CODES, REQUEST, SOCKET
+from esmerald.utils.constants import (
+    COMPRESSION,
+    DATA,
+    PAYLOAD,
+    REDIRECT_STATUS_CODES,
+    REQUEST,
+    SOCKET,
+)
 from esmerald.utils.helpers import is_async_callable, is_class_and_subclass
 from esmerald.utils.url import clean_path
 from esmerald.websockets import WebSocket, WebSocketClose
@@ -69,16 +83,21 @@ if TYPE_CHECKING:  # pragma: no cover
     from openapi_schemas_pydantic.v3_1_0.security_scheme import SecurityScheme
 
     from esmerald.applications import Esmerald
+    from esmerald.config.cors import CORSConfig
     from esmerald.permissions.types import Permission
     from esmerald.types import (
         APIGateHandler,
         AsyncAnyCallable,
         BackgroundTaskType,
+        CompressionType,
         Dependencies,
+        ETagCallable,
         ExceptionHandlerMap,
         LifeSpanHandler,
         Middleware,
         ParentType,
+        RequestCoalescingType,
+        ResponseCacheType,
         ResponseCookies,
         ResponseHeaders,
         ResponseType,
@@ -87,9 +106,10 @@ if TYPE_CHECKING:  # pragma: no cover
     from esmerald.typing import AnyCallable
 
 
-class BaseRouter(StarletteRouter):
+class BaseRouter(RouteDispatchMixin, StarletteRouter):
     __slots__ = (
         "redirect_slashes",
+        "enable_route_tree",
         "default",
         "name",
         "dependencies",
@@ -466,6 +486,20 @@ class BaseRouter(StarletteRouter):
                 """
             ),
         ] = None,
+        enable_route_tree: Annotated[
+            Optional[bool],
+            Doc(
+                """
+                Boolean flag indicating if the requests should be dispatched via a
+                prefix tree built from the routes (and nested `Include` routes) instead
+                of checking every route one by one.
+
+                The order given by the routes is respected.
+
+                Defaults to the `enable_route_tree` from the settings.
+                """
+            ),
+        ] = None,
     ):
         self.app = app
         if not path:
@@ -525,6 +559,9 @@ class BaseRouter(StarletteRouter):
         self.response_headers = response_headers or {}
         self.deprecated = deprecated
         self.security = security or []
+        self.enable_route_tree = (
+            enable_route_tree if enable_route_tree is not None else settings.enable_route_tree
+        )
 
         self.routing = copy(self.routes)
         for route in self.routing or []:
@@ -544,6 +581,18 @@ class BaseRouter(StarletteRouter):
 
     def activate(self) -> None:
         self.routes = self.reorder_routes()
+        self.refresh_routes()
+
+    def build_pipelines(self, reset: bool = False) -> None:
+        """
+        Builds the pipelines of the gateways, including the ones of the nested `Include`, once
+        the routes are part of an application, for the first requests not to build them and
+        for the configuration errors to be raised when the application is built.
+
+        The nested applications are built before being mounted, without the layers of the
+        parent application, so their pipelines are built again.
+        """
+        build_pipelines(self.routes, reset=reset)
 
     async def not_found(
         self, scope: "Scope", receive: "Receive", send: "Send"
@@ -562,11 +611,30 @@ class BaseRouter(StarletteRouter):
             return
 
         if "app" in scope:
-            raise NotFound(status_code=status.HTTP_404_NOT_FOUND)
+            if not self.handles_not_found_by_default(scope):
+                raise NotFound(status_code=status.HTTP_404_NOT_FOUND)
+            response = error_response(status.HTTP_404_NOT_FOUND, NotFound.detail)
         else:
             response = JSONResponse({"detail": "Not Found"}, status_code=status.HTTP_404_NOT_FOUND)
         await response(scope, receive, send)
 
+    def handles_not_found_by_default(self, scope: "Scope") -> bool:
+        """
+        Checks if a `NotFound` raised by the router of the application would be handled by the
+        default `http_exception_handler`, in which case its response is sent directly.
+        """
+        if getattr(scope["app"], "router", None) is not self:
+            return False
+        try:
+            exception_handlers, status_handlers = scope["starlette.exception_handlers"]
+        except KeyError:
+            return False
+        return (
+            status.HTTP_404_NOT_FOUND not in status_handlers
+            and isinstance(exception_handlers, CachedExceptionHandlers)
+            and exception_handlers.lookup(NotFound) is http_exception_handler
+        )
+
     def url_path_for(self, name: str, **path_params: Any) -> URLPath:
         for route in self.routes or []:
             try:
@@ -673,11 +741,37 @@ class BaseRouter(StarletteRouter):
                             else route_handler.include_in_schema
                         )
                         gate.include_in_schema = include_in_schema
+                        if isinstance(gate, Gateway):
+                            gate.etag = value.etag
+                            gate.cache = value.cache
+                            gate.coalesce = value.coalesce
+                            gate.compression = value.compression
+                            gate.cors_config = value.cors_config
 
                     self.routes.append(gate)
                 self.routes.pop(self.routes.index(value))
 
 
+def build_pipelines(routes: Sequence[Any], reset: bool = False) -> None:
+    """
+    Builds the pipelines of the given gateways and of the gateways of the nested `Include`.
+    With `reset`, the pipelines already built are built again.
+    """
+    from esmerald import ChildEsmerald, Esmerald
+
+    for route in routes:
+        if isinstance(route, (Gateway, WebSocketGateway)):
+            if reset:
+                route.reset_pipeline()
+            route.get_pipeline()
+        elif isinstance(route, Mount):
+            app = getattr(route, "_base_app", None)
+            if isinstance(app, (Esmerald, ChildEsmerald)):
+                app.router.build_pipelines(reset=True)
+            else:
+                build_pipelines(getattr(app, "routes", None) or [], reset=reset)
+
+
 class Router(BaseRouter):
     """
     The `Router` object used by `Esmerald` upon instantiation.
@@ -741,6 +835,12 @@ class Router(BaseRouter):
                 permissions=value.permissions,
                 exception_handlers=value.exception_handlers,
             )
+            if isinstance(gate, Gateway):
+                gate.etag = value.etag
+                gate.cache = value.cache
+                gate.coalesce = value.coalesce
+                gate.compression = value.compression
+                gate.cors_config = value.cors_config
             self.routes.append(gate)
             routes.append(gate)
 
@@ -872,6 +972,7 @@ class Router(BaseRouter):
         self.validate_root_route_parent(gateway)
         self.create_signature_models(gateway)
         self.routes.append(gateway)
+        self.refresh_routes()
 
     def add_websocket_route(
         self,
@@ -983,6 +1084,7 @@ class Router(BaseRouter):
         self.validate_root_route_parent(websocket_gateway)
         self.create_signature_models(websocket_gateway)
         self.routes.append(websocket_gateway)
+        self.refresh_routes()
 
 
 class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
@@ -991,6 +1093,7 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         "_permissions",
         "_dependencies",
         "_response_handler",
+        "_pipeline",
         "_middleware",
         "methods",
         "status_code",
@@ -1012,6 +1115,11 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         "deprecated",
         "security",
         "operation_id",
+        "etag",
+        "cache",
+        "coalesce",
+        "compression",
+        "eager_exit_stack",
     )
 
     def __init__(
@@ -1041,6 +1149,11 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
         security: Optional[List["SecurityScheme"]] = None,
         operation_id: Optional[str] = None,
+        etag: Optional[Union[bool, "ETagCallable"]] = None,
+        cache: Optional["ResponseCacheType"] = None,
+        coalesce: Optional["RequestCoalescingType"] = None,
+        compression: Optional["CompressionType"] = None,
+        eager_exit_stack: bool = False,
     ) -> None:
         """
         Handles the "handler" or "apiview" of the platform. A handler can be any get, put, patch, post, delete or route.
@@ -1055,6 +1168,7 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         self._response_handler: Union[
             "Callable[[Any], Awaitable[StarletteResponse]]", VoidType
         ] = Void
+        self._pipeline: Union["ASGIApp", VoidType] = Void
 
         self.parent: "ParentType" = None
         self.path = path
@@ -1100,6 +1214,11 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         self.responses = responses or {}
         self.content_encoding = content_encoding
         self.content_media_type = content_media_type
+        self.etag = etag
+        self.cache = cache
+        self.coalesce = coalesce
+        self.compression = compression
+        self.eager_exit_stack = eager_exit_stack
 
         self.fn: Optional["AnyCallable"] = None
         self.app: Optional["ASGIApp"] = None
@@ -1130,17 +1249,6 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         """
         return list(self.methods)
 
-    async def allowed_methods(
-        self, scope: "Scope", receive: "Receive", send: "Send", methods: List[str]
-    ) -> None:
-        """
-        Validates if the scope method is available within the handler and raises
-        a MethodNotAllowed if otherwise.
-        """
-        for method in methods:
-            if method not in self.http_methods:
-                raise MethodNotAllowed(detail=f"Method {method.upper()} not allowed.")
-
     @property
     def allow_header(self) -> Mapping[str, str]:
         """
@@ -1187,23 +1295,105 @@ class HTTPHandler(BaseHandlerMixin, FieldInfoMixin, StarletteRoute):
         """
         ASGIapp that authorizes the connection and then awaits the handler function.
         """
-        methods = [scope["method"]]
-        await self.allowed_methods(scope, receive, send, methods)
+        await self.get_pipeline()(scope, receive, send)
+
+    def get_pipeline(self) -> "ASGIApp":
+        """
+        Returns the ASGI app handling a request for this handler, building it on the
+        first call.
+        """
+        if self._pipeline is Void:
+            self._pipeline = self.build_pipeline()
+        return cast("ASGIApp", self._pipeline)
 
-        request = Request(scope=scope, receive=receive, send=send)
-        route_handler, parameter_model = self.route_map[scope["method"]]
+    def reset_pipeline(self) -> None:
+        """
+        Drops the ASGI app of the handler and the permissions resolved from the parent
+        layers, for them to be built again.
+        """
+        self._pipeline = Void
+        self._permissions = Void
 
-        if self.get_permissions():
-            connection = HTTPConnection(scope=scope, receive=receive)
-            await self.allow_connection(connection)
-
-        response = await self.get_response_for_request(
-            scope=scope,
-            request=request,
-            route=route_handler,
-            parameter_model=parameter_model,
+    def build_pipeline(self) -> "ASGIApp":
+        """
+        Builds the ASGI app validating the method, checking the permissions, extracting
+        the parameters, calling the handler function and sending the response, answering
+        the conditional requests when an `etag` applies to the handler, serving the
+        responses from the `cache` of the handler and coalescing the identical concurrent
+        requests. The `compression` of the handler is exposed to the `CompressionMiddleware`
+        via the scope.
+
+        With `eager_exit_stack`, the `LazyAsyncExitStack` of the request is replaced by the
+        `AsyncExitStack` it stands for before the handler is called.
+
+        Everything not depending on the request is resolved once and the stages with
+        nothing to do, for instance the permissions when none are declared in any of the
+        layers, are not part of it.
+        """
+        methods = frozenset(self.methods)
+        permissions = self.get_permissions()
+        response_handler = self.get_response_handler()
+        get_response_data = self.get_response_data_handler(
+            cast("TransformerModel", self.transformer)
         )
-        await response(scope, receive, send)
+
+        async def get_response(request: Request) -> StarletteResponse:
+            data = await get_response_data(request)
+            return await response_handler(app=request.scope["app"], data=data)  # type: ignore[call-arg]
+
+        coalescing = self.get_request_coalescing()
+        if coalescing is not None:
+            get_response = self.get_coalesced_response_handler(get_response, coalescing)
+
+        cache = self.get_response_cache()
+        if cache is not None:
+            get_response = self.get_cached_response_handler(get_response, cache)
+
+        etag = self.get_etag()
+        if etag:
+            get_response = self.get_conditional_response_handler(get_response, etag)
+
+        async def respond(scope: "Scope", receive: "Receive", send: "Send") -> None:
+            request = Request(scope=scope, receive=receive, send=send)
+            response = await get_response(request)
+            await response(scope, receive, send)
+
+        inner: "ASGIApp" = respond
+        if permissions:
+            allow_connection = self.allow_connection
+
+            async def check_permissions(scope: "Scope", receive: "Receive", send: "Send") -> None:
+                await allow_connection(HTTPConnection(scope=scope, receive=receive))
+                await respond(scope, receive, send)
+
+            inner = check_permissions
+
+        if self.eager_exit_stack:
+            with_exit_stack = inner
+
+            async def create_exit_stack(scope: "Scope", receive: "Receive", send: "Send") -> None:
+                context_name = scope["app"].async_exit_config.context_name
+                stack = scope.get(context_name)
+                if isinstance(stack, LazyAsyncExitStack):
+                    scope[context_name] = stack.get_stack()
+                await with_exit_stack(scope, receive, send)
+
+            inner = create_exit_stack
+
+        async def check_method(scope: "Scope", receive: "Receive", send: "Send") -> None:
+            if scope["method"] not in methods:
+                raise MethodNotAllowed(detail=f"Method {scope['method'].upper()} not allowed.")
+            await inner(scope, receive, send)
+
+        compression = self.get_compression()
+        if compression is None or compression is True:
+            return check_method
+
+        async def set_compression(scope: "Scope", receive: "Receive", send: "Send") -> None:
+            scope[COMPRESSION] = compression
+            await check_method(scope, receive, send)
+
+        return set_compression
 
     def __call__(
         self,
@@ -1317,6 +1507,7 @@ class WebhookHandler(HTTPHandler, FieldInfoMixin, StarletteRoute):
         "_permissions",
         "_dependencies",
         "_response_handler",
+        "_pipeline",
         "_middleware",
         "methods",
         "status_code",
@@ -1511,10 +1702,9 @@ class WebSocketHandler(BaseHandlerMixin, StarletteWebSocketRoute):
 
         signature_model = get_signature(self)
         kwargs = self.websocket_parameter_model.to_kwargs(connection=websocket)
-        for dependency in self.websocket_parameter_model.dependencies:
-            kwargs[dependency.key] = await self.websocket_parameter_model.get_dependencies(
-                dependency=dependency, connection=websocket, **kwargs
-            )
+        await self.websocket_parameter_model.resolve_dependencies(
+            connection=websocket, kwargs=kwargs, concurrent=self.get_concurrent_dependencies()
+        )
         return signature_model.parse_values_for_connection(connection=websocket, **kwargs)
 
 
@@ -1544,6 +1734,9 @@ class Include(Mount):
         "deprecated",
         "security",
         "tags",
+        "etag",
+        "cache",
+        "cors_config",
     )
 
     def __init__(
@@ -1851,6 +2044,72 @@ class Include(Mount):
                 """
             ),
         ] = None,
+        etag: Annotated[
+            Optional[Union[bool, "ETagCallable"]],
+            Doc(
+                """
+                Enables the conditional `GET` requests for the handlers of the `Include`.
+
+                With `True`, a strong ETag is computed from the rendered body of the response.
+                A callable receiving the `Request` and returning the ETag (or `None`) can be
+                used instead and, when the ETag matches the `If-None-Match` of the request,
+                the handler is not called at all.
+
+                When the representation of the client is still current, a `304 Not Modified`
+                is returned without body.
+
+                **Example**
+
+                ```python
+                from esmerald import Gateway, Include
+
+                Include(routes=[Gateway(handler=home)], etag=True)
+                ```
+                """
+            ),
+        ] = None,
+        cache: Annotated[
+            Optional["ResponseCacheType"],
+            Doc(
+                """
+                Caches the responses of the handlers of the `Include`. A cached response is sent
+                as is, skipping the dependencies, the validation and the handler itself.
+
+                A number is the time to live of the responses, in seconds, and `True` caches
+                them without expiry. An `esmerald.cache.ResponseCache` configures the query
+                parameters and the headers the key is built from, the backend and when the
+                cache is bypassed. `False` disables the cache of an upper level.
+
+                **Example**
+
+                ```python
+                from esmerald import Gateway, Include
+
+                Include(routes=[Gateway(handler=home)], cache=60)
+                ```
+                """
+            ),
+        ] = None,
+        cors_config: Annotated[
+            Optional["CORSConfig"],
+            Doc(
+                """
+                Overrides the [CORSConfig](https://esmerald.dev/configurations/cors/) of the
+                application for the routes of the `Include`, unless they declare their own.
+                The override is applied by the `CORSMiddleware` of the application, preflight
+                requests included.
+
+                **Example**
+
+                ```python
+                from esmerald import Gateway, Include
+                from esmerald.config import CORSConfig
+
+                Include(routes=[Gateway(handler=home)], cors_config=CORSConfig(allow_origins=["*"]))
+                ```
+                """
+            ),
+        ] = None,
     ) -> None:
         self.path = path
         if not path:
@@ -1888,6 +2147,9 @@ class Include(Mount):
         self.parent = parent
         self.security = security or []
         self.tags = tags or []
+        self.etag = etag
+        self.cache = cache
+        self.cors_config = cors_config
 
         if routes:
             routes = self.resolve_route_path_handler(routes)
@@ -1904,6 +2166,8 @@ class Include(Mount):
                 )
 
         app = self.resolve_app_parent(app=app)
+        if app is None and routes is not None:
+            app = IncludeRouter(routes=routes)
 
         super().__init__(
             self.path,
@@ -2021,6 +2285,11 @@ class Include(Mount):
                             else route_handler.include_in_schema
                         )
                         gate.include_in_schema = include_in_schema
+                        gate.etag = route.etag
+                        gate.cache = route.cache
+                        gate.coalesce = route.coalesce
+                        gate.compression = route.compression
+                        gate.cors_config = route.cors_config
 
                     routing.append(gate)
         return routing
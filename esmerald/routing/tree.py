@@ -0,0 +1,325 @@
+import re
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+from starlette.convertors import FloatConvertor, IntegerConvertor, StringConvertor, UUIDConvertor
+from starlette.datastructures import URL
+from starlette.responses import RedirectResponse
+from starlette.routing import BaseRoute, Match, Mount
+from starlette.routing import Route as StarletteRoute
+from starlette.routing import Router as StarletteRouter
+from starlette.routing import WebSocketRoute as StarletteWebSocketRoute
+
+if TYPE_CHECKING:  # pragma: no cover
+    from starlette.types import Receive, Scope, Send
+
+# Convertors whose regex can never match a `/` and therefore map exactly into
+# a single path segment. Anything else falls back to the route regex.
+SEGMENT_CONVERTORS = (StringConvertor, IntegerConvertor, FloatConvertor, UUIDConvertor)
+
+# Only the stock `matches()` implementations are known to depend on the path
+# alone. Routes overriding it are always treated as candidates.
+INDEXABLE_MATCHES = (StarletteRoute.matches, StarletteWebSocketRoute.matches, Mount.matches)
+
+
+class RouteNode:
+    """
+    A node of the [RouteTree](#routetree) representing one path segment.
+    """
+
+    __slots__ = ("static", "params", "routes", "wildcards")
+
+    def __init__(self) -> None:
+        self.static: Dict[str, "RouteNode"] = {}
+        self.params: Dict[str, Tuple[Pattern[str], "RouteNode"]] = {}
+        self.routes: List[int] = []
+        self.wildcards: List[int] = []
+
+    def get_static(self, segment: str) -> "RouteNode":
+        node = self.static.get(segment)
+        if node is None:
+            node = self.static[segment] = RouteNode()
+        return node
+
+    def get_param(self, regex: str) -> "RouteNode":
+        param = self.params.get(regex)
+        if param is None:
+            param = self.params[regex] = (re.compile(regex), RouteNode())
+        return param[1]
+
+
+class RouteTree:
+    """
+    Prefix tree built from a resolved route table.
+
+    The tree does not replace the route `matches()`. It narrows down, per path segment,
+    the routes that *can* match a given path, returning them in the original order of
+    the route table. Segments that cannot be indexed (custom convertors, `path`
+    convertors, segments mixing text and parameters or `Mount` remainders) become
+    wildcards from that node onwards and are validated by the route regex.
+
+    Since every route able to match a path is always returned and the order is
+    preserved, the result of the dispatch is the same as a linear walk.
+    """
+
+    __slots__ = ("routes", "root")
+
+    def __init__(self, routes: Sequence[BaseRoute]) -> None:
+        self.routes = list(routes)
+        self.root = RouteNode()
+        for index, route in enumerate(self.routes):
+            self.insert(index, route)
+
+    @staticmethod
+    def get_segments(route: BaseRoute) -> Optional[List[str]]:
+        """
+        Returns the path segments of a route that can be indexed or `None` if the route
+        must always be considered a candidate.
+        """
+        if getattr(type(route), "matches", None) not in INDEXABLE_MATCHES:
+            return None
+
+        path_format: Optional[str] = getattr(route, "path_format", None)
+        if not path_format or not path_format.startswith("/"):
+            return None
+
+        segments = path_format.split("/")[1:]
+        if isinstance(route, Mount):
+            # The last segment is the `{path}` remainder handed to the mounted app.
+            segments = segments[:-1]
+        return segments
+
+    def insert(self, index: int, route: BaseRoute) -> None:
+        segments = self.get_segments(route)
+        if segments is None:
+            self.root.wildcards.append(index)
+            return
+
+        convertors: Dict[str, Any] = getattr(route, "param_convertors", {})
+        node = self.root
+        for segment in segments:
+            if "{" not in segment:
+                node = node.get_static(segment)
+                continue
+
+            name = segment[1:-1]
+            convertor = convertors.get(name)
+            if (
+                segment.startswith("{")
+                and segment.endswith("}")
+                and type(convertor) in SEGMENT_CONVERTORS
+            ):
+                node = node.get_param(convertor.regex)
+                continue
+
+            node.wildcards.append(index)
+            return
+
+        if isinstance(route, Mount):
+            node.wildcards.append(index)
+        else:
+            node.routes.append(index)
+
+    def collect(
+        self, node: RouteNode, segments: List[str], position: int, found: List[int]
+    ) -> None:
+        found.extend(node.wildcards)
+        if position == len(segments):
+            found.extend(node.routes)
+            return
+
+        segment = segments[position]
+        child = node.static.get(segment)
+        if child is not None:
+            self.collect(child, segments, position + 1, found)
+
+        for pattern, child in node.params.values():
+            if pattern.fullmatch(segment):
+                self.collect(child, segments, position + 1, found)
+
+    def search(self, path: str) -> Iterator[BaseRoute]:
+        """
+        Yields the candidate routes for the given path respecting the order of the
+        route table.
+        """
+        if not path.startswith("/") or path.endswith("\n"):
+            # Not something the tree was built for, defer to the regular walk.
+            yield from self.routes
+            return
+
+        found: List[int] = []
+        self.collect(self.root, path.split("/"), 1, found)
+        found.sort()
+        routes = self.routes
+        for index in found:
+            yield routes[index]
+
+
+def get_scope_types(route: BaseRoute) -> Tuple[str, ...]:
+    """
+    Returns the scope types a route with a stock `matches()` can handle.
+    """
+    matches = getattr(type(route), "matches", None)
+    if matches is StarletteRoute.matches:
+        return ("http",)
+    if matches is StarletteWebSocketRoute.matches:
+        return ("websocket",)
+    return ("http", "websocket")
+
+
+def get_static_routes(routes: Sequence[BaseRoute]) -> Dict[Tuple[str, str], BaseRoute]:
+    """
+    Maps the `(path, scope_type)` of the routes without path parameters to the route.
+
+    A route is only added when no route declared before it can match the same path,
+    which keeps the result of an exact lookup the same as the one of a linear walk.
+    """
+    static_routes: Dict[Tuple[str, str], BaseRoute] = {}
+    route_tree = RouteTree(routes)
+
+    for route in routes:
+        if (
+            getattr(type(route), "matches", None) not in INDEXABLE_MATCHES
+            or isinstance(route, Mount)
+            or route.param_convertors  # type: ignore[attr-defined]
+        ):
+            continue
+
+        path: str = route.path_format  # type: ignore[attr-defined]
+        scope_type = get_scope_types(route)[0]
+        is_shadowed = False
+
+        for candidate in route_tree.search(path):
+            if candidate is route:
+                break
+            if getattr(type(candidate), "matches", None) not in INDEXABLE_MATCHES or (
+                scope_type in get_scope_types(candidate)
+                and candidate.path_regex.match(path)  # type: ignore[attr-defined]
+            ):
+                is_shadowed = True
+                break
+
+        if not is_shadowed:
+            static_routes[(path, scope_type)] = route
+    return static_routes
+
+
+class RouteDispatchMixin:
+    """
+    Dispatches the requests of a router.
+
+    1. Routes without path parameters are looked up by `(path, scope_type)` first.
+    2. When `enable_route_tree` is set, the candidates come from a
+    [RouteTree](#routetree) instead of a linear walk of the routes.
+
+    The lookup tables are rebuilt by `refresh_routes()` and whenever a change in the
+    route table is detected.
+    """
+
+    enable_route_tree: bool = False
+    route_tree: Optional[RouteTree] = None
+    static_routes: Dict[Tuple[str, str], BaseRoute] = {}
+    routes_count: int = -1
+    last_route: Optional[BaseRoute] = None
+
+    def refresh_routes(self) -> None:
+        """
+        Rebuilds the lookup tables from the current routes.
+        """
+        routes: List[BaseRoute] = self.routes  # type: ignore[attr-defined]
+        self.static_routes = get_static_routes(routes)
+        self.route_tree = self.build_route_tree() if self.enable_route_tree else None
+        self.routes_count = len(routes)
+        self.last_route = routes[-1] if routes else None
+
+    def build_route_tree(self) -> RouteTree:
+        """
+        Builds the route tree for the routes and enables it for any nested
+        `Include` router as well.
+        """
+        routes: List[BaseRoute] = self.routes  # type: ignore[attr-defined]
+        for route in routes:
+            if isinstance(route, Mount):
+                app = getattr(route, "_base_app", None)
+                if isinstance(app, RouteDispatchMixin) and not app.enable_route_tree:
+                    app.enable_route_tree = True
+                    app.routes_count = -1
+
+        return RouteTree(routes)
+
+    def check_routes(self) -> None:
+        """
+        Refreshes the lookup tables if the routes changed since they were built.
+        """
+        routes: List[BaseRoute] = self.routes  # type: ignore[attr-defined]
+        if len(routes) != self.routes_count or (routes and routes[-1] is not self.last_route):
+            self.refresh_routes()
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        if scope["type"] == "lifespan":
+            await super().__call__(scope, receive, send)  # type: ignore[misc]
+            return
+
+        if "router" not in scope:
+            scope["router"] = self
+
+        self.check_routes()
+
+        route = self.static_routes.get((scope["path"], scope["type"]))
+        if route is not None:
+            methods = getattr(route, "methods", None)
+            if not methods or scope["method"] in methods:
+                scope.update(
+                    {
+                        "endpoint": route.endpoint,  # type: ignore[attr-defined]
+                        "path_params": dict(scope.get("path_params", {})),
+                    }
+                )
+                await route.handle(scope, receive, send)
+                return
+
+        if self.route_tree is None:
+            await super().__call__(scope, receive, send)  # type: ignore[misc]
+            return
+
+        route_tree = self.route_tree
+        partial = None
+        partial_scope: Dict[str, Any] = {}
+
+        for route in route_tree.search(scope["path"]):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                scope.update(child_scope)
+                await route.handle(scope, receive, send)
+                return
+            elif match == Match.PARTIAL and partial is None:
+                partial = route
+                partial_scope = child_scope
+
+        if partial is not None:
+            scope.update(partial_scope)
+            await partial.handle(scope, receive, send)
+            return
+
+        redirect_slashes: bool = self.redirect_slashes  # type: ignore[attr-defined]
+        if scope["type"] == "http" and redirect_slashes and scope["path"] != "/":
+            redirect_scope = dict(scope)
+            if scope["path"].endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+
+            for route in route_tree.search(redirect_scope["path"]):
+                match, _ = route.matches(redirect_scope)
+                if match != Match.NONE:
+                    redirect_url = URL(scope=redirect_scope)
+                    response = RedirectResponse(url=str(redirect_url))
+                    await response(scope, receive, send)
+                    return
+
+        await self.default(scope, receive, send)  # type: ignore[attr-defined]
+
+
+class IncludeRouter(RouteDispatchMixin, StarletteRouter):
+    """
+    The router used internally by an `Include` declaring `routes`.
+    """
@@ -1 +1,377 @@
-from starlette.staticfiles import StaticFiles as StaticFiles  # noqa
+import json
+import os
+import re
+import stat
+from collections import OrderedDict
+from email.utils import formatdate
+from mimetypes import guess_type
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response as StarletteResponse
+from starlette.staticfiles import NotModifiedResponse, PathLike
+from starlette.staticfiles import StaticFiles as StarletteStaticFiles
+from starlette.types import Scope
+
+from esmerald.middleware.compression import parse_accept_encoding
+from esmerald.responses.file import FileResponse
+from esmerald.utils.conditional import is_not_modified
+
+HASHED_FILENAME_PATTERN = r"[.-][0-9a-fA-F]{8,}\.[^/]+$"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+PRECOMPRESSED_EXTENSIONS = (("br", ".br"), ("zstd", ".zst"), ("gzip", ".gz"))
+
+
+class StaticFile:
+    """
+    A file of the index of the static files, with the headers of its responses computed
+    once.
+    """
+
+    __slots__ = ("full_path", "stat_result", "headers", "variants")
+
+    def __init__(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        headers: Dict[str, str],
+        variants: Optional[Dict[str, "StaticFile"]] = None,
+    ) -> None:
+        self.full_path = full_path
+        self.stat_result = stat_result
+        self.headers = headers
+        self.variants = variants or {}
+
+
+class StaticFiles(StarletteStaticFiles):
+    """
+    Serves the files of a directory or of packages.
+
+    The files are sent with the Esmerald `FileResponse`, answering the `Range` requests.
+
+    With `scan=True`, the directories are scanned once, on the first request, and the files
+    are served from that index, with their headers computed once, instead of looking them up
+    on every request. An indexed file modified or deleted since the scan is indexed again or
+    looked up as usual. The paths missing from the index, such as the files added after the
+    scan or the directories in `html` mode, are looked up as usual. Use `refresh()` to scan
+    the directories again.
+
+    * `precompressed` serves the `.br`, `.zst` and `.gz` siblings of a file to the clients
+    accepting those encodings.
+    * `cache_maxsize` keeps up to that number of files, of at most `cache_max_file_size`
+    bytes, in memory.
+    * `immutable_pattern` adds an immutable `Cache-Control` to the files whose name matches
+    it, for instance the `HASHED_FILENAME_PATTERN` of fingerprinted assets.
+
+    `precompressed` and `cache_maxsize` imply `scan`.
+    """
+
+    def __init__(
+        self,
+        *,
+        scan: bool = False,
+        precompressed: bool = False,
+        cache_maxsize: int = 0,
+        cache_max_file_size: int = 64 * 1024,
+        immutable_pattern: Optional[Union[str, Pattern[str]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.scan = scan or precompressed or cache_maxsize > 0
+        self.precompressed = precompressed
+        self.cache_maxsize = cache_maxsize
+        self.cache_max_file_size = cache_max_file_size
+        self.immutable_pattern = (
+            re.compile(immutable_pattern)
+            if isinstance(immutable_pattern, str)
+            else immutable_pattern
+        )
+        self.index: Optional[Dict[str, StaticFile]] = None
+        self.cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def refresh(self) -> None:
+        """
+        Scans the directories again and drops the files kept in memory.
+        """
+        self.index = self.scan_directories()
+        self.cache.clear()
+
+    def scan_directories(self) -> Dict[str, StaticFile]:
+        """
+        Builds the index of the files of the directories, the first directory declaring a
+        path taking precedence.
+        """
+        index: Dict[str, StaticFile] = {}
+        for directory in self.all_directories:
+            root = os.path.realpath(directory)
+            for current, _, filenames in os.walk(root, followlinks=self.follow_symlink):
+                for filename in filenames:
+                    full_path = os.path.join(current, filename)
+                    path = os.path.relpath(full_path, root)
+                    if path in index:
+                        continue
+                    if not self.follow_symlink and (
+                        os.path.commonpath([os.path.realpath(full_path), root]) != root
+                    ):
+                        continue
+                    entry = self.get_static_file(full_path, path)
+                    if entry is not None:
+                        index[path] = entry
+        return index
+
+    def get_static_file(self, full_path: str, path: str) -> Optional[StaticFile]:
+        try:
+            stat_result = os.stat(full_path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+
+        media_type = guess_type(full_path)[0] or "text/plain"
+        if media_type.startswith("text/"):
+            media_type = f"{media_type}; charset=utf-8"
+        etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        headers = {
+            "content-type": media_type,
+            "content-length": str(stat_result.st_size),
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "etag": etag,
+            "accept-ranges": "bytes",
+        }
+        if self.immutable_pattern is not None and self.immutable_pattern.search(path):
+            headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+
+        variants: Dict[str, StaticFile] = {}
+        if self.precompressed:
+            for encoding, extension in PRECOMPRESSED_EXTENSIONS:
+                try:
+                    variant_stat = os.stat(full_path + extension)
+                except OSError:
+                    continue
+                variant_headers = dict(headers)
+                variant_headers.pop("accept-ranges")
+                variant_headers.update(
+                    {
+                        "content-length": str(variant_stat.st_size),
+                        "content-encoding": encoding,
+                        "etag": f'{etag[:-1]}-{encoding}"',
+                        "vary": "Accept-Encoding",
+                    }
+                )
+                variants[encoding] = StaticFile(
+                    full_path + extension, variant_stat, variant_headers
+                )
+            if variants:
+                headers["vary"] = "Accept-Encoding"
+
+        return StaticFile(full_path, stat_result, headers, variants)
+
+    async def get_response(self, path: str, scope: Scope) -> StarletteResponse:
+        if not self.scan or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        if self.index is None:
+            self.index = await anyio.to_thread.run_sync(self.scan_directories)
+
+        entry = self.index.get(path)
+        if entry is not None:
+            entry = self.check_static_file(path, entry)
+        if entry is None:
+            return await super().get_response(path, scope)
+        return await self.static_file_response(entry, scope)
+
+    def check_static_file(self, path: str, entry: StaticFile) -> Optional[StaticFile]:
+        """
+        Checks that the file and its precompressed variants did not change since they were
+        indexed, indexing them again otherwise. Returns `None` when the file is gone, for it
+        to be looked up as usual.
+
+        The check is a `stat` of the indexed files, no directory is walked.
+        """
+        for item in (entry, *entry.variants.values()):
+            try:
+                stat_result = os.stat(item.full_path)
+            except OSError:
+                break
+            if (
+                stat_result.st_mtime_ns != item.stat_result.st_mtime_ns
+                or stat_result.st_size != item.stat_result.st_size
+            ):
+                break
+        else:
+            return entry
+
+        for item in (entry, *entry.variants.values()):
+            self.cache.pop(item.full_path, None)
+        updated = self.get_static_file(entry.full_path, path)
+        assert self.index is not None
+        if updated is None:
+            self.index.pop(path, None)
+        else:
+            self.index[path] = updated
+        return updated
+
+    async def static_file_response(self, entry: StaticFile, scope: Scope) -> StarletteResponse:
+        request_headers = Headers(scope=scope)
+        if "range" not in request_headers:
+            entry = self.get_variant(entry, request_headers.get("accept-encoding"))
+
+        headers = Headers(entry.headers)
+        if is_not_modified(headers, request_headers):
+            return NotModifiedResponse(headers)
+
+        if (
+            self.cache_maxsize
+            and entry.stat_result.st_size <= self.cache_max_file_size
+            and "range" not in request_headers
+        ):
+            body = self.cache.get(entry.full_path)
+            if body is None:
+                body = await anyio.to_thread.run_sync(self.read_file, entry.full_path)
+                self.cache[entry.full_path] = body
+                while len(self.cache) > self.cache_maxsize:
+                    self.cache.popitem(last=False)
+            else:
+                self.cache.move_to_end(entry.full_path)
+
+            response = StarletteResponse(b"" if scope["method"] == "HEAD" else body)
+            response.raw_headers = headers.raw
+            return response
+
+        return FileResponse(
+            entry.full_path,
+            stat_result=entry.stat_result,
+            headers=entry.headers,
+            media_type=entry.headers["content-type"],
+            method=scope["method"],
+        )
+
+    def get_variant(self, entry: StaticFile, accept_encoding: Optional[str]) -> StaticFile:
+        """
+        Returns the precompressed variant of the file with the highest quality in the
+        `Accept-Encoding` of the request.
+        """
+        if not entry.variants or not accept_encoding:
+            return entry
+
+        accepted = parse_accept_encoding(accept_encoding)
+        default = accepted.get("*", 0.0)
+        selected, selected_quality = entry, 0.0
+        for encoding, variant in entry.variants.items():
+            quality = accepted.get(encoding, default)
+            if quality > selected_quality:
+                selected, selected_quality = variant, quality
+        return selected
+
+    @staticmethod
+    def read_file(full_path: str) -> bytes:
+        with open(full_path, "rb") as file:
+            return file.read()
+
+    def file_response(
+        self,
+        full_path: Union[PathLike, str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> StarletteResponse:
+        headers: Optional[Dict[str, str]] = None
+        if self.immutable_pattern is not None and self.immutable_pattern.search(
+            os.fspath(full_path)
+        ):
+            headers = {"cache-control": IMMUTABLE_CACHE_CONTROL}
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            method=scope["method"],
+            headers=headers,
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class StaticManifest:
+    """
+    Maps the logical names of the static files to the URLs of their fingerprinted versions.
+
+    The mapping is read from a JSON `manifest`, either `{"app.js": "app.3f2a9c1b.js"}` or
+    the Vite format `{"app.js": {"file": "app.3f2a9c1b.js"}}`, or built by scanning the
+    `directory` for the files matching `pattern`, `app.3f2a9c1b.js` being the fingerprinted
+    version of `app.js`.
+
+    **Example**
+
+    ```python
+    from esmerald.staticfiles import StaticManifest
+
+    manifest = StaticManifest(path="/static", directory="static")
+    manifest.url("app.js")  # /static/app.3f2a9c1b.js
+    ```
+    """
+
+    __slots__ = ("path", "files")
+
+    def __init__(
+        self,
+        path: str = "/static",
+        directory: Optional[PathLike] = None,
+        manifest: Optional[PathLike] = None,
+        pattern: Union[str, Pattern[str]] = HASHED_FILENAME_PATTERN,
+    ) -> None:
+        self.path = path.rstrip("/")
+        self.files: Dict[str, str] = {}
+        if manifest is not None:
+            self.files = self.read_manifest(manifest)
+        elif directory is not None:
+            self.files = self.scan_directory(directory, re.compile(pattern))
+
+    @staticmethod
+    def read_manifest(manifest: PathLike) -> Dict[str, str]:
+        with open(manifest) as file:
+            content: Dict[str, Any] = json.load(file)
+        return {
+            name: value["file"] if isinstance(value, dict) else value
+            for name, value in content.items()
+        }
+
+    @staticmethod
+    def scan_directory(directory: PathLike, pattern: Pattern[str]) -> Dict[str, str]:
+        found: Dict[str, Tuple[float, str]] = {}
+        for current, _, filenames in os.walk(directory):
+            for filename in filenames:
+                match = pattern.search(filename)
+                if match is None:
+                    continue
+                full_path = os.path.join(current, filename)
+                logical = filename[: match.start()] + "." + match.group(0).rsplit(".", 1)[1]
+                name = os.path.relpath(os.path.join(current, logical), directory)
+                name = name.replace(os.sep, "/")
+                value = os.path.relpath(full_path, directory).replace(os.sep, "/")
+                modified = os.stat(full_path).st_mtime
+                if name not in found or found[name][0] < modified:
+                    found[name] = (modified, value)
+        return {name: value for name, (_, value) in found.items()}
+
+    def url(self, name: str) -> str:
+        """
+        Returns the URL of the fingerprinted version of the file, or of the file itself when
+        it has none.
+        """
+        return f"{self.path}/{self.files.get(name, name)}"
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.files
+
+    def __getitem__(self, name: str) -> str:
+        return self.url(name)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def names(self) -> List[str]:
+        return list(self.files)
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Optional, Tuple
+
+
+class FragmentCache:
+    """
+    In-process store of the rendered template fragments, bounded to `maxsize` entries
+    evicted by least recent use, each entry expiring after its time to live.
+
+    Used by the `{% cache %}` tag of the `JinjaTemplateEngine` and the cached blocks of the
+    `MakoTemplateEngine`. Each worker process has its own entries.
+    """
+
+    __slots__ = ("maxsize", "ttl", "entries")
+
+    def __init__(self, maxsize: Optional[int] = 1024, ttl: Optional[float] = 300) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the fragment for the key or `None` when missing or expired.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        Stores the fragment for `ttl` seconds, the default `ttl` of the cache when not given.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = monotonic() + ttl if ttl is not None else None
+        self.entries[key] = (value, expires_at)
+        self.entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def get_or_render(
+        self, key: str, render: Callable[[], str], ttl: Optional[float] = None
+    ) -> str:
+        value = self.get(key)
+        if value is None:
+            value = render()
+            self.set(key, value, ttl)
+        return value
+
+    def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
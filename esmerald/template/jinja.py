@@ -1,17 +1,23 @@
+import os
 from os import PathLike
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Union
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Union
 
 from esmerald.exceptions import MissingDependency, TemplateNotFound
 from esmerald.protocols.template import TemplateEngineProtocol
+from esmerald.template.cache import FragmentCache
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydantic import DirectoryPath
 
 try:
-    from jinja2 import Environment, FileSystemLoader
+    from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader
     from jinja2 import Template as JinjaTemplate
     from jinja2 import TemplateNotFound as JinjaTemplateNotFound
+    from jinja2 import nodes
+    from jinja2.bccache import Bucket
+    from jinja2.ext import Extension
+    from jinja2.parser import Parser
 except ImportError as exc:  # pragma: no cover
     raise MissingDependency("jinja2 is not installed") from exc
 
@@ -27,12 +33,124 @@ except ImportError:  # pragma: nocover
     jinja2 = None
 
 
+class MemoryBytecodeCache(BytecodeCache):
+    """
+    Keeps the compiled templates in memory, for the lifetime of the process.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: Dict[str, bytes] = {}
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        code = self.buckets.get(bucket.key)
+        if code is not None:
+            bucket.bytecode_from_string(code)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        self.buckets[bucket.key] = bucket.bytecode_to_string()
+
+    def clear(self) -> None:
+        self.buckets.clear()
+
+
+def get_bytecode_cache(
+    value: Optional[Union[str, PathLike, BytecodeCache]]
+) -> Optional[BytecodeCache]:
+    """
+    Builds the bytecode cache for the given value, `"memory"` for a `MemoryBytecodeCache` or
+    the path of a directory for a `FileSystemBytecodeCache`.
+    """
+    if value is None or isinstance(value, BytecodeCache):
+        return value
+    if value == "memory":
+        return MemoryBytecodeCache()
+    os.makedirs(value, exist_ok=True)
+    return FileSystemBytecodeCache(str(value))
+
+
+def get_async_bytecode_cache(cache: Optional[BytecodeCache]) -> Optional[BytecodeCache]:
+    """
+    Returns the bytecode cache for the async version of the templates, compiled differently
+    and therefore stored apart.
+    """
+    if isinstance(cache, FileSystemBytecodeCache):
+        return FileSystemBytecodeCache(cache.directory, cache.pattern.replace("%s", "async_%s"))
+    if isinstance(cache, MemoryBytecodeCache):
+        return MemoryBytecodeCache()
+    return None
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Adds the `{% cache key, ttl %}...{% endcache %}` tag, rendering its body once per key and
+    template and serving it from the `fragment_cache` of the environment for `ttl` seconds,
+    the default of the cache when omitted.
+
+    The key is any expression, use a list for several variables.
+
+    **Example**
+
+    ```jinja
+    {% cache ["sidebar", user.id], 600 %}
+        {% include "sidebar.html" %}
+    {% endcache %}
+    ```
+    """
+
+    tags = {"cache"}
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        environment.extend(fragment_cache=FragmentCache())
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        args = [nodes.Const(parser.name), parser.parse_expression()]
+        if parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(self.call_method("_cache", args), [], [], body).set_lineno(lineno)
+
+    def _cache(
+        self, template_name: Optional[str], key: Any, ttl: Optional[float], caller: Any
+    ) -> Any:
+        cache_key = f"{template_name}:{key!r}"
+        if self.environment.is_async:
+            return self._cache_async(cache_key, ttl, caller)
+        return self.environment.fragment_cache.get_or_render(  # type: ignore[attr-defined]
+            cache_key, caller, ttl
+        )
+
+    async def _cache_async(self, key: str, ttl: Optional[float], caller: Any) -> str:
+        cache: FragmentCache = self.environment.fragment_cache  # type: ignore[attr-defined]
+        value = cache.get(key)
+        if value is None:
+            value = await caller()
+            cache.set(key, value, ttl)
+        return value
+
+
 class JinjaTemplateEngine(TemplateEngineProtocol[JinjaTemplate]):
     def __init__(
-        self, directory: Union["DirectoryPath", List["DirectoryPath"]], **env_options: Any
+        self,
+        directory: Union["DirectoryPath", List["DirectoryPath"]],
+        bytecode_cache: Optional[Union[str, PathLike, BytecodeCache]] = None,
+        fragment_cache: Optional[FragmentCache] = None,
+        **env_options: Any,
     ) -> None:
         super().__init__(directory)
+        env_options.setdefault("bytecode_cache", get_bytecode_cache(bytecode_cache))
+        if fragment_cache is not None:
+            env_options["extensions"] = [
+                *env_options.get("extensions", ()),
+                FragmentCacheExtension,
+            ]
         self.env = self._create_environment(directory, **env_options)
+        if fragment_cache is not None:
+            self.env.fragment_cache = fragment_cache  # type: ignore[attr-defined]
+        self.async_env: Optional[Environment] = None
 
     def _create_environment(
         self, directory: Union[str, PathLike, List[Path]], **env_options: Any
@@ -54,3 +172,41 @@ class JinjaTemplateEngine(TemplateEngineProtocol[JinjaTemplate]):
             return self.env.get_template(template_name)
         except JinjaTemplateNotFound as e:  # pragma: no cover
             raise TemplateNotFound(template_name=template_name) from e
+
+    def get_async_template(self, template_name: str) -> JinjaTemplate:
+        """
+        Returns the template compiled for `generate_async()` and `render_async()`.
+        """
+        if self.async_env is None:
+            if self.env.is_async:
+                self.async_env = self.env
+            else:
+                self.async_env = self.env.overlay(
+                    enable_async=True,
+                    bytecode_cache=get_async_bytecode_cache(self.env.bytecode_cache),
+                )
+        try:
+            return self.async_env.get_template(template_name)
+        except JinjaTemplateNotFound as e:
+            raise TemplateNotFound(template_name=template_name) from e
+
+    def precompile(
+        self, extensions: Optional[Collection[str]] = None, ignore_errors: bool = False
+    ) -> List[str]:
+        """
+        Compiles the templates, sync and async versions, filling the bytecode cache, and
+        returns the names of the compiled templates.
+
+        Without `ignore_errors`, the first template failing to compile raises.
+        """
+        compiled: List[str] = []
+        for template_name in self.env.list_templates(extensions=extensions):
+            try:
+                self.get_template(template_name)
+                self.get_async_template(template_name)
+            except Exception:
+                if not ignore_errors:
+                    raise
+                continue
+            compiled.append(template_name)
+        return compiled
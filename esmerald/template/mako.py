@@ -1,12 +1,16 @@
-from typing import TYPE_CHECKING, List, Union
+import os
+from os import PathLike
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, List, Optional, Union
 
 from esmerald.exceptions import MissingDependency, TemplateNotFound
 from esmerald.protocols.template import TemplateEngineProtocol
+from esmerald.template.cache import FragmentCache
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydantic import DirectoryPath
 
 try:
+    from mako.cache import CacheImpl, register_plugin
     from mako.exceptions import TemplateLookupException as MakoTemplateNotFound
     from mako.lookup import TemplateLookup
     from mako.template import Template as MakoTemplate
@@ -14,11 +18,74 @@ except ImportError as exc:  # pragma: no cover
     raise MissingDependency("mako is not installed") from exc
 
 
+class FragmentCacheImpl(CacheImpl):
+    """
+    Mako cache implementation storing the cached blocks and defs in the `FragmentCache` of
+    the `MakoTemplateEngine`, keyed by template.
+
+    **Example**
+
+    ```mako
+    <%block name="sidebar" cached="True" cache_key="${user.id}" cache_timeout="600">
+        <%include file="sidebar.html"/>
+    </%block>
+    ```
+    """
+
+    def get_or_create(self, key: str, creation_function: Callable[[], str], **kw: Any) -> str:
+        return self.get_store(kw).get_or_render(
+            self.get_key(key), creation_function, kw.get("timeout")
+        )
+
+    def set(self, key: str, value: str, **kw: Any) -> None:
+        self.get_store(kw).set(self.get_key(key), value, kw.get("timeout"))
+
+    def get(self, key: str, **kw: Any) -> Optional[str]:
+        return self.get_store(kw).get(self.get_key(key))
+
+    def invalidate(self, key: str, **kw: Any) -> None:
+        self.get_store(kw).delete(self.get_key(key))
+
+    def get_key(self, key: str) -> str:
+        return f"{self.cache.id}:{key}"
+
+    @staticmethod
+    def get_store(kw: Dict[str, Any]) -> FragmentCache:
+        store: FragmentCache = kw["fragment_cache"]
+        return store
+
+
+register_plugin("esmerald", __name__, "FragmentCacheImpl")
+
+
 class MakoTemplateEngine(TemplateEngineProtocol[MakoTemplate]):
-    def __init__(self, directory: Union["DirectoryPath", List["DirectoryPath"]]) -> None:
+    def __init__(
+        self,
+        directory: Union["DirectoryPath", List["DirectoryPath"]],
+        bytecode_cache: Optional[Union[str, PathLike]] = None,
+        fragment_cache: Optional[FragmentCache] = None,
+    ) -> None:
+        """
+        Mako keeps the compiled templates in memory. With the path of a directory as
+        `bytecode_cache`, the compiled modules are also written there and reused by the other
+        processes.
+
+        With a `fragment_cache`, the cached blocks and defs are stored there.
+        """
         super().__init__(directory)
+        module_directory = None
+        if bytecode_cache is not None and bytecode_cache != "memory":
+            module_directory = str(bytecode_cache)
+        cache_options: Dict[str, Any] = {}
+        if fragment_cache is not None:
+            cache_options = {
+                "cache_impl": "esmerald",
+                "cache_args": {"fragment_cache": fragment_cache},
+            }
         self.engine = TemplateLookup(
-            directories=directory if isinstance(directory, (list, tuple)) else [directory]
+            directories=directory if isinstance(directory, (list, tuple)) else [directory],
+            module_directory=module_directory,
+            **cache_options,
         )
 
     def get_template(self, template_name: str) -> MakoTemplate:  # pragma: no cover
@@ -26,3 +93,28 @@ class MakoTemplateEngine(TemplateEngineProtocol[MakoTemplate]):
             return self.engine.get_template(template_name)
         except MakoTemplateNotFound as e:
             raise TemplateNotFound(template_name=template_name) from e
+
+    def precompile(
+        self, extensions: Optional[Collection[str]] = None, ignore_errors: bool = False
+    ) -> List[str]:
+        """
+        Compiles the templates and returns the names of the compiled templates.
+
+        Without `ignore_errors`, the first template failing to compile raises.
+        """
+        compiled: List[str] = []
+        for directory in self.engine.directories:
+            for current, _, filenames in os.walk(directory):
+                for filename in sorted(filenames):
+                    if extensions is not None and filename.rsplit(".", 1)[-1] not in extensions:
+                        continue
+                    path = os.path.relpath(os.path.join(current, filename), directory)
+                    template_name = path.replace(os.sep, "/")
+                    try:
+                        self.engine.get_template(template_name)
+                    except Exception:
+                        if not ignore_errors:
+                            raise
+                        continue
+                    compiled.append(template_name)
+        return compiled
@@ -17,6 +17,8 @@ from pydantic import AnyUrl
 from starlette.testclient import TestClient  # noqa
 
 from esmerald.applications import Esmerald
+from esmerald.encoders import JSONEngine
+from esmerald.protocols.cache import CacheBackendProtocol
 from esmerald.utils.crypto import get_random_secret_key
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -119,6 +121,10 @@ def create_client(
     lifespan: Optional[Callable[["Esmerald"], "AsyncContextManager"]] = None,
     cookies: Optional[CookieTypes] = None,
     redirect_slashes: Optional[bool] = None,
+    enable_route_tree: Optional[bool] = None,
+    enable_concurrent_dependencies: Optional[bool] = None,
+    json_engine: Optional[Union[str, JSONEngine]] = None,
+    response_cache_backend: Optional[CacheBackendProtocol] = None,
     tags: Optional[List[str]] = None,
     webhooks: Optional[Sequence["WebhookGateway"]] = None,
 ) -> EsmeraldTestClient:
@@ -159,9 +165,13 @@ def create_client(
             session_config=session_config,
             lifespan=lifespan,
             redirect_slashes=redirect_slashes,
+            enable_route_tree=enable_route_tree,
             enable_openapi=enable_openapi,
             openapi_version=openapi_version,
             include_in_schema=include_in_schema,
+            enable_concurrent_dependencies=enable_concurrent_dependencies,
+            json_engine=json_engine,
+            response_cache_backend=response_cache_backend,
             tags=tags,
             webhooks=webhooks,
         ),
@@ -1,12 +1,19 @@
 import re
 from inspect import Parameter as InspectParameter
 from inspect import Signature
-from typing import Any, ClassVar, Dict, Optional, Set, Union
+from typing import Any, Callable, ClassVar, Dict, Optional, Set, Tuple, Union
 
 import msgspec
 from msgspec import ValidationError as MsgspecValidationError
 from orjson import loads
-from pydantic import ValidationError
+from pydantic import (
+    ConfigDict,
+    PydanticSchemaGenerationError,
+    PydanticUserError,
+    TypeAdapter,
+    ValidationError,
+)
+from typing_extensions import Annotated
 
 from esmerald.exceptions import ImproperlyConfigured, InternalServerError, ValidationErrorException
 from esmerald.parsers import ArbitraryBaseModel
@@ -28,7 +35,7 @@ class EsmeraldSignature(ArbitraryBaseModel):
         Parses the kwargs for a possible msgspec Struct and instantiates it.
         """
         for k, v in kwargs.items():
-            if k in cls.msgspec_structs:
+            if k in cls.msgspec_structs and not isinstance(v, cls.msgspec_structs[k]):
                 kwargs[k] = msgspec.json.decode(
                     msgspec.json.encode(v), type=cls.msgspec_structs[k]
                 )
@@ -52,6 +59,49 @@ class EsmeraldSignature(ArbitraryBaseModel):
         except MsgspecValidationError as e:
             raise cls.build_msgspec_exception(connection, e) from e
 
+    @classmethod
+    def create_body_decoder(
+        cls, field_name: str
+    ) -> Optional[Callable[[Union[Request, WebSocket], bytes], Any]]:
+        """
+        Creates the decoder validating a raw JSON body straight into the type of the given
+        field, via a `msgspec` decoder for a `Struct` or a pydantic `TypeAdapter` otherwise.
+
+        Returns `None` when no adapter can be built for the type, leaving the body to be
+        parsed and then validated by the signature model.
+        """
+        if field_name in cls.msgspec_structs:
+            decoder = msgspec.json.Decoder(type=cls.msgspec_structs[field_name])
+
+            def decode(connection: Union[Request, WebSocket], body: bytes) -> Any:
+                try:
+                    return decoder.decode(body)
+                except MsgspecValidationError as e:
+                    raise cls.build_msgspec_exception(connection, e) from e
+
+            return decode
+
+        field = cls.model_fields[field_name]
+        annotation = field.annotation
+        if field.metadata:
+            annotation = Annotated[(annotation, *field.metadata)]  # type: ignore
+        try:
+            adapter: TypeAdapter = TypeAdapter(annotation)
+        except PydanticSchemaGenerationError:
+            # Types containing non pydantic classes, as allowed by the signature model.
+            try:
+                adapter = TypeAdapter(annotation, config=ConfigDict(arbitrary_types_allowed=True))
+            except PydanticUserError:
+                return None
+
+        def validate(connection: Union[Request, WebSocket], body: bytes) -> Any:
+            try:
+                return adapter.validate_json(body)
+            except ValidationError as e:
+                raise cls.build_exception(connection, e, loc=(field_name,)) from e
+
+        return validate
+
     @classmethod
     def build_msgspec_exception(
         cls, connection: Union[Request, WebSocket], exception: MsgspecValidationError
@@ -75,12 +125,17 @@ class EsmeraldSignature(ArbitraryBaseModel):
 
     @classmethod
     def build_exception(
-        cls, connection: Union[Request, WebSocket], exception: ValidationError
+        cls,
+        connection: Union[Request, WebSocket],
+        exception: ValidationError,
+        loc: Tuple[str, ...] = (),
     ) -> Union[InternalServerError, ValidationErrorException]:
         server_errors = []
         client_errors = []
 
         for err in loads(exception.json()):
+            if loc:
+                err["loc"] = [*loc, *err["loc"]]
             if not cls.is_server_error(err):
                 client_errors.append(err)
             else:
@@ -1,10 +1,25 @@
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Set, Tuple, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
+import anyio
 from pydantic.fields import FieldInfo
 
 from esmerald.context import Context
 from esmerald.enums import EncodingType, ParamType
-from esmerald.exceptions import ImproperlyConfigured
+from esmerald.exceptions import ImproperlyConfigured, ValidationErrorException
 from esmerald.parsers import ArbitraryExtraBaseModel, parse_form_data
 from esmerald.requests import Request
 from esmerald.transformers.datastructures import EsmeraldSignature as SignatureModel
@@ -12,11 +27,12 @@ from esmerald.transformers.utils import (
     Dependency,
     ParamSetting,
     create_parameter_setting,
-    get_request_params,
+    get_dependency_stages,
     get_signature,
     merge_sets,
 )
-from esmerald.utils.constants import CONTEXT, DATA, PAYLOAD, RESERVED_KWARGS
+from esmerald.typing import Void
+from esmerald.utils.constants import CONTEXT, DATA, DEPENDENCY_CACHE, PAYLOAD, RESERVED_KWARGS
 from esmerald.utils.pydantic.schema import is_field_optional
 
 if TYPE_CHECKING:
@@ -28,6 +44,22 @@ if TYPE_CHECKING:
 MEDIA_TYPES = [EncodingType.MULTI_PART, EncodingType.URL_ENCODED]
 MappingUnion = Mapping[Union[int, str], Any]
 
+# The (alias, name, default, required) of a parameter and the parameters to extract from each
+# connection attribute, in the order they are validated.
+PlanEntry = Tuple[str, str, Any, bool]
+ParamPlan = Tuple[Tuple[str, Tuple[PlanEntry, ...]], ...]
+
+
+class PendingDependency:
+    """
+    Placeholder of a dependency being resolved in the request cache.
+    """
+
+    __slots__ = ("event",)
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+
 
 class TransformerModel(ArbitraryExtraBaseModel):
     def __init__(
@@ -41,6 +73,7 @@ class TransformerModel(ArbitraryExtraBaseModel):
         reserved_kwargs: Set[str],
         query_param_names: Set[ParamSetting],
         is_optional: bool,
+        body_decoder: Optional[Callable[[Union["WebSocket", "Request"], bytes], Any]] = None,
         **kwargs: Any,
     ):
         super().__init__(**kwargs)
@@ -62,6 +95,9 @@ class TransformerModel(ArbitraryExtraBaseModel):
             or reserved_kwargs
         )
         self.is_optional = is_optional
+        self.body_decoder = body_decoder
+        self.dependency_stages = get_dependency_stages(dependencies)
+        self.param_plan = self.create_param_plan()
 
     def get_cookie_params(self) -> Set[ParamSetting]:
         return self.cookies
@@ -75,6 +111,41 @@ class TransformerModel(ArbitraryExtraBaseModel):
     def get_header_params(self) -> Set[ParamSetting]:
         return self.headers
 
+    def create_param_plan(self) -> ParamPlan:
+        """
+        Flattens the parameter settings into the plan used by `to_kwargs`.
+
+        Only the connection attributes with declared parameters are part of the plan and
+        the settings repeated for the same parameter are extracted once.
+        """
+        sources = (
+            ("query_params", self.query_params),
+            ("path_params", self.path_params),
+            ("headers", self.headers),
+            ("cookies", self.cookies),
+        )
+        param_plan = []
+        for attribute, params in sources:
+            if not params:
+                continue
+
+            entries: Dict[Tuple[str, str, bool], Any] = {}
+            for param in params:
+                key = (param.field_alias, param.field_name, param.is_required)
+                entries.pop(key, None)
+                entries[key] = param.default_value
+
+            param_plan.append(
+                (
+                    attribute,
+                    tuple(
+                        (alias, name, default, is_required)
+                        for (alias, name, is_required), default in entries.items()
+                    ),
+                )
+            )
+        return tuple(param_plan)
+
     @classmethod
     def dependency_tree(cls, key: str, dependencies: "Dependencies") -> Dependency:
         inject = dependencies[key]
@@ -215,6 +286,11 @@ class TransformerModel(ArbitraryExtraBaseModel):
         elif PAYLOAD in reserved_kwargs:
             is_optional = is_field_optional(signature_model.model_fields["payload"])
 
+        body_decoder = None
+        if data_field and not form_data and not cls.dependencies_use_body(_dependencies):
+            field_name = DATA if DATA in signature_model.model_fields else PAYLOAD
+            body_decoder = signature_model.create_body_decoder(field_name)
+
         return TransformerModel(
             form_data=form_data,
             dependencies=_dependencies,
@@ -225,8 +301,22 @@ class TransformerModel(ArbitraryExtraBaseModel):
             reserved_kwargs=reserved_kwargs,
             query_param_names=query_params_names,
             is_optional=is_optional,
+            body_decoder=body_decoder,
         )
 
+    @classmethod
+    def dependencies_use_body(cls, dependencies: Iterable[Dependency]) -> bool:
+        """
+        Checks if any of the dependencies, at any depth, also declares the request body.
+        """
+        for dependency in dependencies:
+            model_fields = get_signature(dependency.inject).model_fields
+            if DATA in model_fields or PAYLOAD in model_fields:
+                return True
+            if cls.dependencies_use_body(dependency.dependencies):
+                return True
+        return False
+
     @classmethod
     def update_parameters(
         cls,
@@ -264,81 +354,62 @@ class TransformerModel(ArbitraryExtraBaseModel):
         connection: Union["WebSocket", "Request"],
         handler: Union["HTTPHandler", "WebSocketHandler"] = None,
     ) -> Any:
-        connection_params = {}
-        for key, value in connection.query_params.items():
-            if key not in self.query_param_names and len(value) == 1:
-                value = value[0]
-                connection_params[key] = value
-
-        query_params = get_request_params(
-            params=cast("MappingUnion", connection.query_params),
-            expected=self.query_params,
-            url=connection.url,
-        )
-        path_params = get_request_params(
-            params=cast("MappingUnion", connection.path_params),
-            expected=self.path_params,
-            url=connection.url,
-        )
-        headers = get_request_params(
-            params=cast("MappingUnion", connection.headers),
-            expected=self.headers,
-            url=connection.url,
-        )
-        cookies = get_request_params(
-            params=cast("MappingUnion", connection.cookies),
-            expected=self.cookies,
-            url=connection.url,
-        )
-
-        if not self.reserved_kwargs:
-            return {**query_params, **path_params, **headers, **cookies}
+        kwargs: Dict[str, Any] = {}
+        for attribute, params in self.param_plan:
+            values = getattr(connection, attribute)
+            missing = []
+            for alias, name, default, is_required in params:
+                if alias in values:
+                    kwargs[name] = values[alias]
+                elif is_required:
+                    missing.append(alias)
+                else:
+                    kwargs[name] = default
+            if missing:
+                raise ValidationErrorException(
+                    f"Missing required parameter(s) {', '.join(missing)} for url {connection.url}."
+                )
 
-        return self.handle_reserved_kwargs(
-            connection=connection,
-            connection_params=connection_params,
-            path_params=path_params,
-            query_params=query_params,
-            headers=headers,
-            cookies=cookies,
-            handler=handler,
-        )
+        if self.reserved_kwargs:
+            self.handle_reserved_kwargs(connection=connection, kwargs=kwargs, handler=handler)
+        return kwargs
 
     def handle_reserved_kwargs(
         self,
         connection: Union["WebSocket", "Request"],
-        connection_params: Any,
-        path_params: Any,
-        query_params: Any,
-        headers: Any,
-        cookies: Any,
+        kwargs: Dict[str, Any],
         handler: Optional[Any] = None,
-    ) -> Any:
-        reserved_kwargs: Any = {}
+    ) -> None:
         if DATA in self.reserved_kwargs:
-            reserved_kwargs[DATA] = self.get_request_data(request=cast("Request", connection))
+            kwargs[DATA] = self.get_request_data(request=cast("Request", connection))
         if PAYLOAD in self.reserved_kwargs:
-            reserved_kwargs[PAYLOAD] = self.get_request_data(request=cast("Request", connection))
+            kwargs[PAYLOAD] = self.get_request_data(request=cast("Request", connection))
 
         if CONTEXT in self.reserved_kwargs and handler is not None:
-            reserved_kwargs[CONTEXT] = self.get_request_context(
+            kwargs[CONTEXT] = self.get_request_context(
                 handler=handler, request=cast("Request", connection)
             )
 
         if "request" in self.reserved_kwargs:
-            reserved_kwargs["request"] = connection
+            kwargs["request"] = connection
         if "socket" in self.reserved_kwargs:
-            reserved_kwargs["socket"] = connection
+            kwargs["socket"] = connection
         if "headers" in self.reserved_kwargs:
-            reserved_kwargs["headers"] = connection.headers
+            kwargs["headers"] = connection.headers
         if "cookies" in self.reserved_kwargs:
-            reserved_kwargs["cookies"] = connection.cookies
+            kwargs["cookies"] = connection.cookies
         if "query" in self.reserved_kwargs:
-            reserved_kwargs["query"] = connection_params
+            kwargs["query"] = self.get_connection_params(connection=connection)
         if "state" in self.reserved_kwargs:
-            reserved_kwargs["state"] = connection.app.state.copy()  # pragma: no cover
+            kwargs["state"] = connection.app.state.copy()  # pragma: no cover
 
-        return {**reserved_kwargs, **path_params, **query_params, **headers, **cookies}
+    def get_connection_params(self, connection: Union["WebSocket", "Request"]) -> Dict[str, Any]:
+        connection_params = {}
+        for key, value in connection.query_params.items():
+            if key not in self.query_param_names and len(value) == 1:
+                value = value[0]
+                connection_params[key] = value
+        return connection_params
 
     @classmethod
     def validate_data(
@@ -404,6 +475,8 @@ class TransformerModel(ArbitraryExtraBaseModel):
     async def get_request_data(self, request: "Request") -> Any:
         # Fast exit principle
         if not self.form_data:
+            if self.body_decoder is not None:
+                return self.body_decoder(request, await request.json_body())
             return await request.json()
 
         media_type, field = self.form_data
@@ -419,17 +492,147 @@ class TransformerModel(ArbitraryExtraBaseModel):
         """
         return Context(__handler__=handler, __request__=request)
 
+    async def resolve_dependencies(
+        self,
+        connection: Union["WebSocket", "Request"],
+        kwargs: Dict[str, Any],
+        concurrent: bool = False,
+    ) -> None:
+        """
+        Resolves the dependencies of the handler into the kwargs.
+
+        When `concurrent` is set, the independent dependencies are resolved concurrently,
+        stage by stage.
+        """
+        if concurrent:
+            await self.resolve_dependency_stages(self.dependency_stages, connection, kwargs)
+            return
+
+        for dependency in self.dependencies:
+            kwargs[dependency.key] = await self.get_dependencies(
+                dependency=dependency, connection=connection, **kwargs
+            )
+
+    async def resolve_dependency_stages(
+        self,
+        dependency_stages: Tuple[Tuple["Dependency", ...], ...],
+        connection: Union["WebSocket", "Request"],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """
+        Resolves each stage of dependencies in a task group.
+
+        The first error raised cancels the remaining dependencies of the stage and is
+        propagated as is.
+        """
+        for stage in dependency_stages:
+            if len(stage) == 1:
+                kwargs[stage[0].key] = await self.get_concurrent_dependencies(
+                    stage[0], connection, **kwargs
+                )
+            else:
+                kwargs.update(await self.resolve_dependency_stage(stage, connection, kwargs))
+
+    async def resolve_dependency_stage(
+        self,
+        stage: Tuple["Dependency", ...],
+        connection: Union["WebSocket", "Request"],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        errors: List[Exception] = []
+
+        async def resolve(dependency: "Dependency") -> None:
+            try:
+                values[dependency.key] = await self.get_concurrent_dependencies(
+                    dependency, connection, **kwargs
+                )
+            except Exception as e:
+                errors.append(e)
+                task_group.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            for dependency in stage:
+                task_group.start_soon(resolve, dependency)
+
+        if errors:
+            raise errors[0]
+        return values
+
+    async def get_concurrent_dependencies(
+        self,
+        dependency: "Dependency",
+        connection: Union["WebSocket", "Request"],
+        **kwargs: Any,
+    ) -> Any:
+        return await self.get_request_cached_dependency(
+            dependency=dependency, connection=connection, kwargs=kwargs, concurrent=True
+        )
+
     async def get_dependencies(
         self,
         dependency: "Dependency",
         connection: Union["WebSocket", "Request"],
         **kwargs: Any,
+    ) -> Any:
+        return await self.get_request_cached_dependency(
+            dependency=dependency, connection=connection, kwargs=kwargs, concurrent=False
+        )
+
+    async def get_request_cached_dependency(
+        self,
+        dependency: "Dependency",
+        connection: Union["WebSocket", "Request"],
+        kwargs: Dict[str, Any],
+        concurrent: bool,
+    ) -> Any:
+        """
+        Resolves a dependency at most once per request.
+
+        The value of each `Inject` is stored in the connection scope and shared by every
+        dependency requiring it, unless the `Inject` opts out with `use_request_cache=False`.
+        A dependency being resolved by a concurrent task is awaited instead of resolved again.
+        """
+        inject = dependency.inject
+        if not inject.use_request_cache:
+            return await self.solve_dependency(dependency, connection, kwargs, concurrent)
+
+        cache: Dict[int, Any] = connection.scope.setdefault(DEPENDENCY_CACHE, {})
+        key = id(inject)
+        cached = cache.get(key, Void)
+        if isinstance(cached, PendingDependency):
+            await cached.event.wait()
+            cached = cache.get(key, Void)
+        if cached is not Void:
+            return cached
+
+        pending = cache[key] = PendingDependency()
+        try:
+            value = await self.solve_dependency(dependency, connection, kwargs, concurrent)
+        except BaseException:
+            del cache[key]
+            raise
+        finally:
+            pending.event.set()
+
+        cache[key] = value
+        return value
+
+    async def solve_dependency(
+        self,
+        dependency: "Dependency",
+        connection: Union["WebSocket", "Request"],
+        kwargs: Dict[str, Any],
+        concurrent: bool,
     ) -> Any:
         signature_model = get_signature(dependency.inject)
-        for _dependency in dependency.dependencies:
-            kwargs[_dependency.key] = await self.get_dependencies(
-                dependency=_dependency, connection=connection, **kwargs
-            )
+        if concurrent:
+            await self.resolve_dependency_stages(dependency.dependency_stages, connection, kwargs)
+        else:
+            for _dependency in dependency.dependencies:
+                kwargs[_dependency.key] = await self.get_dependencies(
+                    dependency=_dependency, connection=connection, **kwargs
+                )
         dependency_kwargs = signature_model.parse_values_for_connection(
             connection=connection, **kwargs
         )
@@ -1,4 +1,16 @@
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Set, Tuple, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from pydantic.fields import FieldInfo
 from starlette.datastructures import URL
@@ -34,6 +46,49 @@ class Dependency(HashableBaseModel, ArbitraryExtraBaseModel):
         self.key = key
         self.inject = inject
         self.dependencies = dependencies
+        self.dependency_stages = get_dependency_stages(dependencies)
+
+    def get_keys(self) -> Set[str]:
+        """
+        Returns the keys of the dependency and of all of its sub dependencies.
+        """
+        keys = {self.key}
+        for dependency in self.dependencies:
+            keys.update(dependency.get_keys())
+        return keys
+
+
+def get_dependency_stages(
+    dependencies: Iterable["Dependency"],
+) -> Tuple[Tuple["Dependency", ...], ...]:
+    """
+    Groups sibling dependencies into stages that can be resolved concurrently.
+
+    A dependency requiring, at any depth, the key of one of its siblings is placed in a
+    stage after it. The order of the dependencies is kept within each stage.
+    """
+    pending = list(dependencies)
+    keys = {dependency.key for dependency in pending}
+    requires = {
+        dependency.key: {
+            key
+            for sub_dependency in dependency.dependencies
+            for key in sub_dependency.get_keys()
+            if key in keys and key != dependency.key
+        }
+        for dependency in pending
+    }
+
+    stages: List[Tuple["Dependency", ...]] = []
+    resolved: Set[str] = set()
+    while pending:
+        stage = tuple(
+            dependency for dependency in pending if requires[dependency.key] <= resolved
+        ) or tuple(pending)
+        stages.append(stage)
+        resolved.update(dependency.key for dependency in stage)
+        pending = [dependency for dependency in pending if dependency.key not in resolved]
+    return tuple(stages)
 
 
 def merge_sets(first_set: Set[ParamSetting], second_set: Set[ParamSetting]) -> Set[ParamSetting]:
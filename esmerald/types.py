@@ -7,6 +7,7 @@ from typing import (
     Dict,
     List,
     Mapping,
+    Optional,
     Type,
     TypeVar,
     Union,
@@ -19,6 +20,8 @@ from starlette.types import ASGIApp  # noqa
 from typing_extensions import Literal
 
 from esmerald.backgound import BackgroundTask, BackgroundTasks
+from esmerald.cache import RequestCoalescing, ResponseCache
+from esmerald.config.compression import CompressionConfig
 from esmerald.exceptions import MissingDependency
 from esmerald.routing.gateways import WebSocketGateway
 from esmerald.routing.router import Include
@@ -88,6 +91,10 @@ ReservedKwargs = get_args(_ReservedKwargs)
 
 ResponseHeaders = Dict[str, ResponseHeader]
 ResponseCookies = List[Cookie]
+ETagCallable = Callable[[Request], Union[Optional[str], Awaitable[Optional[str]]]]
+ResponseCacheType = Union[bool, float, ResponseCache]
+RequestCoalescingType = Union[bool, RequestCoalescing]
+CompressionType = Union[bool, CompressionConfig]
 AsyncAnyCallable = Callable[..., Awaitable[Any]]  # type: ignore
 
 
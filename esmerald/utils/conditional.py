@@ -0,0 +1,87 @@
+"""
+Helpers for the conditional requests (`If-None-Match` and `If-Modified-Since`).
+"""
+from email.utils import parsedate_to_datetime
+from hashlib import blake2b
+from typing import Optional
+
+from starlette import status
+from starlette.background import BackgroundTask
+from starlette.datastructures import Headers
+from starlette.responses import Response
+
+NOT_MODIFIED_HEADERS = (
+    "cache-control",
+    "content-location",
+    "date",
+    "etag",
+    "expires",
+    "last-modified",
+    "vary",
+)
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Builds a strong ETag from the body of a response.
+    """
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def quote_etag(value: str) -> str:
+    """
+    Quotes the given value as an ETag unless it is already.
+    """
+    if value.startswith('"') or value.startswith('W/"'):
+        return value
+    return f'"{value}"'
+
+
+def strip_weak(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """
+    Weak comparison of the ETag with the values of an `If-None-Match` header.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    etag = strip_weak(etag)
+    return any(strip_weak(value.strip()) == etag for value in if_none_match.split(","))
+
+
+def is_not_modified(response_headers: Headers, request_headers: Headers) -> bool:
+    """
+    Checks if the representation in the response was not modified since the one the
+    client has.
+
+    The `If-Modified-Since` is only evaluated when there is no `If-None-Match`.
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = response_headers.get("etag")
+        return etag is not None and etag_matches(etag, if_none_match)
+
+    if_modified_since = request_headers.get("if-modified-since")
+    last_modified = response_headers.get("last-modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def not_modified_response(
+    headers: Headers, background: Optional[BackgroundTask] = None
+) -> Response:
+    """
+    Builds the `304 Not Modified` response, without body, for the headers of a response.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={key: headers[key] for key in NOT_MODIFIED_HEADERS if key in headers},
+        background=background,
+    )
@@ -29,7 +29,9 @@ SOCKET = "socket"
 DATA = "data"
 PAYLOAD = "payload"
 REQUEST = "request"
+DEPENDENCY_CACHE = "dependency_cache"
 CONTEXT = "context"
+COMPRESSION = "compression"
 
 AVAILABLE_METHODS = [
     HttpMethod.GET,
@@ -0,0 +1,119 @@
+from typing import List
+
+import anyio
+import pytest
+
+from esmerald import Gateway, Inject, Injects, get, websocket
+from esmerald.routing.gateways import WebSocketGateway
+from esmerald.testclient import create_client
+from esmerald.transformers.utils import Dependency, get_dependency_stages
+from esmerald.websockets import WebSocket
+
+
+def create_handler(events: List[str]):
+    async def first() -> int:
+        events.append("first start")
+        await anyio.sleep(0.05)
+        events.append("first end")
+        return 1
+
+    async def second() -> int:
+        events.append("second start")
+        await anyio.sleep(0.05)
+        events.append("second end")
+        return 2
+
+    @get(
+        "/sum",
+        dependencies={"first": Inject(first), "second": Inject(second)},
+    )
+    async def sum_values(first: int = Injects(), second: int = Injects()) -> int:
+        return first + second
+
+    return sum_values
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_concurrent_dependencies(concurrent: bool) -> None:
+    events: List[str] = []
+
+    with create_client(
+        routes=[Gateway(handler=create_handler(events))],
+        enable_concurrent_dependencies=concurrent,
+    ) as client:
+        response = client.get("/sum")
+
+    assert response.json() == 3
+    if concurrent:
+        assert events[:2] == ["first start", "second start"] or events[:2] == [
+            "second start",
+            "first start",
+        ]
+    else:
+        assert events[0].split()[0] == events[1].split()[0]
+
+
+def test_concurrent_dependencies_error_cancels_siblings() -> None:
+    events: List[str] = []
+
+    async def slow() -> int:
+        await anyio.sleep(1)
+        events.append("slow end")
+        return 1
+
+    async def failing() -> int:
+        raise ValueError("failed")
+
+    @get("/fail", dependencies={"slow": Inject(slow), "failing": Inject(failing)})
+    async def fail(slow: int = Injects(), failing: int = Injects()) -> int:
+        return slow + failing
+
+    with create_client(
+        routes=[Gateway(handler=fail)], enable_concurrent_dependencies=True
+    ) as client:
+        response = client.get("/fail")
+        assert response.status_code == 500
+
+    assert events == []
+
+
+def test_concurrent_dependencies_websocket() -> None:
+    async def first() -> int:
+        return 1
+
+    async def second() -> int:
+        return 2
+
+    @websocket("/", dependencies={"first": Inject(first), "second": Inject(second)})
+    async def websocket_handler(
+        socket: WebSocket, first: int = Injects(), second: int = Injects()
+    ) -> None:
+        await socket.accept()
+        await socket.send_json({"value": first + second})
+        await socket.close()
+
+    with create_client(
+        routes=[WebSocketGateway(handler=websocket_handler)], enable_concurrent_dependencies=True
+    ) as client:
+        with client.websocket_connect("/") as ws:
+            assert ws.receive_json() == {"value": 3}
+
+
+def test_dependency_stages() -> None:
+    def provide() -> int:
+        return 1
+
+    config = Dependency(key="config", inject=Inject(provide), dependencies=[])
+    flags = Dependency(key="flags", inject=Inject(provide), dependencies=[])
+    session = Dependency(
+        key="session",
+        inject=Inject(provide),
+        dependencies=[Dependency(key="config", inject=Inject(provide), dependencies=[])],
+    )
+
+    stages = get_dependency_stages([session, config, flags])
+
+    assert [[dependency.key for dependency in stage] for stage in stages] == [
+        ["config", "flags"],
+        ["session"],
+    ]
@@ -0,0 +1,74 @@
+from typing import List
+
+import anyio
+import pytest
+
+from esmerald import Gateway, Inject, Injects, get
+from esmerald.testclient import create_client
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_dependency_resolved_once_per_request(concurrent: bool) -> None:
+    calls: List[str] = []
+
+    async def get_session() -> str:
+        calls.append("session")
+        await anyio.sleep(0.01)
+        return "session"
+
+    def get_users(session: str) -> str:
+        return f"users with {session}"
+
+    def get_items(session: str) -> str:
+        return f"items with {session}"
+
+    @get(
+        "/dashboard",
+        dependencies={
+            "session": Inject(get_session),
+            "users": Inject(get_users),
+            "items": Inject(get_items),
+        },
+    )
+    async def dashboard(users: str = Injects(), items: str = Injects()) -> List[str]:
+        return [users, items]
+
+    with create_client(
+        routes=[Gateway(handler=dashboard)], enable_concurrent_dependencies=concurrent
+    ) as client:
+        response = client.get("/dashboard")
+        assert response.json() == ["users with session", "items with session"]
+        assert calls == ["session"]
+
+        client.get("/dashboard")
+        assert calls == ["session", "session"]
+
+
+def test_dependency_opt_out_of_request_cache() -> None:
+    calls: List[str] = []
+
+    def get_session() -> str:
+        calls.append("session")
+        return "session"
+
+    def get_users(session: str) -> str:
+        return f"users with {session}"
+
+    def get_items(session: str) -> str:
+        return f"items with {session}"
+
+    @get(
+        "/dashboard",
+        dependencies={
+            "session": Inject(get_session, use_request_cache=False),
+            "users": Inject(get_users),
+            "items": Inject(get_items),
+        },
+    )
+    async def dashboard(users: str = Injects(), items: str = Injects()) -> List[str]:
+        return [users, items]
+
+    with create_client(routes=[Gateway(handler=dashboard)]) as client:
+        response = client.get("/dashboard")
+        assert response.json() == ["users with session", "items with session"]
+        assert calls == ["session", "session"]
@@ -0,0 +1,85 @@
+from esmerald import Esmerald, Gateway, Request, get
+from esmerald.encoders import get_json_engine
+from esmerald.exception_handlers import (
+    CachedExceptionHandlers,
+    error_response,
+    http_exception_handler,
+    render_error_body,
+)
+from esmerald.exceptions import HTTPException, NotAuthorized, NotFound
+from esmerald.responses import Response
+from esmerald.testclient import EsmeraldTestClient
+
+
+def test_cached_exception_handlers_resolve_the_closest_class() -> None:
+    handlers = CachedExceptionHandlers({HTTPException: http_exception_handler})
+
+    assert handlers.lookup(NotFound) is http_exception_handler
+    assert handlers.resolved[NotFound] is http_exception_handler
+    assert handlers.lookup(ValueError) is None
+
+
+def test_cached_exception_handlers_are_cleared_on_changes() -> None:
+    def not_found_handler(request: Request, exc: Exception) -> Response:  # pragma: no cover
+        return Response({})
+
+    handlers = CachedExceptionHandlers({HTTPException: http_exception_handler})
+    assert handlers.lookup(NotFound) is http_exception_handler
+
+    handlers[NotFound] = not_found_handler
+    assert handlers.lookup(NotFound) is not_found_handler
+
+    del handlers[NotFound]
+    assert handlers.lookup(NotFound) is http_exception_handler
+
+
+def test_error_response_reuses_the_encoded_body() -> None:
+    render_error_body.cache_clear()
+
+    first = error_response(401, NotAuthorized.detail)
+    second = error_response(401, NotAuthorized.detail)
+
+    assert first.body == second.body
+    assert get_json_engine().loads(first.body) == {"detail": NotAuthorized.detail}
+    assert render_error_body.cache_info().hits == 1
+
+
+def test_error_response_with_extra_and_status_code() -> None:
+    response = error_response(400, "Invalid", extra={"field": "name"}, include_status_code=True)
+
+    assert get_json_engine().loads(response.body) == {
+        "detail": "Invalid",
+        "extra": {"field": "name"},
+        "status_code": 400,
+    }
+
+
+def test_not_found_uses_the_default_handler_body() -> None:
+    app = Esmerald(routes=[], allowed_hosts=["testserver"])
+    client = EsmeraldTestClient(app)
+
+    response = client.get("/missing")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": NotFound.detail}
+
+
+def test_not_found_uses_a_custom_handler() -> None:
+    def not_found_handler(request: Request, exc: NotFound) -> Response:
+        return Response({"missing": request.url.path}, status_code=404)
+
+    @get("/")
+    async def home() -> str:  # pragma: no cover
+        return "home"
+
+    app = Esmerald(
+        routes=[Gateway(handler=home)],
+        exception_handlers={NotFound: not_found_handler},
+        allowed_hosts=["testserver"],
+    )
+    client = EsmeraldTestClient(app)
+
+    response = client.get("/missing")
+
+    assert response.status_code == 404
+    assert response.json() == {"missing": "/missing"}
@@ -0,0 +1,54 @@
+from esmerald import Gateway, Response, get
+from esmerald.datastructures import Cookie, ResponseHeader
+from esmerald.testclient import create_client
+
+response_headers = {"x-sku": ResponseHeader(value="123"), "x-none": ResponseHeader()}
+response_cookies = [Cookie(key="session", value="abc"), Cookie(key="theme", value="dark")]
+
+
+@get("/data", response_headers=response_headers, response_cookies=response_cookies)
+async def data() -> dict:
+    return {"name": "esmerald"}
+
+
+@get("/response", response_headers=response_headers, response_cookies=response_cookies)
+async def response() -> Response:
+    return Response(
+        {"name": "esmerald"},
+        headers={"x-sku": "456"},
+        cookies=[Cookie(key="theme", value="light")],
+    )
+
+
+def test_raw_headers_and_cookies_rendered_once() -> None:
+    with create_client(routes=[Gateway(handler=data)]):
+        assert data.get_raw_headers(response_headers) == [(b"x-sku", b"123")]
+        assert data.get_raw_cookies(response_cookies) == [
+            (b"set-cookie", b"session=abc; Path=/; SameSite=lax"),
+            (b"set-cookie", b"theme=dark; Path=/; SameSite=lax"),
+        ]
+
+
+def test_raw_headers_and_cookies_for_data() -> None:
+    with create_client(routes=[Gateway(handler=data)]) as client:
+        response = client.get("/data")
+
+        assert response.json() == {"name": "esmerald"}
+        assert response.headers["x-sku"] == "123"
+        assert "x-none" not in response.headers
+        assert sorted(response.headers.get_list("set-cookie")) == [
+            "session=abc; Path=/; SameSite=lax",
+            "theme=dark; Path=/; SameSite=lax",
+        ]
+
+
+def test_raw_headers_and_cookies_merged_with_the_response() -> None:
+    with create_client(routes=[Gateway(handler=response)]) as client:
+        response_ = client.get("/response")
+
+        assert response_.headers["x-sku"] == "456"
+        assert response_.headers["allow"] == "{'GET'}"
+        assert response_.headers.get_list("set-cookie") == [
+            "theme=light; Path=/; SameSite=lax",
+            "session=abc; Path=/; SameSite=lax",
+        ]
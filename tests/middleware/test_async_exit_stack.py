@@ -0,0 +1,102 @@
+from contextlib import AsyncExitStack
+
+import pytest
+
+from esmerald import Gateway, Request, get
+from esmerald.concurrency import LazyAsyncExitStack
+from esmerald.config import AsyncExitConfig
+from esmerald.middleware.asyncexitstack import AsyncExitStackMiddleware
+from esmerald.responses import PlainTextResponse
+from esmerald.testclient import EsmeraldTestClient, create_client
+
+stacks = []
+closed = []
+
+
+@get("/unused")
+async def unused(request: Request) -> str:
+    stacks.append(request.scope["esmerald_astack"])
+    return "unused"
+
+
+@get("/used")
+async def used(request: Request) -> str:
+    stack = request.scope["esmerald_astack"]
+    stacks.append(stack)
+
+    async def close() -> None:
+        closed.append("used")
+
+    stack.push_async_callback(close)
+    return "used"
+
+
+@get("/eager", eager_exit_stack=True)
+async def eager(request: Request) -> str:
+    stacks.append(request.scope["esmerald_astack"])
+    return "eager"
+
+
+def test_exit_stack_eager_by_default(test_client_factory):
+    stacks.clear()
+    with create_client(routes=[Gateway(handler=unused)]) as client:
+        assert client.get("/unused").json() == "unused"
+        assert type(stacks[-1]) is AsyncExitStack
+
+
+def test_lazy_exit_stack(test_client_factory):
+    stacks.clear()
+    closed.clear()
+    with create_client(
+        routes=[Gateway(handler=unused), Gateway(handler=used), Gateway(handler=eager)]
+    ) as client:
+        client.app.async_exit_config = AsyncExitConfig(lazy=True)
+        client.app.middleware_stack = client.app.build_middleware_stack()
+
+        assert client.get("/unused").json() == "unused"
+        assert isinstance(stacks[-1], LazyAsyncExitStack)
+        assert stacks[-1].stack is None
+
+        assert client.get("/used").json() == "used"
+        assert isinstance(stacks[-1].stack, AsyncExitStack)
+        assert closed == ["used"]
+
+        assert client.get("/eager").json() == "eager"
+        assert type(stacks[-1]) is AsyncExitStack
+
+
+def make_app(calls, error=None):
+    async def app(scope, receive, send):
+        stack = scope["stack"]
+        calls.append(type(stack))
+
+        async def close():
+            calls.append("closed")
+
+        stack.push_async_callback(close)
+        if error is not None:
+            raise error
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    return app
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_exit_stack_middleware(lazy):
+    calls = []
+    config = AsyncExitConfig(context_name="stack", lazy=lazy)
+    app = AsyncExitStackMiddleware(make_app(calls), config=config)
+
+    response = EsmeraldTestClient(app).get("/")
+    assert response.text == "ok"
+    assert calls == [LazyAsyncExitStack if lazy else AsyncExitStack, "closed"]
+
+
+def test_lazy_exit_stack_unwinds_on_error():
+    calls = []
+    config = AsyncExitConfig(context_name="stack", lazy=True)
+    app = AsyncExitStackMiddleware(make_app(calls, error=ValueError("boom")), config=config)
+
+    with pytest.raises(ValueError):
+        EsmeraldTestClient(app).get("/")
+    assert calls == [LazyAsyncExitStack, "closed"]
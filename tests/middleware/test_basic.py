@@ -1,6 +1,10 @@
-from esmerald import Gateway, get
-from esmerald.middleware.basic import BasicHTTPMiddleware
-from esmerald.testclient import create_client
+from starlette.middleware import Middleware as StarletteMiddleware
+
+from esmerald import Esmerald, Gateway, Request, Router, get
+from esmerald.middleware.basic import BasicHTTPMiddleware, FusedHookMiddleware, HookMiddleware
+from esmerald.middleware.exceptions import EsmeraldAPIExceptionMiddleware, FusedExceptionMiddleware
+from esmerald.responses import PlainTextResponse
+from esmerald.testclient import EsmeraldTestClient, create_client
 
 
 @get("/home")
@@ -13,3 +17,123 @@ def test_basic_middleware(test_client_factory):
         response = client.get("/home")
 
         assert response.status_code == 200
+
+
+class Recorder(HookMiddleware):
+    name = "recorder"
+
+    def __init__(self, app, calls=None, stop=False):
+        super().__init__(app)
+        self.calls = calls
+        self.stop = stop
+
+    async def before_request(self, request):
+        self.calls.append(f"before-{self.name}")
+        if self.stop:
+            return PlainTextResponse(self.name, status_code=403)
+
+    async def after_response(self, request, status_code, headers):
+        self.calls.append(f"after-{self.name}-{status_code}")
+        headers.append("x-hooks", self.name)
+
+
+class Outer(Recorder):
+    name = "outer"
+
+
+class Inner(Recorder):
+    name = "inner"
+
+
+class BeforeOnly(HookMiddleware):
+    async def before_request(self, request):
+        request.state.seen = True
+
+
+def get_layers(app):
+    layers = []
+    while not isinstance(app, Router):
+        layers.append(app)
+        app = app.app
+    return layers
+
+
+@get("/state")
+async def state(request: Request) -> dict:
+    return {"seen": getattr(request.state, "seen", False)}
+
+
+def test_hook_middleware_fused(test_client_factory):
+    calls = []
+    middleware = [
+        StarletteMiddleware(Outer, calls=calls),
+        StarletteMiddleware(Inner, calls=calls),
+        BeforeOnly,
+    ]
+    with create_client(
+        routes=[Gateway(handler=home), Gateway(handler=state)], middleware=middleware
+    ) as client:
+        layers = get_layers(client.app.middleware_stack)
+        assert isinstance(layers[0], EsmeraldAPIExceptionMiddleware)
+        assert isinstance(layers[-2], FusedHookMiddleware)
+        assert [type(hook) for hook in layers[-2].hooks] == [Outer, Inner, BeforeOnly]
+        assert isinstance(layers[-1], FusedExceptionMiddleware)
+        assert layers[-1].api_exception_middleware is None
+
+        response = client.get("/home")
+        assert response.status_code == 200
+        assert response.headers.get_list("x-hooks") == ["inner", "outer"]
+        assert calls == ["before-outer", "before-inner", "after-inner-200", "after-outer-200"]
+
+        assert client.get("/state").json() == {"seen": True}
+
+
+def test_hook_middleware_short_circuit(test_client_factory):
+    calls = []
+    middleware = [
+        StarletteMiddleware(Outer, calls=calls),
+        StarletteMiddleware(Inner, calls=calls, stop=True),
+    ]
+    with create_client(routes=[Gateway(handler=home)], middleware=middleware) as client:
+        response = client.get("/home")
+        assert response.status_code == 403
+        assert response.text == "inner"
+        assert response.headers.get_list("x-hooks") == ["outer"]
+        assert calls == ["before-outer", "before-inner", "after-outer-403"]
+
+
+def test_hook_middleware_not_fused_across_other_middleware(test_client_factory):
+    calls = []
+    middleware = [
+        StarletteMiddleware(Outer, calls=calls),
+        BasicHTTPMiddleware,
+        StarletteMiddleware(Inner, calls=calls),
+    ]
+    with create_client(routes=[Gateway(handler=home)], middleware=middleware) as client:
+        layers = get_layers(client.app.middleware_stack)
+        assert [type(layer) for layer in layers[-4:]] == [
+            Outer,
+            BasicHTTPMiddleware,
+            Inner,
+            FusedExceptionMiddleware,
+        ]
+
+        response = client.get("/home")
+        assert response.headers.get_list("x-hooks") == ["inner", "outer"]
+
+
+def test_exception_layers_fused_without_middleware(test_client_factory):
+    @get("/error")
+    async def error() -> None:
+        raise ValueError("boom")
+
+    app = Esmerald(routes=[Gateway(handler=error)])
+    app.user_middleware = []
+    app.middleware_stack = app.build_middleware_stack()
+    with EsmeraldTestClient(app) as client:
+        assert get_layers(app.middleware_stack) == [app.middleware_stack]
+        assert app.middleware_stack.api_exception_middleware is not None
+
+        response = client.get("/error")
+        assert response.status_code == 500
+        assert "boom" in response.text
@@ -0,0 +1,174 @@
+from typing import AsyncGenerator, List
+
+import brotli
+import pytest
+from starlette.middleware import Middleware as StarletteMiddleware
+
+from esmerald import Gateway, get, post
+from esmerald.config import CompressionConfig
+from esmerald.middleware import CompressionMiddleware
+from esmerald.middleware.compression import COMPRESSORS, GzipCompressor, negotiate_encoding
+from esmerald.responses import Response, StreamingResponse
+from esmerald.testclient import create_client
+
+PAYLOAD = "esmerald " * 200
+
+
+@get("/text")
+async def text() -> Response:
+    return Response(PAYLOAD, media_type="text/plain")
+
+
+@get("/small")
+async def small() -> Response:
+    return Response("small", media_type="text/plain")
+
+
+@get("/image")
+async def image() -> Response:
+    return Response(b"\x89PNG" * 500, media_type="image/png")
+
+
+@get("/stream")
+async def stream() -> StreamingResponse:
+    async def chunks() -> AsyncGenerator[str, None]:
+        for _ in range(10):
+            yield "chunk " * 100
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+@get("/raw", compression=False)
+async def raw() -> Response:
+    return Response(PAYLOAD, media_type="text/plain")
+
+
+@get("/text")
+async def gateway_text() -> Response:
+    return Response(PAYLOAD, media_type="text/plain")
+
+
+@post("/best", compression=CompressionConfig(levels={"br": 11}, minimum_size=0))
+async def best() -> Response:
+    return Response("tiny", media_type="text/plain")
+
+
+def create_compression_client(**kwargs):
+    return create_client(
+        routes=[
+            Gateway(handler=text),
+            Gateway(handler=small),
+            Gateway(handler=image),
+            Gateway(handler=stream),
+            Gateway(handler=raw),
+            Gateway(handler=best),
+            Gateway("/gateway", handler=gateway_text, compression=False),
+        ],
+        middleware=[StarletteMiddleware(CompressionMiddleware, **kwargs)],
+    )
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,encoding",
+    [("gzip, deflate, br", "br"), ("gzip", "gzip"), ("br;q=0.5, gzip", "gzip"), ("*", "br")],
+)
+def test_negotiates_the_encoding(accept_encoding: str, encoding: str) -> None:
+    with create_compression_client() as client:
+        response = client.get("/text", headers={"accept-encoding": accept_encoding})
+
+        assert response.headers["content-encoding"] == encoding
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(PAYLOAD)
+        assert response.text == PAYLOAD
+
+
+def test_negotiate_encoding() -> None:
+    assert negotiate_encoding("identity", ["br", "gzip"]) is None
+    assert negotiate_encoding("br;q=0, gzip;q=0.1", ["br", "gzip"]) == "gzip"
+    assert negotiate_encoding("br, gzip", ["gzip", "br"]) == "gzip"
+    assert negotiate_encoding("unknown", ["unknown"]) is None
+
+
+@pytest.mark.parametrize("path", ["/small", "/image", "/raw", "/gateway/text"])
+def test_not_compressed(path: str) -> None:
+    with create_compression_client() as client:
+        response = client.get(path, headers={"accept-encoding": "br, gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+
+def test_route_level_configuration() -> None:
+    with create_compression_client() as client:
+        response = client.post("/best", headers={"accept-encoding": "br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert response.text == "tiny"
+
+
+def test_streaming_response() -> None:
+    with create_compression_client() as client:
+        response = client.get("/stream", headers={"accept-encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == "chunk " * 1000
+
+
+def test_compressed_bodies_cached_by_etag(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[str] = []
+    compressions: List[int] = []
+
+    def create_compressor(level: int) -> GzipCompressor:
+        compressions.append(level)
+        return GzipCompressor(level)
+
+    monkeypatch.setitem(COMPRESSORS, "gzip", create_compressor)
+
+    @get("/cached", etag=True)
+    async def cached() -> Response:
+        calls.append("called")
+        return Response(PAYLOAD, media_type="text/plain")
+
+    with create_client(
+        routes=[Gateway(handler=cached)],
+        middleware=[StarletteMiddleware(CompressionMiddleware, levels={"gzip": 9})],
+    ) as client:
+        first = client.get("/cached", headers={"accept-encoding": "gzip"})
+        second = client.get("/cached", headers={"accept-encoding": "gzip"})
+
+        assert first.headers["etag"].startswith('W/"')
+        assert first.text == second.text == PAYLOAD
+        assert len(calls) == 2
+        assert compressions == [9]
+
+        response = client.get(
+            "/cached",
+            headers={"accept-encoding": "gzip", "if-none-match": first.headers["etag"]},
+        )
+        assert response.status_code == 304
+
+
+def test_brotli_body() -> None:
+    with create_compression_client(levels={"br": 5}) as client:
+        with client.stream("GET", "/text", headers={"accept-encoding": "br"}) as response:
+            body = b"".join(response.iter_raw())
+
+    assert brotli.decompress(body).decode() == PAYLOAD
+
+
+def test_compressed_bodies_cached_per_resource() -> None:
+    @get("/a", etag=lambda request: "v1")
+    async def first() -> Response:
+        return Response("first " * 200, media_type="text/plain")
+
+    @get("/b", etag=lambda request: "v1")
+    async def second() -> Response:
+        return Response("second " * 200, media_type="text/plain")
+
+    with create_client(
+        routes=[Gateway(handler=first), Gateway(handler=second)],
+        middleware=[StarletteMiddleware(CompressionMiddleware)],
+    ) as client:
+        assert client.get("/a", headers={"accept-encoding": "gzip"}).text == "first " * 200
+        assert client.get("/b", headers={"accept-encoding": "gzip"}).text == "second " * 200
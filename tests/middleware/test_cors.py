@@ -1,6 +1,6 @@
 from starlette.middleware import Middleware
 
-from esmerald import CORSConfig, Gateway, Request, get, route
+from esmerald import CORSConfig, Gateway, Include, Request, get, route
 from esmerald.applications import Esmerald
 from esmerald.middleware.cors import CORSMiddleware
 from esmerald.responses import PlainTextResponse
@@ -754,3 +754,211 @@ def test_cors_allowed_origin_does_not_leak_between_credentialed_requests_config(
     response = client.get("/", headers={"Origin": "https://someplace.org"})
     assert response.headers["access-control-allow-origin"] == "*"
     assert "access-control-allow-credentials" not in response.headers
+
+
+def test_cors_allow_wildcard_origins(test_client_factory):
+    @get()
+    def homepage(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("Homepage", status_code=200)
+
+    cors_config = CORSConfig(allow_origins=["https://*.example.org", "example.com:*"])
+    app = Esmerald(routes=[Gateway("/", handler=homepage)], cors_config=cors_config)
+    client = test_client_factory(app)
+
+    for origin in ("https://api.example.org", "http://example.com:8000"):
+        response = client.get("/", headers={"Origin": origin})
+        assert response.headers["access-control-allow-origin"] == origin
+
+    for origin in ("https://example.org", "https://evil.org/.example.org", "https://example.com"):
+        response = client.get("/", headers={"Origin": origin})
+        assert "access-control-allow-origin" not in response.headers
+
+
+def test_cors_preflight_responses_are_cached(test_client_factory):
+    @get()
+    def homepage(request: Request) -> PlainTextResponse:  # pragma: no cover
+        return PlainTextResponse("Homepage", status_code=200)
+
+    middleware = Middleware(
+        CORSMiddleware, allow_origins=["https://example.org"], allow_headers=["X-Example"]
+    )
+    app = Esmerald(routes=[Gateway("/", handler=homepage)], middleware=[middleware])
+    client = test_client_factory(app)
+
+    headers = {
+        "Origin": "https://example.org",
+        "Access-Control-Request-Method": "GET",
+        "Access-Control-Request-Headers": "X-Example",
+    }
+    for _ in range(2):
+        response = client.options("/", headers=headers)
+        assert response.status_code == 200
+        assert response.text == "OK"
+        assert response.headers["access-control-allow-origin"] == "https://example.org"
+
+    response = client.options("/", headers={**headers, "Origin": "https://another.org"})
+    assert response.status_code == 400
+    assert response.text == "Disallowed CORS origin"
+
+    cors_middleware = app.middleware_stack
+    while not isinstance(cors_middleware, CORSMiddleware):
+        cors_middleware = cors_middleware.app
+    assert list(cors_middleware.policy.cache) == [
+        ("https://example.org", "GET", "X-Example"),
+        ("https://another.org", "GET", "X-Example"),
+    ]
+
+
+def test_cors_route_level_overrides(test_client_factory):
+    @get()
+    def homepage(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("Homepage", status_code=200)
+
+    @get()
+    def public(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("Public", status_code=200)
+
+    @get()
+    def partner(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("Partner", status_code=200)
+
+    app = Esmerald(
+        routes=[
+            Gateway("/", handler=homepage),
+            Gateway("/public", handler=public, cors_config=CORSConfig(allow_origins=["*"])),
+            Include(
+                "/partners",
+                routes=[
+                    Gateway("/{name}", handler=partner),
+                    Gateway(
+                        "/",
+                        handler=partner,
+                        cors_config=CORSConfig(allow_origins=["https://admin.org"]),
+                    ),
+                ],
+                cors_config=CORSConfig(allow_origins=["https://partner.org"]),
+            ),
+        ],
+        cors_config=CORSConfig(allow_origins=["https://example.org"]),
+    )
+    client = test_client_factory(app)
+
+    response = client.get("/", headers={"Origin": "https://partner.org"})
+    assert "access-control-allow-origin" not in response.headers
+
+    response = client.get("/public", headers={"Origin": "https://partner.org"})
+    assert response.headers["access-control-allow-origin"] == "*"
+
+    response = client.get("/partners/acme", headers={"Origin": "https://partner.org"})
+    assert response.text == "Partner"
+    assert response.headers["access-control-allow-origin"] == "https://partner.org"
+
+    response = client.get("/partners/", headers={"Origin": "https://partner.org"})
+    assert "access-control-allow-origin" not in response.headers
+
+    headers = {"Origin": "https://admin.org", "Access-Control-Request-Method": "GET"}
+    response = client.options("/partners/", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "https://admin.org"
+
+    response = client.options("/partners/acme", headers=headers)
+    assert response.status_code == 400
+
+
+def test_cors_route_level_overrides_without_application_config(test_client_factory):
+    @get()
+    def homepage(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("Homepage", status_code=200)
+
+    app = Esmerald(
+        routes=[
+            Gateway("/", handler=homepage),
+            Gateway("/public", handler=homepage, cors_config=CORSConfig(allow_origins=["*"])),
+        ]
+    )
+    client = test_client_factory(app)
+
+    response = client.get("/public", headers={"Origin": "https://example.org"})
+    assert response.headers["access-control-allow-origin"] == "*"
+
+    response = client.get("/", headers={"Origin": "https://example.org"})
+    assert "access-control-allow-origin" not in response.headers
+
+    headers = {"Origin": "https://example.org", "Access-Control-Request-Method": "GET"}
+    response = client.options("/", headers=headers)
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_cors_route_level_overrides_under_root_include(test_client_factory):
+    @get()
+    def homepage(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("Homepage", status_code=200)
+
+    app = Esmerald(
+        routes=[
+            Include(
+                "/",
+                routes=[
+                    Gateway("/x", handler=homepage, cors_config=CORSConfig(allow_origins=["*"])),
+                    Gateway("/y", handler=homepage),
+                ],
+            )
+        ]
+    )
+    client = test_client_factory(app)
+
+    response = client.get("/x", headers={"Origin": "https://example.org"})
+    assert response.headers["access-control-allow-origin"] == "*"
+
+    response = client.get("/y", headers={"Origin": "https://example.org"})
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_cors_route_level_overrides_of_routes_added_later(test_client_factory):
+    @get()
+    def homepage(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("Homepage", status_code=200)
+
+    app = Esmerald(
+        routes=[Gateway("/", handler=homepage)],
+        cors_config=CORSConfig(allow_origins=["https://example.org"]),
+    )
+    client = test_client_factory(app)
+
+    response = client.get("/public/", headers={"Origin": "https://another.org"})
+    assert response.status_code == 404
+
+    app.add_include(
+        Include(
+            "/public",
+            routes=[Gateway("/", handler=homepage)],
+            cors_config=CORSConfig(allow_origins=["*"]),
+        )
+    )
+    response = client.get("/public/", headers={"Origin": "https://another.org"})
+    assert response.headers["access-control-allow-origin"] == "*"
+
+    response = client.get("/", headers={"Origin": "https://another.org"})
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_cors_route_level_overrides_added_to_application_without_config(test_client_factory):
+    @get()
+    def homepage(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("Homepage", status_code=200)
+
+    app = Esmerald(routes=[Gateway("/", handler=homepage)])
+    client = test_client_factory(app)
+
+    app.add_include(
+        Include(
+            "/public",
+            routes=[Gateway("/", handler=homepage)],
+            cors_config=CORSConfig(allow_origins=["*"]),
+        )
+    )
+    response = client.get("/public/", headers={"Origin": "https://example.org"})
+    assert response.headers["access-control-allow-origin"] == "*"
+
+    response = client.get("/", headers={"Origin": "https://example.org"})
+    assert "access-control-allow-origin" not in response.headers
@@ -4,6 +4,7 @@ from typing import Any
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
+from esmerald.exception_handlers import CachedExceptionHandlers
 from esmerald.exceptions import HTTPException
 from esmerald.middleware.exceptions import EsmeraldAPIExceptionMiddleware
 from esmerald.requests import Request
@@ -90,3 +91,23 @@ def test_default_handle_python_http_exception_handling() -> None:
         "detail": repr(AttributeError("oops")),
         "status_code": HTTP_500_INTERNAL_SERVER_ERROR,
     }
+
+
+def test_exception_handlers_resolved_again_when_updated() -> None:
+    def value_error_handler(request: Request, exc: Exception) -> Any:
+        """ """
+
+    def key_error_handler(request: Request, exc: Exception) -> Any:
+        """ """
+
+    api_middleware = EsmeraldAPIExceptionMiddleware(
+        dummy_app, False, {ValueError: value_error_handler}
+    )
+    handlers = api_middleware.exception_handlers
+    assert isinstance(handlers, CachedExceptionHandlers)
+
+    assert api_middleware.get_exception_handler(handlers, UnicodeError()) is value_error_handler
+    assert api_middleware.get_exception_handler(handlers, KeyError()) is None
+
+    handlers[LookupError] = key_error_handler
+    assert api_middleware.get_exception_handler(handlers, KeyError()) is key_error_handler
@@ -0,0 +1,104 @@
+from typing import List
+
+from esmerald import Gateway, Include, Request, Response, get, route
+from esmerald.testclient import create_client
+from esmerald.utils.conditional import make_etag
+
+
+@get("/item", etag=True)
+async def item() -> dict:
+    return {"name": "esmerald"}
+
+
+@get("/inherited")
+async def inherited() -> dict:
+    return {"name": "inherited"}
+
+
+@route("/create", methods=["GET", "POST"], etag=True)
+async def create() -> dict:
+    return {"name": "created"}
+
+
+def test_etag_from_body() -> None:
+    with create_client(routes=[Gateway(handler=item)]) as client:
+        response = client.get("/item")
+        etag = response.headers["etag"]
+
+        assert response.status_code == 200
+        assert etag == make_etag(response.content)
+
+        response = client.get("/item", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert "content-type" not in response.headers
+
+        response = client.get("/item", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert response.status_code == 304
+
+        response = client.get("/item", headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+
+
+def test_etag_inherited_from_gateway_and_include() -> None:
+    with create_client(
+        routes=[
+            Gateway("/gateway", handler=inherited, etag=True),
+            Include("/include", routes=[Gateway(handler=inherited)], etag=True),
+        ]
+    ) as client:
+        for path in ("/gateway/inherited", "/include/inherited"):
+            etag = client.get(path).headers["etag"]
+            assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_etag_callable_skips_the_handler() -> None:
+    calls: List[str] = []
+
+    def get_version(request: Request) -> str:
+        return f"v-{request.path_params['pk']}"
+
+    @route("/versioned/{pk}", methods=["GET"], etag=get_version)
+    async def versioned(pk: int) -> dict:
+        calls.append("called")
+        return {"pk": pk}
+
+    with create_client(routes=[Gateway(handler=versioned)]) as client:
+        response = client.get("/versioned/1")
+        assert response.headers["etag"] == '"v-1"'
+        assert calls == ["called"]
+
+        response = client.get("/versioned/1", headers={"If-None-Match": '"v-1"'})
+        assert response.status_code == 304
+        assert calls == ["called"]
+
+        response = client.get("/versioned/2", headers={"If-None-Match": '"v-1"'})
+        assert response.status_code == 200
+        assert calls == ["called", "called"]
+
+
+def test_if_modified_since() -> None:
+    @get("/modified", etag=True)
+    async def modified() -> Response:
+        return Response(
+            {"name": "esmerald"},
+            headers={"last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+
+    with create_client(routes=[Gateway(handler=modified)]) as client:
+        response = client.get(
+            "/modified", headers={"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+        assert response.status_code == 304
+
+        response = client.get(
+            "/modified", headers={"If-Modified-Since": "Tue, 20 Oct 2015 07:28:00 GMT"}
+        )
+        assert response.status_code == 200
+
+
+def test_etag_only_for_get() -> None:
+    with create_client(routes=[Gateway(handler=create)]) as client:
+        assert "etag" in client.get("/create").headers
+        assert "etag" not in client.post("/create").headers
@@ -0,0 +1,136 @@
+from typing import Any, List
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from esmerald import ChildEsmerald, Esmerald, Gateway, Include, Request, get, post
+from esmerald.interceptors.interceptor import EsmeraldInterceptor
+from esmerald.permissions import BasePermission
+from esmerald.testclient import create_client
+from esmerald.typing import Void
+
+calls: List[str] = []
+
+
+class RouteMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        calls.append("middleware")
+        await self.app(scope, receive, send)
+
+
+class CallInterceptor(EsmeraldInterceptor):
+    async def intercept(self, scope: Scope, receive: Receive, send: Send) -> None:
+        calls.append("interceptor")
+
+
+class HeaderPermission(BasePermission):
+    def has_permission(self, request: Request, apiview: Any) -> bool:
+        return bool(request.headers.get("allow"))
+
+
+@get(middleware=[RouteMiddleware])
+async def home() -> str:
+    calls.append("handler")
+    return "home"
+
+
+@get()
+def sync_home() -> str:
+    return "sync"
+
+
+@post()
+async def create(name: str) -> str:
+    return f"created {name}"
+
+
+def test_pipeline_runs_each_stage_once() -> None:
+    calls.clear()
+
+    with create_client(
+        routes=[Gateway("/home", handler=home, interceptors=[CallInterceptor])]
+    ) as client:
+        response = client.get("/home")
+
+    assert response.status_code == 200
+    assert response.json() == "home"
+    assert calls == ["middleware", "interceptor", "handler"]
+
+
+def test_pipeline_is_built_once() -> None:
+    gateway = Gateway("/sync", handler=sync_home)
+
+    with create_client(routes=[gateway]) as client:
+        assert client.get("/sync").json() == "sync"
+        pipeline = gateway.get_pipeline()
+
+        assert client.get("/sync").json() == "sync"
+        assert gateway.get_pipeline() is pipeline
+        assert pipeline is gateway.handler.get_pipeline()
+
+
+def test_pipeline_parameters() -> None:
+    with create_client(routes=[Gateway("/create", handler=create)]) as client:
+        response = client.post("/create", params={"name": "esmerald"})
+        assert response.json() == "created esmerald"
+
+        response = client.post("/create")
+        assert response.status_code == 400
+
+
+def test_pipeline_permissions_from_parent_layers() -> None:
+    @post()
+    async def create_item(name: str) -> str:
+        return f"created {name}"
+
+    with create_client(
+        routes=[Include("/api", routes=[Gateway("/create", handler=create_item)])],
+        permissions=[HeaderPermission],
+    ) as client:
+        response = client.post("/api/create", params={"name": "esmerald"})
+        assert response.status_code == 403
+
+        response = client.post(
+            "/api/create", params={"name": "esmerald"}, headers={"allow": "true"}
+        )
+        assert response.status_code == 201
+        assert response.json() == "created esmerald"
+
+
+def test_pipeline_method_not_allowed() -> None:
+    with create_client(routes=[Gateway("/sync", handler=sync_home)]) as client:
+        response = client.head("/sync")
+        assert response.status_code == 405
+
+
+def test_pipeline_built_with_the_application() -> None:
+    gateway = Gateway("/sync", handler=sync_home)
+    included = Gateway("/home", handler=home)
+
+    app = Esmerald(routes=[gateway, Include("/api", routes=[included])])
+    assert gateway._pipeline is not Void
+    assert included._pipeline is not Void
+
+    added = Gateway("/create", handler=create)
+    app.add_include(Include("/more", routes=[added]))
+    assert added._pipeline is not Void
+
+
+def test_pipeline_of_child_application_built_again_when_mounted() -> None:
+    @post()
+    async def create_item(name: str) -> str:
+        return f"created {name}"
+
+    gateway = Gateway("/create", handler=create_item)
+    child = ChildEsmerald(routes=[gateway])
+    pipeline = gateway.get_pipeline()
+
+    with create_client(
+        routes=[Include("/child", app=child)], permissions=[HeaderPermission]
+    ) as client:
+        assert gateway.get_pipeline() is not pipeline
+
+        response = client.post("/child/create", params={"name": "esmerald"})
+        assert response.status_code == 403
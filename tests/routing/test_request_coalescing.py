@@ -0,0 +1,130 @@
+from typing import Any, Dict, List
+
+import anyio
+import pytest
+from httpx import AsyncClient
+
+from esmerald import Esmerald, Gateway, HTTPException, Request, get
+from esmerald.backgound import BackgroundTask
+from esmerald.cache import RequestCoalescing
+from esmerald.responses import Response
+
+
+async def send_concurrently(app: Esmerald, *requests: Dict[str, Any]) -> List[Any]:
+    responses: List[Any] = [None] * len(requests)
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+
+        async def send(index: int, request: Dict[str, Any]) -> None:
+            responses[index] = await client.get(**request)
+
+        async with anyio.create_task_group() as tg:
+            for index, request in enumerate(requests):
+                tg.start_soon(send, index, request)
+
+    return responses
+
+
+@pytest.mark.asyncio()
+async def test_identical_requests_share_one_execution() -> None:
+    calls: List[str] = []
+    tasks: List[str] = []
+
+    @get("/products", coalesce=True)
+    async def products(page: int = 1) -> Response:
+        calls.append(f"page {page}")
+        await anyio.sleep(0.05)
+        return Response({"page": page}, background=BackgroundTask(tasks.append, f"task {page}"))
+
+    app = Esmerald(routes=[Gateway(handler=products)])
+    responses = await send_concurrently(
+        app, *[{"url": "/products"}] * 5, {"url": "/products?page=2"}
+    )
+
+    assert sorted(calls) == ["page 1", "page 2"]
+    assert [response.json() for response in responses] == [{"page": 1}] * 5 + [{"page": 2}]
+    assert sorted(tasks) == ["task 1", "task 2"]
+
+    await send_concurrently(app, {"url": "/products"})
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio()
+async def test_coalescing_key_from_vary_headers() -> None:
+    calls: List[str] = []
+
+    @get("/greeting")
+    async def greeting(request: Request) -> str:
+        language = request.headers.get("accept-language", "en")
+        calls.append(language)
+        await anyio.sleep(0.05)
+        return language
+
+    app = Esmerald(
+        routes=[Gateway(handler=greeting, coalesce=RequestCoalescing(vary=["Accept-Language"]))]
+    )
+    responses = await send_concurrently(
+        app,
+        {"url": "/greeting", "headers": {"accept-language": "pt"}},
+        {"url": "/greeting", "headers": {"accept-language": "pt"}},
+        {"url": "/greeting", "headers": {"accept-language": "de"}},
+        {"url": "/greeting", "headers": {"authorization": "Bearer token"}},
+        {"url": "/greeting", "headers": {"authorization": "Bearer token"}},
+        {"url": "/greeting", "headers": {"cookie": "session=value"}},
+        {"url": "/greeting", "headers": {"cookie": "session=value"}},
+    )
+
+    assert sorted(calls) == ["de", "en", "en", "en", "en", "pt"]
+    assert [response.json() for response in responses] == ["pt", "pt", "de"] + ["en"] * 4
+
+
+@pytest.mark.asyncio()
+async def test_followers_receive_the_error_of_the_leader() -> None:
+    calls: List[str] = []
+
+    @get("/fail", coalesce=True)
+    async def fail() -> None:
+        calls.append("called")
+        await anyio.sleep(0.05)
+        raise HTTPException(status_code=503, detail="Unavailable")
+
+    app = Esmerald(routes=[Gateway(handler=fail)])
+    responses = await send_concurrently(app, *[{"url": "/fail"}] * 3)
+
+    assert calls == ["called"]
+    assert [response.status_code for response in responses] == [503] * 3
+
+
+@pytest.mark.asyncio()
+async def test_followers_call_the_handler_after_the_timeout() -> None:
+    calls: List[str] = []
+
+    @get("/slow", coalesce=RequestCoalescing(timeout=0.01))
+    async def slow() -> str:
+        calls.append("called")
+        await anyio.sleep(0.1)
+        return "done"
+
+    app = Esmerald(routes=[Gateway(handler=slow)])
+    responses = await send_concurrently(app, *[{"url": "/slow"}] * 3)
+
+    assert len(calls) == 3
+    assert [response.json() for response in responses] == ["done"] * 3
+
+
+@pytest.mark.asyncio()
+async def test_responses_setting_cookies_are_not_shared() -> None:
+    calls: List[str] = []
+
+    @get("/session", coalesce=True)
+    async def session() -> Response:
+        calls.append("called")
+        session_id = len(calls)
+        await anyio.sleep(0.05)
+        return Response({"session": session_id}, headers={"set-cookie": f"session={session_id}"})
+
+    app = Esmerald(routes=[Gateway(handler=session)])
+    responses = await send_concurrently(app, *[{"url": "/session"}] * 3)
+
+    assert len(calls) == 3
+    assert sorted(response.cookies["session"] for response in responses) == ["1", "2", "3"]
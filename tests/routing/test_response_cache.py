@@ -0,0 +1,168 @@
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from esmerald import Gateway, Include, Request, Response, get, route
+from esmerald.cache import CachedResponse, MemoryCacheBackend, ResponseCache
+from esmerald.protocols.cache import CacheBackendProtocol
+from esmerald.testclient import create_client
+
+
+class FakeBackend:
+    """
+    Backend storing bytes, as an external backend would.
+    """
+
+    def __init__(self) -> None:
+        self.store: Dict[str, bytes] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = self.store.get(key)
+        return CachedResponse.decode(data) if data is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.store[key] = value.encode()
+
+    async def delete(self, key: str) -> None:
+        self.store.pop(key, None)
+
+    async def clear(self) -> None:
+        self.store.clear()
+
+
+def create_handler(calls: List[str], **kwargs: Any):
+    @get("/products", **kwargs)
+    async def products(page: int = 1) -> Dict[str, Any]:
+        calls.append("called")
+        return {"page": page, "calls": len(calls)}
+
+    return products
+
+
+def test_cache_hit_skips_the_handler() -> None:
+    calls: List[str] = []
+
+    with create_client(routes=[Gateway(handler=create_handler(calls, cache=60))]) as client:
+        response = client.get("/products")
+        assert response.json() == {"page": 1, "calls": 1}
+
+        cached = client.get("/products")
+        assert cached.json() == {"page": 1, "calls": 1}
+        assert cached.headers["content-type"] == response.headers["content-type"]
+        assert cached.headers["content-length"] == response.headers["content-length"]
+
+        assert client.get("/products?page=2").json() == {"page": 2, "calls": 2}
+        assert calls == ["called", "called"]
+
+
+def test_cache_key_from_selected_query_params_and_vary() -> None:
+    calls: List[str] = []
+    cache = ResponseCache(query_params=["page"], vary=["Accept-Language"])
+
+    with create_client(routes=[Gateway(handler=create_handler(calls, cache=cache))]) as client:
+        client.get("/products?page=1&utm_source=mail")
+        client.get("/products?utm_source=web&page=1")
+        assert len(calls) == 1
+
+        client.get("/products?page=1", headers={"Accept-Language": "pt"})
+        client.get("/products?page=1", headers={"Accept-Language": "pt"})
+        assert len(calls) == 2
+
+
+def test_cache_inherited_and_disabled() -> None:
+    calls: List[str] = []
+    uncached: List[str] = []
+
+    with create_client(
+        routes=[
+            Include(
+                "/catalogue",
+                routes=[
+                    Gateway(handler=create_handler(calls)),
+                    Gateway("/live", handler=create_handler(uncached), cache=False),
+                ],
+                cache=True,
+            )
+        ]
+    ) as client:
+        client.get("/catalogue/products")
+        client.get("/catalogue/products")
+        client.get("/catalogue/live/products")
+        client.get("/catalogue/live/products")
+
+    assert len(calls) == 1
+    assert len(uncached) == 2
+
+
+def test_cache_bypass() -> None:
+    calls: List[str] = []
+    cache = ResponseCache(bypass=lambda request: "preview" in request.query_params)
+
+    with create_client(routes=[Gateway(handler=create_handler(calls, cache=cache))]) as client:
+        client.get("/products")
+        client.get("/products", headers={"Authorization": "Bearer token"})
+        client.get("/products", headers={"Cookie": "session=value"})
+        client.get("/products?preview=1")
+        client.get("/products?preview=1")
+        assert len(calls) == 5
+
+        client.get("/products", headers={"Cache-Control": "no-cache"})
+        assert len(calls) == 6
+        assert client.get("/products").json()["calls"] == 6
+
+
+def test_cache_does_not_store_uncacheable_responses() -> None:
+    calls: List[str] = []
+
+    @route("/items", methods=["GET", "POST"], cache=True)
+    async def items(request: Request) -> Response:
+        calls.append(request.method)
+        if request.query_params.get("cookie"):
+            response = Response({"cookie": True})
+            response.set_cookie("session", "value")
+            return response
+        if request.query_params.get("private"):
+            return Response({"private": True}, headers={"cache-control": "private"})
+        return Response({"status": "ok"}, status_code=202 if request.method == "POST" else 200)
+
+    with create_client(routes=[Gateway(handler=items)]) as client:
+        for _ in range(2):
+            client.post("/items")
+            client.get("/items?cookie=1")
+            client.get("/items?private=1")
+        assert calls == ["POST", "GET", "GET"] * 2
+
+
+def test_external_backend() -> None:
+    calls: List[str] = []
+    backend = FakeBackend()
+
+    assert isinstance(backend, CacheBackendProtocol)
+
+    with create_client(
+        routes=[Gateway(handler=create_handler(calls, cache=60))], response_cache_backend=backend
+    ) as client:
+        client.get("/products", headers={"x-request": "1"})
+        assert client.get("/products").json() == {"page": 1, "calls": 1}
+
+    assert len(calls) == 1
+    assert list(backend.store) == ["GET:/products?"]
+
+
+@pytest.mark.asyncio()
+async def test_memory_backend_lru_and_ttl() -> None:
+    backend = MemoryCacheBackend(maxsize=2)
+
+    await backend.set("a", 1)
+    await backend.set("b", 2)
+    assert await backend.get("a") == 1
+
+    await backend.set("c", 3)
+    assert await backend.get("b") is None
+    assert len(backend) == 2
+
+    await backend.set("d", 4, ttl=-1)
+    assert await backend.get("d") is None
+
+    await backend.clear()
+    assert len(backend) == 0
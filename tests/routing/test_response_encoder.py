@@ -0,0 +1,194 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import msgspec
+from pydantic import BaseModel, ConfigDict
+
+from esmerald import Gateway, get
+from esmerald.encoders import ENCODERS, register_encoder
+from esmerald.responses.encoders import ORJSONResponse
+from esmerald.testclient import create_client
+
+
+class Product(BaseModel):
+    name: str
+    price: Decimal
+    created_at: datetime
+
+
+class ProductStruct(msgspec.Struct):
+    name: str
+    quantity: int
+
+
+class Discount(Product):
+    percentage: int
+
+
+class Money:
+    def __init__(self, amount: int, currency: str) -> None:
+        self.amount = amount
+        self.currency = currency
+
+
+class Invoice(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    total: Money
+
+
+class Order(BaseModel):
+    total: Decimal
+
+
+class OrderStruct(msgspec.Struct):
+    total: Any
+
+
+@get("/product")
+async def product() -> Product:
+    return Product(name="esmerald", price=Decimal("9.99"), created_at=datetime(2024, 1, 1))
+
+
+@get("/products")
+async def products() -> List[Product]:
+    return [Product(name="esmerald", price=Decimal("1.5"), created_at=datetime(2024, 1, 1))]
+
+
+@get("/struct")
+async def struct() -> ProductStruct:
+    return ProductStruct(name="esmerald", quantity=2)
+
+
+@get("/discount")
+async def discount() -> Product:
+    return Discount(
+        name="esmerald", price=Decimal("1"), created_at=datetime(2024, 1, 1), percentage=10
+    )
+
+
+@get("/mixed")
+async def mixed() -> Dict[str, Any]:
+    return {"struct": ProductStruct(name="esmerald", quantity=1)}
+
+
+@get("/any")
+async def any_content() -> Any:
+    return {"name": "esmerald"}
+
+
+@get("/invoice")
+async def invoice() -> Invoice:
+    return Invoice(total=Money(10, "EUR"))
+
+
+@get("/order")
+async def order() -> Order:
+    return Order(total=Decimal("9.99"))
+
+
+@get("/order-struct")
+async def order_struct() -> OrderStruct:
+    return OrderStruct(total=Money(10, "EUR"))
+
+
+@get("/mismatched")
+async def mismatched() -> List[Product]:
+    return [ProductStruct(name="esmerald", quantity=1)]
+
+
+@get("/orjson", response_class=ORJSONResponse)
+async def orjson_content() -> Dict[str, int]:
+    return {"value": 1}
+
+
+def test_response_encoder_compiled_for_return_annotation() -> None:
+    with create_client(
+        routes=[
+            Gateway(handler=product),
+            Gateway(handler=any_content),
+            Gateway(handler=orjson_content),
+        ]
+    ):
+        assert product.get_response_encoder("application/json", product.get_response_class())
+        assert not any_content.get_response_encoder(
+            "application/json", any_content.get_response_class()
+        )
+        assert not orjson_content.get_response_encoder(
+            "application/json", orjson_content.get_response_class()
+        )
+
+
+def test_response_encoder_pydantic() -> None:
+    with create_client(routes=[Gateway(handler=product), Gateway(handler=products)]) as client:
+        response = client.get("/product")
+        assert response.status_code == 200
+        assert response.content == (
+            b'{"name":"esmerald","price":"9.99","created_at":"2024-01-01T00:00:00"}'
+        )
+
+        response = client.get("/products")
+        assert response.json() == [
+            {"name": "esmerald", "price": "1.5", "created_at": "2024-01-01T00:00:00"}
+        ]
+
+
+def test_response_encoder_serializes_subclasses() -> None:
+    with create_client(routes=[Gateway(handler=discount)]) as client:
+        response = client.get("/discount")
+        assert response.json()["percentage"] == 10
+
+
+def test_response_encoder_msgspec() -> None:
+    with create_client(routes=[Gateway(handler=struct)]) as client:
+        response = client.get("/struct")
+        assert response.content == b'{"name":"esmerald","quantity":2}'
+
+
+def test_response_encoder_falls_back_to_generic_rendering() -> None:
+    with create_client(routes=[Gateway(handler=mixed), Gateway(handler=any_content)]) as client:
+        response = client.get("/mixed")
+        assert response.json() == {"struct": {"name": "esmerald", "quantity": 1}}
+
+        response = client.get("/any")
+        assert response.json() == {"name": "esmerald"}
+
+
+def test_response_encoder_not_compiled_for_untyped_content() -> None:
+    with create_client(routes=[Gateway(handler=mixed), Gateway(handler=invoice)]):
+        assert not mixed.get_response_encoder("application/json", mixed.get_response_class())
+        assert not invoice.get_response_encoder("application/json", invoice.get_response_class())
+
+
+def test_response_encoder_uses_registered_encoders() -> None:
+    register_encoder(Money, lambda value: f"{value.amount} {value.currency}")
+    register_encoder(Decimal, float)
+    try:
+        with create_client(
+            routes=[
+                Gateway(handler=invoice),
+                Gateway(handler=order),
+                Gateway(handler=order_struct),
+            ]
+        ) as client:
+            assert not order.get_response_encoder("application/json", order.get_response_class())
+
+            response = client.get("/invoice")
+            assert response.json() == {"total": "10 EUR"}
+
+            response = client.get("/order")
+            assert response.json() == {"total": 9.99}
+
+            response = client.get("/order-struct")
+            assert response.json() == {"total": "10 EUR"}
+    finally:
+        ENCODERS.pop(Money)
+        ENCODERS.pop(Decimal)
+
+
+def test_response_encoder_mismatched_content() -> None:
+    with create_client(routes=[Gateway(handler=mismatched)]) as client:
+        response = client.get("/mismatched")
+        assert response.status_code == 200
+        assert response.json() == [{"name": "esmerald", "quantity": 1}]
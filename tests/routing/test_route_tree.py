@@ -0,0 +1,147 @@
+import pytest
+from starlette.routing import Mount
+
+from esmerald import Gateway, Include, Request, WebSocket, WebSocketGateway, get, put, websocket
+from esmerald.routing.router import Router
+from esmerald.routing.tree import IncludeRouter, RouteTree
+from esmerald.testclient import create_client
+
+
+@get()
+async def home() -> str:
+    return "home"
+
+
+@get()
+async def user(username: str) -> str:
+    return f"user {username}"
+
+
+@get()
+async def user_me() -> str:
+    return "me"
+
+
+@get()
+async def item(item_id: int) -> str:
+    return f"item {item_id}"
+
+
+@put()
+async def disable_user(request: Request) -> str:
+    return f"disabled {request.path_params['username']}"
+
+
+@get()
+async def files(path: str) -> str:
+    return f"file {path}"
+
+
+@websocket()
+async def socket_handler(socket: WebSocket) -> None:
+    await socket.accept()
+    await socket.send_json({"data": "esmerald"})
+    await socket.close()
+
+
+routes = [
+    Gateway("/", handler=home),
+    Include(
+        "/users",
+        routes=[
+            Gateway("/{username}", handler=user),
+            Gateway("/me", handler=user_me),
+            Gateway("/{username}:disable", handler=disable_user),
+            Include(
+                "/items",
+                routes=[Gateway("/{item_id:int}", handler=item)],
+            ),
+        ],
+    ),
+    Gateway("/files/{path:path}", handler=files),
+    WebSocketGateway("/ws", handler=socket_handler),
+]
+
+
+@pytest.mark.parametrize("enable_route_tree", [False, True])
+def test_route_tree_dispatch(enable_route_tree, test_client_factory):
+    with create_client(routes=routes, enable_route_tree=enable_route_tree) as client:
+        assert client.app.router.enable_route_tree is enable_route_tree
+
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.json() == "home"
+
+        response = client.get("/users/esmerald")
+        assert response.json() == "user esmerald"
+
+        # Declared after the parameterised route, so the order wins.
+        response = client.get("/users/me")
+        assert response.json() == "user me"
+
+        response = client.put("/users/esmerald:disable")
+        assert response.json() == "disabled esmerald"
+
+        response = client.get("/users/items/10")
+        assert response.json() == "item 10"
+
+        response = client.get("/users/items/ten")
+        assert response.status_code == 404
+
+        response = client.get("/files/a/b/c.txt")
+        assert response.json() == "file a/b/c.txt"
+
+        response = client.get("/users/esmerald/")
+        assert response.status_code == 200
+        assert response.url == "http://testserver/users/esmerald"
+
+        response = client.post("/")
+        assert response.status_code == 405
+
+        response = client.get("/not-found")
+        assert response.status_code == 404
+
+        with client.websocket_connect("/ws") as session:
+            assert session.receive_json() == {"data": "esmerald"}
+
+
+def test_route_tree_enables_nested_includes(test_client_factory):
+    with create_client(routes=routes, enable_route_tree=True) as client:
+        client.get("/users/items/10")
+
+        include = next(route for route in client.app.router.routes if isinstance(route, Include))
+        assert isinstance(include._base_app, IncludeRouter)
+        assert include._base_app.enable_route_tree is True
+        assert include._base_app.route_tree is not None
+
+
+def test_route_tree_rebuilt_on_new_routes(test_client_factory):
+    with create_client(routes=[Gateway("/", handler=home)], enable_route_tree=True) as client:
+        assert client.get("/home").status_code == 404
+
+        client.app.add_route("/home", handler=get()(home.fn))
+        assert client.get("/home").json() == "home"
+
+
+def test_route_tree_search_keeps_order():
+    router = Router(
+        routes=[
+            Gateway("/users/{username}", handler=user),
+            Gateway("/users/me", handler=user_me),
+            Gateway("/items/{item_id:int}", handler=item),
+            Gateway("/files/{path:path}", handler=files),
+            Mount("/static", routes=[]),
+        ]
+    )
+    tree = RouteTree(router.routes)
+    paths = [route.path for route in router.routes]
+
+    assert [route.path for route in tree.search("/users/me")] == [
+        "/users/{username}",
+        "/users/me",
+    ]
+    assert [route.path for route in tree.search("/items/1")] == ["/items/{item_id:int}"]
+    assert list(tree.search("/items/one")) == []
+    assert [route.path for route in tree.search("/files/a/b")] == ["/files/{path:path}"]
+    assert [route.path for route in tree.search("/static/css/app.css")] == ["/static"]
+    assert [route.path for route in tree.search("no-slash")] == paths
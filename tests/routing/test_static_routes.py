@@ -0,0 +1,102 @@
+from esmerald import (
+    ChildEsmerald,
+    Gateway,
+    Include,
+    WebSocket,
+    WebSocketGateway,
+    get,
+    post,
+    websocket,
+)
+from esmerald.routing.router import Router
+from esmerald.routing.tree import get_static_routes
+from esmerald.testclient import create_client
+
+
+@get()
+async def health() -> str:
+    return "ok"
+
+
+@get()
+async def user(username: str) -> str:
+    return f"user {username}"
+
+
+@get()
+async def user_me() -> str:
+    return "me"
+
+
+@get()
+async def read_items() -> str:
+    return "read"
+
+
+@post()
+async def create_items() -> str:
+    return "created"
+
+
+@websocket()
+async def socket_handler(socket: WebSocket) -> None:
+    await socket.accept()
+    await socket.send_json({"data": "esmerald"})
+    await socket.close()
+
+
+def test_static_routes_map():
+    router = Router(
+        routes=[
+            Gateway("/health", handler=health),
+            Gateway("/users/{username}", handler=user),
+            Gateway("/users/me", handler=user_me),
+            WebSocketGateway("/health", handler=socket_handler),
+        ]
+    )
+    static_routes = get_static_routes(router.routes)
+
+    assert static_routes[("/health", "http")].handler is health
+    assert static_routes[("/health", "websocket")].handler is socket_handler
+    # Shadowed by the parameterised route declared before.
+    assert ("/users/me", "http") not in static_routes
+
+
+def test_static_routes_dispatch(test_client_factory):
+    routes = [
+        Gateway("/health", handler=health),
+        Gateway("/users/{username}", handler=user),
+        Gateway("/users/me", handler=user_me),
+        Gateway("/items", handler=read_items),
+        Gateway("/items", handler=create_items),
+        WebSocketGateway("/ws", handler=socket_handler),
+    ]
+
+    with create_client(routes=routes) as client:
+        assert ("/health", "http") in client.app.router.static_routes
+
+        assert client.get("/health").json() == "ok"
+        assert client.get("/users/me").json() == "user me"
+        assert client.get("/items").json() == "read"
+        assert client.post("/items").json() == "created"
+        assert client.put("/health").status_code == 405
+
+        with client.websocket_connect("/ws") as session:
+            assert session.receive_json() == {"data": "esmerald"}
+
+
+def test_static_routes_rebuilt_on_changes(test_client_factory):
+    with create_client(routes=[Gateway("/health", handler=health)]) as client:
+        app = client.app
+
+        app.add_route("/ready", handler=get()(health.fn))
+        assert ("/ready", "http") in app.router.static_routes
+        assert client.get("/ready").json() == "ok"
+
+        app.add_include(Include("/api", routes=[Gateway("/items", handler=read_items)]))
+        assert ("/api", "http") not in app.router.static_routes
+        assert client.get("/api/items").json() == "read"
+
+        child = ChildEsmerald(routes=[Gateway("/items", handler=create_items)])
+        app.add_child_esmerald("/child", child)
+        assert client.post("/child/items").json() == "created"
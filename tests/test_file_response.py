@@ -0,0 +1,202 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from esmerald import Gateway, get
+from esmerald.datastructures import File
+from esmerald.middleware.compression import CompressionMiddleware
+from esmerald.responses import FileResponse
+from esmerald.responses.base import FileResponse as BaseFileResponse
+from esmerald.responses.file import parse_range_header
+from esmerald.testclient import create_client
+
+CONTENT = b"esmerald" * 1000
+
+
+@pytest.fixture
+def file_path(tmp_path: Path) -> Path:
+    path = tmp_path / "file.txt"
+    path.write_bytes(CONTENT)
+    return path
+
+
+async def send_response(response: FileResponse, **scope: Any) -> List[Dict[str, Any]]:
+    messages: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:  # pragma: no cover
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    await response({"type": "http", "method": "GET", "headers": [], **scope}, receive, send)
+    return messages
+
+
+@pytest.mark.asyncio()
+async def test_pathsend(file_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(file_path.parent)
+    response = FileResponse("file.txt", zero_copy=True)
+
+    messages = await send_response(response, extensions={"http.response.pathsend": {}})
+
+    assert messages[0]["type"] == "http.response.start"
+    assert (b"content-length", str(len(CONTENT)).encode()) in messages[0]["headers"]
+    assert messages[1] == {"type": "http.response.pathsend", "path": str(file_path)}
+
+
+@pytest.mark.asyncio()
+async def test_memory_mapped_chunks(file_path: Path) -> None:
+    response = FileResponse(file_path, zero_copy=True)
+    response.mmap_chunk_size = 3000
+
+    messages = await send_response(response)
+
+    assert [len(message["body"]) for message in messages[1:]] == [3000, 3000, 2000]
+    assert [message["more_body"] for message in messages[1:]] == [True, True, False]
+    assert b"".join(message["body"] for message in messages[1:]) == CONTENT
+
+
+@pytest.mark.asyncio()
+async def test_empty_file_and_head(tmp_path: Path, file_path: Path) -> None:
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+
+    messages = await send_response(FileResponse(empty, zero_copy=True))
+    assert messages[1] == {"type": "http.response.body", "body": b"", "more_body": False}
+
+    messages = await send_response(
+        FileResponse(file_path, zero_copy=True, method="HEAD"),
+        extensions={"http.response.pathsend": {}},
+    )
+    assert messages[1] == {"type": "http.response.body", "body": b"", "more_body": False}
+
+
+@pytest.mark.asyncio()
+async def test_compression_middleware_forwards_pathsend(file_path: Path) -> None:
+    messages: List[Dict[str, Any]] = []
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    middleware = CompressionMiddleware(FileResponse(file_path, zero_copy=True))
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "extensions": {"http.response.pathsend": {}},
+    }
+    await middleware(scope, None, send)
+
+    assert [message["type"] for message in messages] == [
+        "http.response.start",
+        "http.response.pathsend",
+    ]
+
+
+def test_file_container_zero_copy(file_path: Path) -> None:
+    @get("/download")
+    async def download() -> File:
+        return File(path=file_path, filename="file.txt", zero_copy=True)
+
+    with create_client(routes=[Gateway(handler=download)]) as client:
+        response = client.get("/download")
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers["content-disposition"] == 'attachment; filename="file.txt"'
+
+
+@pytest.mark.parametrize(
+    "value,ranges",
+    [
+        ("bytes=0-99", [(0, 100)]),
+        ("bytes=7990-", [(7990, 8000)]),
+        ("bytes=-10", [(7990, 8000)]),
+        ("bytes=-9000", [(0, 8000)]),
+        ("bytes=7990-9000", [(7990, 8000)]),
+        ("bytes=0-9, 5-19, 100-109", [(0, 20), (100, 110)]),
+        ("bytes=8000-", []),
+        ("bytes=-0", []),
+        ("bytes=10-5", None),
+        ("bytes=a-b", None),
+        ("items=0-9", None),
+        ("bytes=" + ",".join(["0-1"] * 17), None),
+    ],
+)
+def test_parse_range_header(value: str, ranges: Any) -> None:
+    assert parse_range_header(value, 8000) == ranges
+
+
+def test_single_range(file_path: Path) -> None:
+    @get("/download")
+    async def download() -> File:
+        return File(path=file_path, filename="file.txt")
+
+    with create_client(routes=[Gateway(handler=download)]) as client:
+        response = client.get("/download", headers={"range": "bytes=8-15"})
+
+        assert response.status_code == 206
+        assert response.content == CONTENT[8:16]
+        assert response.headers["content-range"] == f"bytes 8-15/{len(CONTENT)}"
+        assert response.headers["content-length"] == "8"
+
+        response = client.get("/download", headers={"range": f"bytes={len(CONTENT)}-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+
+def test_if_range(file_path: Path) -> None:
+    @get("/download")
+    async def download() -> File:
+        return File(path=file_path, filename="file.txt")
+
+    with create_client(routes=[Gateway(handler=download)]) as client:
+        response = client.get("/download")
+        etag = response.headers["etag"]
+        last_modified = response.headers["last-modified"]
+
+        for if_range in (f'"{etag}"', last_modified):
+            response = client.get(
+                "/download", headers={"range": "bytes=0-3", "if-range": if_range}
+            )
+            assert response.status_code == 206
+
+        for if_range in ('"other"', f'W/"{etag}"', "Wed, 21 Oct 2015 07:28:00 GMT"):
+            response = client.get(
+                "/download", headers={"range": "bytes=0-3", "if-range": if_range}
+            )
+            assert response.status_code == 200
+            assert response.content == CONTENT
+
+
+def test_multipart_ranges(file_path: Path) -> None:
+    @get("/download")
+    async def download() -> File:
+        return File(path=file_path, filename="file.txt", zero_copy=True)
+
+    with create_client(routes=[Gateway(handler=download)]) as client:
+        response = client.get("/download", headers={"range": "bytes=0-3, 16-23"})
+
+    content_type = response.headers["content-type"]
+    boundary = content_type.split("boundary=")[1]
+    size = len(CONTENT)
+
+    assert response.status_code == 206
+    assert content_type.startswith("multipart/byteranges")
+    assert int(response.headers["content-length"]) == len(response.content)
+    assert (
+        response.content
+        == (
+            f"--{boundary}\r\nContent-Type: text/plain; charset=utf-8\r\n"
+            f"Content-Range: bytes 0-3/{size}\r\n\r\nesme\r\n"
+            f"--{boundary}\r\nContent-Type: text/plain; charset=utf-8\r\n"
+            f"Content-Range: bytes 16-23/{size}\r\n\r\nesmerald\r\n"
+            f"--{boundary}--\r\n"
+        ).encode()
+    )
+
+
+def test_file_response_importable_from_base() -> None:
+    assert BaseFileResponse is FileResponse
@@ -1,6 +1,7 @@
 from functools import partial
 from typing import Any
 
+import anyio
 import pytest
 
 from esmerald.injector import Factory, Inject
@@ -193,3 +194,103 @@ async def test_if_DAO_is_injectable(get_fake_dao) -> None:
     assert obj.conn == "nice_conn"
 
     assert injectable1 != injectable2
+
+
+@pytest.mark.asyncio()
+async def test_Inject_cache_keyed_on_kwargs() -> None:
+    calls = []
+
+    def get_tenant(name: str) -> str:
+        calls.append(name)
+        return f"tenant {name}"
+
+    injector = Inject(dependency=get_tenant, cache_maxsize=2)
+
+    assert await injector(name="a") == "tenant a"
+    assert await injector(name="a") == "tenant a"
+    assert await injector(name="b") == "tenant b"
+    assert calls == ["a", "b"]
+
+    assert await injector(name="c") == "tenant c"
+    assert await injector(name="a") == "tenant a"
+    assert calls == ["a", "b", "c", "a"]
+
+    injector.invalidate(name="a")
+    assert await injector(name="a") == "tenant a"
+    assert calls == ["a", "b", "c", "a", "a"]
+
+    injector.clear_cache()
+    assert await injector(name="c") == "tenant c"
+    assert calls == ["a", "b", "c", "a", "a", "c"]
+
+
+@pytest.mark.asyncio()
+async def test_Inject_cache_ttl(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("esmerald.core.di.cache.monotonic", lambda: now[0])
+    calls = []
+
+    def get_settings() -> dict:
+        calls.append(1)
+        return {"debug": True}
+
+    injector = Inject(dependency=get_settings, cache_ttl=10)
+
+    await injector()
+    now[0] = 109.0
+    await injector()
+    assert len(calls) == 1
+
+    now[0] = 110.0
+    await injector()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio()
+async def test_Inject_cache_concurrent_misses_share_one_call() -> None:
+    calls = []
+
+    async def get_client() -> object:
+        calls.append(1)
+        await anyio.sleep(0.01)
+        return object()
+
+    injector = Inject(dependency=get_client, cache_ttl=60)
+    results = []
+
+    async def resolve() -> None:
+        results.append(await injector())
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(5):
+            task_group.start_soon(resolve)
+
+    assert len(calls) == 1
+    assert len({id(result) for result in results}) == 1
+
+
+@pytest.mark.asyncio()
+async def test_Inject_cache_errors_are_not_cached() -> None:
+    calls = []
+
+    def failing() -> None:
+        calls.append(1)
+        raise ValueError()
+
+    injector = Inject(dependency=failing, cache_ttl=60)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await injector()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio()
+async def test_Factory_cache() -> None:
+    factory = Factory(Test, cache_ttl=60)
+
+    first = await factory()
+    assert await factory() is first
+
+    factory.invalidate()
+    assert await factory() is not first
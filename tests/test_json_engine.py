@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import msgspec
+import pytest
+from pydantic import BaseModel
+
+from esmerald import Gateway, Request, get, post
+from esmerald.encoders import (
+    ENCODERS,
+    JSONEngine,
+    MsgspecJSONEngine,
+    OrjsonJSONEngine,
+    StdlibJSONEngine,
+    get_json_engine,
+    register_encoder,
+)
+from esmerald.exceptions import ImproperlyConfigured, NotFound
+from esmerald.testclient import create_client
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class User(BaseModel):
+    name: str
+
+
+class Address(msgspec.Struct):
+    street: str
+
+
+@dataclass
+class Item:
+    sku: str
+
+
+class Money:
+    def __init__(self, amount: int, currency: str) -> None:
+        self.amount = amount
+        self.currency = currency
+
+
+@get("/values")
+async def values() -> Any:
+    return {
+        "created_at": datetime(2024, 1, 1, 10, 30),
+        "price": Decimal("9.99"),
+        "id": UUID("00000000-0000-0000-0000-000000000001"),
+        "color": Color.RED,
+        "user": User(name="esmerald"),
+        "address": Address(street="Main"),
+        "item": Item(sku="sku"),
+    }
+
+
+@get("/money")
+async def money() -> Any:
+    return {"total": Money(10, "EUR")}
+
+
+@get("/keys")
+async def keys() -> dict:
+    return {1: "a", "big": 2**70}
+
+
+@get("/missing")
+async def missing() -> Any:
+    raise NotFound()
+
+
+@post("/echo")
+async def echo(request: Request) -> Any:
+    return await request.json()
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson", "msgspec"])
+def test_json_engines(engine: str) -> None:
+    with create_client(
+        routes=[Gateway(handler=values), Gateway(handler=missing), Gateway(handler=echo)],
+        json_engine=engine,
+        enable_openapi=True,
+    ) as client:
+        assert client.app.json_engine.name == engine
+
+        response = client.get("/values")
+        assert response.json() == {
+            "created_at": "2024-01-01T10:30:00",
+            "price": "9.99",
+            "id": "00000000-0000-0000-0000-000000000001",
+            "color": "red",
+            "user": {"name": "esmerald"},
+            "address": {"street": "Main"},
+            "item": {"sku": "sku"},
+        }
+
+        response = client.get("/missing")
+        assert response.status_code == 404
+        assert response.json()["detail"] == "The resource cannot be found."
+
+        response = client.post("/echo", json={"name": "esmerald"})
+        assert response.json() == {"name": "esmerald"}
+
+        response = client.get("/openapi.json")
+        assert response.json()["paths"]["/values"]
+
+
+def test_register_encoder() -> None:
+    register_encoder(Money, lambda value: f"{value.amount} {value.currency}")
+    try:
+        for engine in ("json", "orjson", "msgspec"):
+            with create_client(routes=[Gateway(handler=money)], json_engine=engine) as client:
+                assert client.get("/money").json() == {"total": "10 EUR"}
+    finally:
+        ENCODERS.pop(Money)
+
+
+def test_orjson_engine_non_str_keys_and_big_ints() -> None:
+    engine = OrjsonJSONEngine()
+    assert engine.dumps({1: "a"}) == b'{"1":"a"}'
+    assert engine.dumps({"v": 2**70}) == b'{"v":1180591620717411303424}'
+    assert engine.dumps({1: 2**70}) == b'{"1":1180591620717411303424}'
+
+    with create_client(routes=[Gateway(handler=keys)]) as client:
+        response = client.get("/keys")
+        assert response.status_code == 200
+        assert response.json() == {"1": "a", "big": 2**70}
+
+
+def test_get_json_engine() -> None:
+    assert isinstance(get_json_engine(), OrjsonJSONEngine)
+    assert isinstance(get_json_engine("json"), StdlibJSONEngine)
+    assert isinstance(get_json_engine("orjson"), OrjsonJSONEngine)
+    assert isinstance(get_json_engine("msgspec"), MsgspecJSONEngine)
+
+    engine = MsgspecJSONEngine()
+    assert get_json_engine(engine) is engine
+
+    with pytest.raises(ImproperlyConfigured):
+        get_json_engine("simplejson")
+
+
+def test_custom_json_engine() -> None:
+    class UpperJSONEngine(StdlibJSONEngine):
+        def dumps(self, content: Any, **kwargs: Any) -> bytes:
+            return super().dumps(content, **kwargs).upper()
+
+    assert isinstance(UpperJSONEngine(), JSONEngine)
+
+    with create_client(routes=[Gateway(handler=values)], json_engine=UpperJSONEngine()) as client:
+        assert client.get("/values").json()["COLOR"] == "RED"
@@ -0,0 +1,114 @@
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, List
+
+import msgspec
+import pytest
+from pydantic import BaseModel
+
+from esmerald import Gateway, JSONStream, get
+from esmerald.routing.apis.generics import ListAPIView
+from esmerald.testclient import create_client
+
+
+class User(BaseModel):
+    id: int
+
+
+class Address(msgspec.Struct):
+    id: int
+
+
+@dataclass
+class Item:
+    id: int
+
+
+async def generate_users(total: int) -> AsyncIterator[User]:
+    for index in range(total):
+        yield User(id=index)
+
+
+def generate_mixed() -> Iterator[object]:
+    yield User(id=0)
+    yield Address(id=1)
+    yield Item(id=2)
+    yield {"id": 3}
+
+
+@get("/ndjson")
+async def ndjson() -> JSONStream:
+    return JSONStream(iterator=generate_users(3))
+
+
+@get("/array")
+async def array() -> JSONStream:
+    return JSONStream(iterator=generate_mixed, format="array")
+
+
+@get("/empty")
+async def empty() -> JSONStream:
+    return JSONStream(iterator=[], format="array")
+
+
+def test_json_stream_ndjson() -> None:
+    with create_client(routes=[Gateway(handler=ndjson)]) as client:
+        response = client.get("/ndjson")
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"id": 0},
+            {"id": 1},
+            {"id": 2},
+        ]
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson", "msgspec"])
+def test_json_stream_array(engine: str) -> None:
+    with create_client(
+        routes=[Gateway(handler=array), Gateway(handler=empty)], json_engine=engine
+    ) as client:
+        response = client.get("/array")
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [{"id": 0}, {"id": 1}, {"id": 2}, {"id": 3}]
+
+        assert client.get("/empty").json() == []
+
+
+@pytest.mark.asyncio()
+async def test_json_stream_sends_each_item_by_default() -> None:
+    stream = JSONStream(iterator=generate_users(2), format="array")
+
+    assert [chunk.decode() async for chunk in stream.encode()] == ['[{"id":0}', ',{"id":1}', "]"]
+
+
+@pytest.mark.parametrize(
+    "flush_items,flush_bytes,chunks",
+    [
+        (None, None, ['[{"id":0}', ',{"id":1}', ',{"id":2}', ',{"id":3}', ',{"id":4}', "]"]),
+        (2, None, ['[{"id":0},{"id":1}', ',{"id":2},{"id":3}', ',{"id":4}]']),
+        (None, 20, ['[{"id":0},{"id":1},{"id":2}', ',{"id":3},{"id":4}]']),
+        (None, 1000, ['[{"id":0},{"id":1},{"id":2},{"id":3},{"id":4}]']),
+    ],
+)
+@pytest.mark.asyncio()
+async def test_json_stream_chunks(flush_items, flush_bytes, chunks: List[str]) -> None:
+    stream = JSONStream(
+        iterator=generate_users(5),
+        format="array",
+        flush_items=flush_items,
+        flush_bytes=flush_bytes,
+    )
+
+    assert [chunk.decode() async for chunk in stream.encode()] == chunks
+
+
+def test_json_stream_list_api_view() -> None:
+    class UserListAPIView(ListAPIView):
+        @get("/")
+        async def get(self) -> JSONStream:
+            return JSONStream(iterator=generate_users(2), format="array")
+
+    with create_client(routes=[Gateway(handler=UserListAPIView)]) as client:
+        assert client.get("/").json() == [{"id": 0}, {"id": 1}]
@@ -1,3 +1,5 @@
+import gzip
+import json
 import os
 import pathlib
 from typing import Any
@@ -10,6 +12,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from esmerald.config import StaticFilesConfig
 from esmerald.requests import Request
 from esmerald.routing.router import Include
+from esmerald.staticfiles import HASHED_FILENAME_PATTERN, StaticManifest
 from esmerald.testclient import create_client
 
 
@@ -23,6 +26,123 @@ def test_staticfiles(tmpdir: str) -> None:
         assert response.text == "content"
 
 
+def test_staticfiles_range(tmpdir: str) -> None:
+    path = tmpdir.join("test.txt")
+    path.write("0123456789")
+    static_files_config = StaticFilesConfig(path="/static", directory=tmpdir)
+    with create_client([], static_files_config=static_files_config) as client:
+        response = client.get("/static/test.txt")
+        assert response.headers["accept-ranges"] == "bytes"
+
+        response = client.get("/static/test.txt", headers={"range": "bytes=2-4"})
+        assert response.status_code == 206
+        assert response.headers["content-range"] == "bytes 2-4/10"
+        assert response.text == "234"
+
+
+def test_staticfiles_precompressed(tmpdir: Any) -> None:
+    tmpdir.join("app.js").write("console.log('app');" * 10)
+    tmpdir.join("app.js.gz").write_binary(gzip.compress(b"console.log('app');" * 10))
+    static_files_config = StaticFilesConfig(path="/static", directory=tmpdir, precompressed=True)
+    with create_client([], static_files_config=static_files_config) as client:
+        response = client.get("/static/app.js", headers={"accept-encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == "console.log('app');" * 10
+        gzip_etag = response.headers["etag"]
+
+        response = client.get("/static/app.js", headers={"accept-encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] != gzip_etag
+        assert response.text == "console.log('app');" * 10
+
+        response = client.get(
+            "/static/app.js", headers={"accept-encoding": "gzip", "if-none-match": gzip_etag}
+        )
+        assert response.status_code == 304
+
+        response = client.get(
+            "/static/app.js", headers={"accept-encoding": "gzip", "range": "bytes=0-6"}
+        )
+        assert response.status_code == 206
+        assert "content-encoding" not in response.headers
+        assert response.text == "console"
+
+
+def test_staticfiles_memory_cache(tmpdir: Any) -> None:
+    path = tmpdir.join("small.txt")
+    path.write("small")
+    tmpdir.join("large.txt").write("x" * 100)
+    static_files_config = StaticFilesConfig(
+        path="/static", directory=tmpdir, cache_maxsize=1, cache_max_file_size=10
+    )
+    app = static_files_config.to_app()
+    with create_client([Include("/static", app=app)]) as client:
+        response = client.get("/static/small.txt")
+        assert response.status_code == 200
+        assert response.text == "small"
+        assert response.headers["content-length"] == "5"
+        assert list(app.cache) == [str(path)]
+
+        response = client.head("/static/small.txt")
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "5"
+        assert response.content == b""
+
+        response = client.get("/static/large.txt")
+        assert response.text == "x" * 100
+        assert list(app.cache) == [str(path)]
+
+        tmpdir.join("new.txt").write("new")
+        response = client.get("/static/new.txt")
+        assert response.status_code == 200
+        assert response.text == "new"
+        assert "new.txt" not in app.index
+
+        app.refresh()
+        assert "new.txt" in app.index
+        assert not app.cache
+
+        response = client.post("/static/small.txt")
+        assert response.status_code == 405
+
+
+def test_staticfiles_immutable(tmpdir: Any) -> None:
+    tmpdir.join("app.3f2a9c1b.js").write("app")
+    tmpdir.join("app.js").write("app")
+    for scan in (False, True):
+        static_files_config = StaticFilesConfig(
+            path="/static", directory=tmpdir, scan=scan, immutable_pattern=HASHED_FILENAME_PATTERN
+        )
+        with create_client([], static_files_config=static_files_config) as client:
+            response = client.get("/static/app.3f2a9c1b.js")
+            assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+            response = client.get("/static/app.js")
+            assert "cache-control" not in response.headers
+
+
+def test_static_manifest(tmpdir: Any) -> None:
+    tmpdir.mkdir("css").join("site.0123abcd.css").write("")
+    tmpdir.join("app.3f2a9c1b.js").write("")
+
+    manifest = StaticManifest(path="/static/", directory=tmpdir)
+    assert manifest.url("app.js") == "/static/app.3f2a9c1b.js"
+    assert manifest["css/site.css"] == "/static/css/site.0123abcd.css"
+    assert manifest.url("missing.js") == "/static/missing.js"
+    assert "app.js" in manifest
+    assert len(manifest) == 2
+
+    path = tmpdir.join("manifest.json")
+    path.write(
+        json.dumps({"app.js": "app.3f2a9c1b.js", "main.ts": {"file": "assets/main.4b1c.js"}})
+    )
+    manifest = StaticManifest(path="/assets", manifest=str(path))
+    assert manifest.url("app.js") == "/assets/app.3f2a9c1b.js"
+    assert manifest.url("main.ts") == "/assets/assets/main.4b1c.js"
+
+
 def test_staticfiles_starlette(tmpdir, test_client_factory):
     path = os.path.join(tmpdir, "example.txt")
     with open(path, "w") as file:
@@ -145,3 +265,28 @@ def test_static_substring_of_self(tmpdir: Any) -> None:
         response = client.get("/static/static_part/static/test.txt")
         assert response.status_code == 200
         assert response.text == "content"
+
+
+def test_staticfiles_scan_detects_changes(tmpdir: Any) -> None:
+    path = tmpdir.join("app.js")
+    path.write("before")
+    tmpdir.join("gone.js").write("gone")
+    static_files_config = StaticFilesConfig(
+        path="/static", directory=tmpdir, scan=True, cache_maxsize=10
+    )
+    app = static_files_config.to_app()
+    with create_client([Include("/static", app=app)]) as client:
+        assert client.get("/static/app.js").text == "before"
+        assert client.get("/static/gone.js").text == "gone"
+
+        path.write("after, and a bit longer")
+        os.remove(str(tmpdir.join("gone.js")))
+
+        response = client.get("/static/app.js")
+        assert response.status_code == 200
+        assert response.headers["content-length"] == str(len("after, and a bit longer"))
+        assert response.text == "after, and a bit longer"
+
+        response = client.get("/static/gone.js")
+        assert response.status_code == 404
+        assert "gone.js" not in app.index
@@ -2,6 +2,7 @@ import os
 import pathlib
 
 import pytest
+from jinja2 import TemplateSyntaxError
 
 from esmerald.applications import Esmerald
 from esmerald.config.template import TemplateConfig
@@ -9,6 +10,7 @@ from esmerald.datastructures import Template
 from esmerald.requests import Request
 from esmerald.routing.gateways import Gateway
 from esmerald.routing.handlers import get
+from esmerald.template.cache import FragmentCache
 from esmerald.template.jinja import JinjaTemplateEngine
 from esmerald.template.mako import MakoTemplateEngine
 from esmerald.testclient import EsmeraldTestClient, create_client
@@ -85,3 +87,152 @@ def test_alternative_template(template_dir, test_client_factory):
     client = EsmeraldTestClient(app)
     response = client.get("/")
     assert response.text == "<html>Hello, <a href='http://testserver/'>world</a></html>"
+
+
+def test_streaming_template(template_dir, test_client_factory):
+    path = os.path.join(template_dir, "list.html")
+    with open(path, "w") as file:
+        file.write("<ul>{% for item in items %}<li>{{ item }}</li>{% endfor %}</ul>")
+
+    @get()
+    async def homepage(request: Request) -> Template:
+        return Template(
+            name="list.html", context={"request": request, "items": [1, 2, 3]}, stream=True
+        )
+
+    app = Esmerald(
+        routes=[Gateway("/", handler=homepage)],
+        template_config=TemplateConfig(directory=template_dir),
+    )
+    client = EsmeraldTestClient(app)
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.text == "<ul><li>1</li><li>2</li><li>3</li></ul>"
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert "content-length" not in response.headers
+    assert app.template_engine.async_env.is_async
+    assert not app.template_engine.env.is_async
+
+
+def test_streaming_template_mako(template_dir, test_client_factory):
+    path = os.path.join(template_dir, "index.html")
+    with open(path, "w") as file:
+        file.write("<p>${name}</p>")
+
+    @get()
+    async def homepage() -> Template:
+        return Template(name="index.html", context={"name": "esmerald"}, stream=True)
+
+    app = Esmerald(
+        routes=[Gateway("/", handler=homepage)],
+        template_config=TemplateConfig(directory=template_dir, engine=MakoTemplateEngine),
+    )
+    client = EsmeraldTestClient(app)
+    response = client.get("/")
+    assert response.text == "<p>esmerald</p>"
+
+
+@pytest.mark.parametrize("bytecode_cache", ["memory", "cache"])
+def test_jinja_bytecode_cache(bytecode_cache, template_dir, tmp_path) -> None:
+    with open(os.path.join(template_dir, "index.html"), "w") as file:
+        file.write("<p>{{ name }}</p>")
+    with open(os.path.join(template_dir, "broken.html"), "w") as file:
+        file.write("{% if %}")
+
+    if bytecode_cache == "cache":
+        bytecode_cache = tmp_path / "cache"
+    app = Esmerald(
+        routes=[],
+        template_config=TemplateConfig(directory=template_dir, bytecode_cache=bytecode_cache),
+    )
+    engine = app.template_engine
+    assert engine.env.bytecode_cache is not None
+
+    with pytest.raises(TemplateSyntaxError):
+        engine.precompile()
+    assert engine.precompile(ignore_errors=True) == ["index.html"]
+
+    if isinstance(bytecode_cache, pathlib.Path):
+        assert len(os.listdir(bytecode_cache)) == 2
+    else:
+        assert len(engine.env.bytecode_cache.buckets) == 1
+        assert len(engine.async_env.bytecode_cache.buckets) == 1
+
+    other = JinjaTemplateEngine(template_dir, bytecode_cache=engine.env.bytecode_cache)
+    assert other.get_template("index.html").render(name="cached") == "<p>cached</p>"
+
+
+def test_mako_bytecode_cache(template_dir, tmp_path) -> None:
+    with open(os.path.join(template_dir, "index.html"), "w") as file:
+        file.write("<p>${name}</p>")
+
+    engine = MakoTemplateEngine(template_dir, bytecode_cache=tmp_path / "modules")
+    assert engine.precompile(extensions=["html"]) == ["index.html"]
+    assert os.listdir(tmp_path / "modules")
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_jinja_fragment_cache(stream, template_dir, test_client_factory):
+    with open(os.path.join(template_dir, "menu.html"), "w") as file:
+        file.write(
+            "{% cache ['menu', user], 60 %}<b>{{ user }} {{ calls.append(1) or calls|length }}"
+            "</b>{% endcache %}|{{ user }}"
+        )
+    calls = []
+
+    @get("/{user}")
+    async def menu(user: str) -> Template:
+        return Template(name="menu.html", context={"user": user, "calls": calls}, stream=stream)
+
+    fragment_cache = FragmentCache()
+    app = Esmerald(
+        routes=[Gateway(handler=menu)],
+        template_config=TemplateConfig(directory=template_dir, fragment_cache=fragment_cache),
+    )
+    client = EsmeraldTestClient(app)
+    assert client.get("/one").text == "<b>one 1</b>|one"
+    assert client.get("/one").text == "<b>one 1</b>|one"
+    assert client.get("/two").text == "<b>two 2</b>|two"
+    assert len(fragment_cache) == 2
+
+    fragment_cache.clear()
+    assert client.get("/one").text == "<b>one 3</b>|one"
+
+
+def test_fragment_cache_ttl(monkeypatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("esmerald.template.cache.monotonic", lambda: now)
+    cache = FragmentCache(maxsize=2, ttl=10)
+    cache.set("a", "A")
+    cache.set("b", "B", ttl=100)
+    assert cache.get("a") == "A"
+    cache.set("c", "C")
+    assert cache.get("b") is None
+    now = 150.0
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert len(cache) == 0
+
+
+def test_mako_fragment_cache(template_dir, test_client_factory):
+    with open(os.path.join(template_dir, "menu.html"), "w") as file:
+        file.write(
+            '<%block name="menu" cached="True" cache_key="${user}" cache_timeout="60">'
+            "<b>${user} ${calls.append(1) or len(calls)}</b></%block>|${user}"
+        )
+    calls = []
+
+    @get("/{user}")
+    async def menu(user: str) -> Template:
+        return Template(name="menu.html", context={"user": user, "calls": calls})
+
+    app = Esmerald(
+        routes=[Gateway(handler=menu)],
+        template_config=TemplateConfig(
+            directory=template_dir, engine=MakoTemplateEngine, fragment_cache=True
+        ),
+    )
+    client = EsmeraldTestClient(app)
+    assert client.get("/one").text == "<b>one 1</b>|one"
+    assert client.get("/one").text == "<b>one 1</b>|one"
+    assert client.get("/two").text == "<b>two 2</b>|two"
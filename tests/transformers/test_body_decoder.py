@@ -0,0 +1,124 @@
+from typing import List, Union
+
+import msgspec
+from pydantic import BaseModel
+
+from esmerald import Gateway, Inject, Injects, post
+from esmerald.testclient import create_client
+
+
+class Item(BaseModel):
+    name: str
+    quantity: int
+
+
+class ItemStruct(msgspec.Struct):
+    name: str
+    quantity: int
+
+
+@post("/item")
+async def create_item(data: Item) -> dict:
+    assert isinstance(data, Item)
+    return data.model_dump()
+
+
+@post("/items")
+async def create_items(payload: List[Item]) -> int:
+    return sum(item.quantity for item in payload)
+
+
+@post("/struct")
+async def create_struct(data: ItemStruct) -> dict:
+    assert isinstance(data, ItemStruct)
+    return {"name": data.name, "quantity": data.quantity}
+
+
+class Coupon:
+    def __init__(self, code: str) -> None:
+        self.code = code
+
+
+@post("/structs")
+async def create_structs(data: List[ItemStruct]) -> int:
+    return len(data)
+
+
+@post("/coupon")
+async def create_coupon(data: Union[Coupon, dict]) -> dict:
+    return data
+
+
+def get_names(data: List[Item]) -> List[str]:
+    return [item.name for item in data]
+
+
+@post("/names", dependencies={"names": Inject(get_names)})
+async def create_names(data: List[Item], names: List[str] = Injects()) -> List[str]:
+    return names
+
+
+def test_body_decoder_pydantic() -> None:
+    with create_client(
+        routes=[Gateway(handler=create_item), Gateway(handler=create_items)]
+    ) as client:
+        assert create_item.transformer.body_decoder is not None
+
+        response = client.post("/item", json={"name": "esmerald", "quantity": 1})
+        assert response.status_code == 201
+        assert response.json() == {"name": "esmerald", "quantity": 1}
+
+        response = client.post(
+            "/items", json=[{"name": "a", "quantity": 1}, {"name": "b", "quantity": 2}]
+        )
+        assert response.status_code == 201
+        assert response.json() == 3
+
+
+def test_body_decoder_pydantic_errors() -> None:
+    with create_client(routes=[Gateway(handler=create_item)]) as client:
+        response = client.post("/item", json={"name": "esmerald", "quantity": "one"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == (
+            "Validation failed for http://testserver/item with method POST."
+        )
+        assert response.json()["errors"][0]["loc"] == ["data", "quantity"]
+
+        response = client.post("/item", content=b"{")
+        assert response.status_code == 400
+
+
+def test_body_decoder_msgspec() -> None:
+    with create_client(routes=[Gateway(handler=create_struct)]) as client:
+        response = client.post("/struct", json={"name": "esmerald", "quantity": 1})
+        assert response.status_code == 201
+        assert response.json() == {"name": "esmerald", "quantity": 1}
+
+        response = client.post("/struct", json={"name": "esmerald", "quantity": "one"})
+        assert response.status_code == 400
+        assert response.json()["errors"] == [{"quantity": "Expected `int`, got `str`"}]
+
+
+def test_body_decoder_not_used_when_dependencies_use_the_body() -> None:
+    with create_client(routes=[Gateway(handler=create_names)]) as client:
+        assert create_names.transformer.body_decoder is None
+
+        response = client.post("/names", json=[{"name": "a", "quantity": 1}])
+        assert response.status_code == 201
+        assert response.json() == ["a"]
+
+
+def test_body_decoder_arbitrary_types() -> None:
+    with create_client(
+        routes=[Gateway(handler=create_structs), Gateway(handler=create_coupon)]
+    ) as client:
+        response = client.post("/structs", json=[{"name": "esmerald", "quantity": 1}])
+        assert response.status_code == 400
+
+        response = client.post("/coupon", json={"code": "esmerald"})
+        assert response.status_code == 201
+        assert response.json() == {"code": "esmerald"}
+
+        response = client.post("/coupon", json=["esmerald"])
+        assert response.status_code == 400
@@ -0,0 +1,113 @@
+import pytest
+
+from esmerald import Cookie, Gateway, Header, Param, Query, ValidationErrorException, get
+from esmerald.enums import ParamType
+from esmerald.requests import Request
+from esmerald.testclient import create_client
+from esmerald.transformers.model import ParamSetting, TransformerModel
+
+
+@get("/items/{item_id}")
+async def read_item(
+    item_id: int,
+    q: str,
+    limit: int = Query(default=10),
+    token: str = Header(value="X-Token"),
+    session: str = Cookie(value="session"),
+) -> dict:
+    return {"item_id": item_id, "q": q, "limit": limit, "token": token, "session": session}
+
+
+@get("/plain")
+async def plain() -> str:
+    return "plain"
+
+
+def create_param_setting(name: str, param_type: ParamType, is_required: bool) -> ParamSetting:
+    return ParamSetting(
+        default_value=None,
+        field_alias=name,
+        field_name=name,
+        is_required=is_required,
+        param_type=param_type,
+        field_info=Param(default=None),
+    )
+
+
+def test_param_plan() -> None:
+    with create_client(routes=[Gateway(handler=read_item), Gateway(handler=plain)]):
+        plan = dict(read_item.transformer.param_plan)
+
+        assert list(plan) == ["query_params", "path_params", "headers", "cookies"]
+        assert sorted(plan["query_params"]) == [
+            ("limit", "limit", 10, False),
+            ("q", "q", None, False),
+        ]
+        assert plan["path_params"] == (("item_id", "item_id", None, False),)
+        assert plan["headers"] == (("X-Token", "token", None, False),)
+        assert plan["cookies"] == (("session", "session", None, False),)
+
+        assert plain.transformer.param_plan == ()
+
+
+def test_param_plan_extraction() -> None:
+    with create_client(routes=[Gateway(handler=read_item)]) as client:
+        response = client.get(
+            "/items/1?q=esmerald", headers={"X-Token": "abc"}, cookies={"session": "yum"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "item_id": 1,
+            "q": "esmerald",
+            "limit": 10,
+            "token": "abc",
+            "session": "yum",
+        }
+
+
+def test_param_plan_missing_parameters() -> None:
+    transformer = TransformerModel(
+        cookies=set(),
+        dependencies=set(),
+        form_data=None,
+        headers={create_param_setting("x-token", ParamType.HEADER, True)},
+        path_params=set(),
+        query_params={
+            create_param_setting("q", ParamType.QUERY, True),
+            create_param_setting("limit", ParamType.QUERY, False),
+        },
+        reserved_kwargs=set(),
+        query_param_names=set(),
+        is_optional=False,
+    )
+
+    def get_request(query_string: bytes, headers: list) -> Request:
+        return Request(
+            {
+                "type": "http",
+                "method": "GET",
+                "scheme": "http",
+                "server": ("testserver", 80),
+                "path": "/items",
+                "query_string": query_string,
+                "headers": headers,
+            }
+        )
+
+    with pytest.raises(ValidationErrorException) as raised:
+        transformer.to_kwargs(connection=get_request(b"", [(b"x-token", b"abc")]))
+
+    assert raised.value.detail == (
+        "Missing required parameter(s) q for url http://testserver/items."
+    )
+
+    with pytest.raises(ValidationErrorException) as raised:
+        transformer.to_kwargs(connection=get_request(b"q=esmerald", []))
+
+    assert raised.value.detail == (
+        "Missing required parameter(s) x-token for url http://testserver/items?q=esmerald."
+    )
+
+    kwargs = transformer.to_kwargs(connection=get_request(b"q=esmerald", [(b"x-token", b"abc")]))
+    assert kwargs == {"q": "esmerald", "limit": None, "x-token": "abc"}